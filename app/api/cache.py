@@ -0,0 +1,138 @@
+"""
+Read-through response caches for per-student and analytics endpoints
+"""
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Optional, Type
+
+import orjson
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+# Seconds a cached response stays valid (0 disables caching)
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "30"))
+# Students kept in the in-process cache before the least recently used is evicted
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "1024"))
+# Seconds aggregate analytics stay cached (they are not invalidated by writes)
+ANALYTICS_CACHE_TTL = float(os.getenv("ANALYTICS_CACHE_TTL", "300"))
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Serialized response body with its validator"""
+    body: bytes
+    etag: str
+    media_type: str = JSON_MEDIA_TYPE
+
+    @classmethod
+    def from_body(cls, body: bytes, media_type: str = JSON_MEDIA_TYPE) -> "CachedResponse":
+        return cls(body=body, etag=f'"{hashlib.sha1(body).hexdigest()}"', media_type=media_type)
+
+
+class TTLLRUCache:
+    """
+    In-process cache of serialized responses grouped by key
+
+    Keys are student ids for the per-student endpoints. Entries for one key
+    (one per endpoint variant) live together, so a write invalidates all of
+    them with one pop. Least recently used keys are evicted once max_entries
+    is reached.
+
+    Any object with the same get/set/invalidate/clear methods can be passed to
+    ResponseCache instead, e.g. a shared backend when running several workers.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 30.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Dict[str, tuple]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, variant: str) -> Optional[CachedResponse]:
+        with self._lock:
+            variants = self._entries.get(key)
+            if variants is None or variant not in variants:
+                return None
+            expires_at, cached = variants[variant]
+            if expires_at <= time.monotonic():
+                del variants[variant]
+                if not variants:
+                    del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return cached
+
+    def set(self, key: Hashable, variant: str, cached: CachedResponse):
+        with self._lock:
+            variants = self._entries.setdefault(key, {})
+            variants[variant] = (time.monotonic() + self.ttl, cached)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+
+class ResponseCache:
+    """Serves GET responses from a cache backend with ETag revalidation"""
+
+    def __init__(self, backend=None, ttl: float = RESPONSE_CACHE_TTL,
+                 max_entries: int = RESPONSE_CACHE_MAX_ENTRIES):
+        self.enabled = ttl > 0
+        self.backend = backend or TTLLRUCache(max_entries=max_entries, ttl=ttl)
+
+    def respond(self, request: Request, key: Hashable, variant: str,
+                load: Callable[[], object], model: Optional[Type[BaseModel]] = None) -> Response:
+        """
+        Return the cached response for (key, variant), loading it on a miss
+
+        `load` only runs on a miss, so cache hits never query the database.
+        Its result is validated against `model`, or encoded as-is when no model
+        is given (e.g. projected dicts). Returns 304 when the client's
+        If-None-Match matches the current ETag.
+        """
+        cached = self.backend.get(key, variant) if self.enabled else None
+        if cached is None:
+            if model is not None:
+                body = model.model_validate(load()).model_dump_json().encode()
+            else:
+                body = orjson.dumps(load())
+            cached = CachedResponse.from_body(body)
+            if self.enabled:
+                self.backend.set(key, variant, cached)
+
+        headers = {"ETag": cached.etag, "Cache-Control": "no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), cached.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=cached.body, media_type=cached.media_type, headers=headers)
+
+    def invalidate(self, key: Hashable):
+        """Drop every cached response under `key` (a student id after a write)"""
+        self.backend.invalidate(key)
+
+    def clear(self):
+        self.backend.clear()
+
+
+response_cache = ResponseCache()
+analytics_cache = ResponseCache(ttl=ANALYTICS_CACHE_TTL, max_entries=64)
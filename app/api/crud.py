@@ -1,7 +1,8 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, insert, or_, select, text
+from sqlalchemy.orm import Session, load_only
 from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from ..models.schemas import (
     StudentCreate, StudentUpdate, StudentResponse,
@@ -9,7 +10,84 @@ from ..models.schemas import (
     EnvironmentalFactorsCreate, EnvironmentalFactorsUpdate, EnvironmentalFactorsResponse,
     CompleteStudentCreate, CompleteStudentResponse
 )
-from ..models.database_models import Student, AcademicRecord, EnvironmentalFactors
+from ..models.database_models import Student, AcademicRecord, EnvironmentalFactors, Prediction
+from ..database.connection import COMPLETE_STUDENT_BACKEND, DB_ENGINE
+
+# Upper bound on records returned by one batch read
+MAX_BATCH_SIZE = 1000
+
+def _response_columns(model, schema) -> list:
+    """Table columns backing the fields of a response schema, in schema order"""
+    return [getattr(model, name) for name in schema.model_fields]
+
+# Column lists for list/bulk reads that build response dicts straight from rows
+STUDENT_COLUMNS = _response_columns(Student, StudentResponse)
+ACADEMIC_COLUMNS = _response_columns(AcademicRecord, AcademicRecordResponse)
+ENVIRONMENTAL_COLUMNS = _response_columns(EnvironmentalFactors, EnvironmentalFactorsResponse)
+
+def _row_dict(columns, values) -> dict:
+    return {column.key: value for column, value in zip(columns, values)}
+
+# Sections of a complete student response and the columns each can project
+COMPLETE_SECTIONS = {
+    "student": STUDENT_COLUMNS,
+    "academic_record": ACADEMIC_COLUMNS,
+    "environmental_factors": ENVIRONMENTAL_COLUMNS,
+}
+
+def normalize_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Split a comma-separated fields parameter into sorted, unique names"""
+    if fields is None:
+        return None
+    names = sorted({name.strip() for name in fields.split(",") if name.strip()})
+    if not names:
+        raise HTTPException(status_code=400, detail="fields must name at least one field")
+    return names
+
+def _key_names(columns) -> set:
+    """Primary key attribute names of the model the columns belong to"""
+    mapper = columns[0].class_.__mapper__
+    return {mapper.get_property_by_column(column).key for column in mapper.primary_key}
+
+def _project_columns(columns, names: List[str]) -> list:
+    """Columns for `names` (in schema order), always including the model's primary key"""
+    by_name = {column.key: column for column in columns}
+    unknown = [name for name in names if name not in by_name]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    wanted = set(names) | _key_names(columns)
+    return [column for column in columns if column.key in wanted]
+
+def resolve_complete_fields(names: List[str]) -> Dict[str, list]:
+    """
+    Map requested fields to columns per complete-student section
+
+    Names may be `section.field`, a bare section name (all of its fields) or a
+    bare field, which resolves to the first section that has it. The student
+    section is always present so responses keep their student_id.
+    """
+    requested = {"student": []}
+    for name in names:
+        if "." in name:
+            section, field = name.split(".", 1)
+            if section not in COMPLETE_SECTIONS:
+                raise HTTPException(status_code=400, detail=f"Unknown section: {section}")
+            requested.setdefault(section, []).append(field)
+        elif name in COMPLETE_SECTIONS:
+            requested.setdefault(name, []).extend(column.key for column in COMPLETE_SECTIONS[name])
+        else:
+            section = next(
+                (section for section, columns in COMPLETE_SECTIONS.items()
+                 if any(column.key == name for column in columns)),
+                None
+            )
+            if section is None:
+                raise HTTPException(status_code=400, detail=f"Unknown fields: {name}")
+            requested.setdefault(section, []).append(name)
+    return {
+        section: _project_columns(COMPLETE_SECTIONS[section], field_names)
+        for section, field_names in requested.items()
+    }
 
 # Student CRUD operations
 def create_student(db: Session, student: StudentCreate) -> Student:
@@ -33,8 +111,18 @@ def get_student(db: Session, student_id: int) -> Student:
         raise HTTPException(status_code=404, detail="Student not found")
     return student
 
-def get_students(db: Session, skip: int = 0, limit: int = 100) -> List[Student]:
-    return db.query(Student).offset(skip).limit(limit).all()
+def get_students(db: Session, skip: int = 0, limit: int = 100,
+                 fields: Optional[List[str]] = None) -> List[dict]:
+    """
+    Page of students as plain dicts shaped like StudentResponse
+
+    Selects columns instead of ORM entities, so rows skip the identity map
+    and need no Pydantic validation before serialization. `fields` limits the
+    selected columns (student_id is always included).
+    """
+    columns = _project_columns(STUDENT_COLUMNS, fields) if fields else STUDENT_COLUMNS
+    rows = db.query(*columns).offset(skip).limit(limit).all()
+    return [_row_dict(columns, row) for row in rows]
 
 def update_student(db: Session, student_id: int, student: StudentUpdate) -> Student:
     db_student = get_student(db, student_id)
@@ -134,61 +222,161 @@ def update_environmental_factors(db: Session, student_id: int, factors: Environm
         raise HTTPException(status_code=400, detail=str(e))
 
 # Complete Student operations
-def create_complete_student(db: Session, student_data: CompleteStudentCreate) -> CompleteStudentResponse:
+COMPLETE_STUDENT_BACKENDS = ("orm", "procedure")
+
+INSERT_COMPLETE_STUDENT_CALL = text("""
+    CALL InsertCompleteStudentRecord(
+        :gender, :learning_disabilities, :distance_from_home,
+        :hours_studied, :attendance, :previous_scores, :tutoring_sessions, :exam_score,
+        :parental_involvement, :access_to_resources, :extracurricular_activities,
+        :sleep_hours, :motivation_level, :internet_access, :family_income,
+        :teacher_quality, :school_type, :peer_influence, :physical_activity,
+        :parental_education_level,
+        @new_student_id
+    )
+""")
+
+def create_complete_student(db: Session, student_data: CompleteStudentCreate,
+                            backend: Optional[str] = None) -> CompleteStudentResponse:
+    """Create a complete student using the configured backend (COMPLETE_STUDENT_BACKEND)"""
+    backend = backend or COMPLETE_STUDENT_BACKEND
+    if backend not in COMPLETE_STUDENT_BACKENDS:
+        raise ValueError(f"Unknown complete student backend: {backend}")
+    # SQLite has no stored procedures; the ORM path is the same single transaction
+    if backend == "procedure" and DB_ENGINE != "sqlite":
+        student_id = insert_complete_student_procedure(db, student_data)
+        return CompleteStudentResponse.model_validate(get_complete_students(db, [student_id])[0])
+    return create_complete_student_orm(db, student_data)
+
+def insert_complete_student_procedure(db: Session, student_data: CompleteStudentCreate) -> int:
+    """
+    Insert a complete student with one CALL to InsertCompleteStudentRecord
+
+    The procedure inserts all three rows in its own transaction and returns
+    the new id in its result set.
+
+    Returns:
+        The new student_id
+    """
+    params = {
+        **student_data.student.dict(),
+        **student_data.academic_record.dict(),
+        **student_data.environmental_factors.dict()
+    }
     try:
-        # Create student
-        student = create_student(
-            db,
-            StudentCreate(
-                gender=student_data.gender,
-                learning_disabilities=student_data.learning_disabilities,
-                distance_from_home=student_data.distance_from_home
-            )
-        )
+        result = db.execute(INSERT_COMPLETE_STUDENT_CALL, params)
+        row = result.mappings().first()
+        result.close()
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
 
-        # Create academic record
-        academic_record = create_academic_record(
-            db,
-            AcademicRecordCreate(
-                student_id=student.student_id,
-                hours_studied=student_data.hours_studied,
-                attendance=student_data.attendance,
-                previous_scores=student_data.previous_scores,
-                tutoring_sessions=student_data.tutoring_sessions,
-                exam_score=student_data.exam_score
-            )
-        )
+    # On error the procedure rolls back and exits before its SELECT
+    if row is None or row["new_student_id"] is None or row["new_student_id"] < 0:
+        raise HTTPException(status_code=400, detail="InsertCompleteStudentRecord failed")
+    return int(row["new_student_id"])
 
-        # Create environmental factors
-        env_factors = create_environmental_factors(
-            db,
-            EnvironmentalFactorsCreate(
-                student_id=student.student_id,
-                parental_involvement=student_data.parental_involvement,
-                access_to_resources=student_data.access_to_resources,
-                extracurricular_activities=student_data.extracurricular_activities,
-                sleep_hours=student_data.sleep_hours,
-                motivation_level=student_data.motivation_level,
-                internet_access=student_data.internet_access,
-                family_income=student_data.family_income,
-                teacher_quality=student_data.teacher_quality,
-                school_type=student_data.school_type,
-                peer_influence=student_data.peer_influence,
-                physical_activity=student_data.physical_activity,
-                parental_education_level=student_data.parental_education_level
-            )
-        )
+def create_complete_student_orm(db: Session, student_data: CompleteStudentCreate) -> CompleteStudentResponse:
+    try:
+        student = Student(**student_data.student.dict())
+        academic_record = AcademicRecord(**student_data.academic_record.dict())
+        env_factors = EnvironmentalFactors(**student_data.environmental_factors.dict())
+        student.academic_records.append(academic_record)
+        student.environmental_factors.append(env_factors)
+        db.add(student)
+        db.flush()
 
-        return CompleteStudentResponse(
+        # Build the response from the flushed objects (ids and defaults are
+        # populated) so committing doesn't need a refresh SELECT per table
+        response = CompleteStudentResponse(
             student=student,
             academic_record=academic_record,
             environmental_factors=env_factors,
             predictions=[]
         )
+        db.commit()
+        return response
     except SQLAlchemyError as e:
         db.rollback()
         raise HTTPException(status_code=400, detail=str(e))
 
+def _insert_students(db: Session, rows: List[dict]) -> List[int]:
+    """
+    Insert students with one multi-row INSERT and return their ids in input order
+
+    Neither engine can return ids from a single multi-row INSERT here (MySQL
+    has no RETURNING), so they are derived from the last insert id:
+
+    - MySQL: LAST_INSERT_ID() is the first id of the statement. This relies
+      on InnoDB reserving the ids of a multi-row INSERT ... VALUES in one
+      block (stepped by auto_increment_increment), which MySQL guarantees
+      for innodb_autoinc_lock_mode 0 and 1 and does for simple inserts under
+      mode 2 (the 8.0 default).
+    - SQLite: writers are serialized, so the rowids are consecutive and end
+      at last_insert_rowid().
+    """
+    db.execute(insert(Student).values(rows))
+    if DB_ENGINE == "sqlite":
+        last_id = db.execute(text("SELECT last_insert_rowid()")).scalar()
+        return list(range(last_id - len(rows) + 1, last_id + 1))
+    first_id, step = db.execute(text("SELECT LAST_INSERT_ID(), @@auto_increment_increment")).one()
+    return [first_id + i * step for i in range(len(rows))]
+
+def create_complete_students_bulk(db: Session, records: List[CompleteStudentCreate]) -> List[int]:
+    """
+    Insert many complete students in one transaction
+
+    Students, academic records and environmental factors are each written
+    with one INSERT statement (see _insert_students for how student ids are
+    recovered). Either every record is created or none is.
+    """
+    if len(records) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_SIZE} records per request")
+    try:
+        student_ids = _insert_students(db, [record.student.dict() for record in records])
+
+        db.execute(insert(AcademicRecord), [
+            {**record.academic_record.dict(), "student_id": student_id}
+            for record, student_id in zip(records, student_ids)
+        ])
+        db.execute(insert(EnvironmentalFactors), [
+            {**record.environmental_factors.dict(), "student_id": student_id}
+            for record, student_id in zip(records, student_ids)
+        ])
+        db.commit()
+        return student_ids
+    except SQLAlchemyError as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+
+def get_complete_student_fields(db: Session, student_id: int, fields: List[str]) -> dict:
+    """
+    Complete student restricted to `fields` (see resolve_complete_fields)
+
+    Each section is loaded with load_only, so unrequested columns are never
+    read, and sections that were not requested are not queried at all.
+    """
+    projection = resolve_complete_fields(fields)
+    models = {
+        "student": (Student, "Student not found"),
+        "academic_record": (AcademicRecord, "Academic record not found"),
+        "environmental_factors": (EnvironmentalFactors, "Environmental factors not found"),
+    }
+    result = {}
+    for section, columns in projection.items():
+        model, not_found = models[section]
+        obj = (
+            db.query(model)
+            .options(load_only(*columns))
+            .filter(model.student_id == student_id)
+            .first()
+        )
+        if not obj:
+            raise HTTPException(status_code=404, detail=not_found)
+        result[section] = {column.key: getattr(obj, column.key) for column in columns}
+    return result
+
 def get_complete_student(db: Session, student_id: int) -> CompleteStudentResponse:
     student = get_student(db, student_id)
     academic_record = get_academic_record(db, student_id)
@@ -201,4 +389,310 @@ def get_complete_student(db: Session, student_id: int) -> CompleteStudentRespons
         predictions=[]  # Predictions will be added when prediction functionality is implemented
     )
 
+def _complete_students_query(db: Session, student_ids: Optional[List[int]] = None,
+                             start_id: Optional[int] = None, end_id: Optional[int] = None):
+    """Single joined column query for complete student rows, ordered by student_id"""
+    query = (
+        db.query(*STUDENT_COLUMNS, *ACADEMIC_COLUMNS, *ENVIRONMENTAL_COLUMNS)
+        .outerjoin(AcademicRecord, AcademicRecord.student_id == Student.student_id)
+        .outerjoin(EnvironmentalFactors, EnvironmentalFactors.student_id == Student.student_id)
+    )
+    if student_ids is not None:
+        query = query.filter(Student.student_id.in_(student_ids))
+    if start_id is not None:
+        query = query.filter(Student.student_id >= start_id)
+    if end_id is not None:
+        query = query.filter(Student.student_id <= end_id)
+    return query.order_by(Student.student_id)
+
+def validate_batch_selection(student_ids: Optional[List[int]], start_id: Optional[int],
+                             end_id: Optional[int]) -> None:
+    if not student_ids and (start_id is None or end_id is None):
+        raise HTTPException(status_code=400, detail="Provide ids or both start_id and end_id")
+    if student_ids and len(student_ids) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_SIZE} ids per request")
+    if not student_ids and end_id - start_id + 1 > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"Range may span at most {MAX_BATCH_SIZE} ids")
+
+def iter_complete_students(db: Session, student_ids: Optional[List[int]] = None,
+                           start_id: Optional[int] = None, end_id: Optional[int] = None,
+                           batch_size: int = 500):
+    """
+    Yield dicts shaped like CompleteStudentResponse from one joined query
+
+    Rows are fetched from the database in chunks of `batch_size`. If a student
+    has several academic or environmental rows, the first one is used, matching
+    get_complete_student.
+    """
+    query = _complete_students_query(db, student_ids, start_id, end_id).yield_per(batch_size)
+    academic_start = len(STUDENT_COLUMNS)
+    environmental_start = academic_start + len(ACADEMIC_COLUMNS)
+    last_student_id = None
+    for row in query:
+        student = _row_dict(STUDENT_COLUMNS, row[:academic_start])
+        if student["student_id"] == last_student_id:
+            continue
+        last_student_id = student["student_id"]
+        academic_record = _row_dict(ACADEMIC_COLUMNS, row[academic_start:environmental_start])
+        env_factors = _row_dict(ENVIRONMENTAL_COLUMNS, row[environmental_start:])
+        yield {
+            "student": student,
+            "academic_record": academic_record if academic_record["record_id"] is not None else None,
+            "environmental_factors": env_factors if env_factors["env_id"] is not None else None,
+            "predictions": []
+        }
+
+def get_complete_students(db: Session, student_ids: Optional[List[int]] = None,
+                          start_id: Optional[int] = None, end_id: Optional[int] = None) -> List[dict]:
+    validate_batch_selection(student_ids, start_id, end_id)
+    return list(iter_complete_students(db, student_ids, start_id, end_id))
+
+# Search operations
+SEARCH_COLUMNS = [
+    Student.student_id, Student.gender, Student.learning_disabilities, Student.distance_from_home,
+    AcademicRecord.hours_studied, AcademicRecord.attendance, AcademicRecord.previous_scores,
+    AcademicRecord.exam_score,
+    EnvironmentalFactors.school_type, EnvironmentalFactors.motivation_level,
+    EnvironmentalFactors.parental_involvement, EnvironmentalFactors.family_income
+]
+
+def _decode_search_cursor(cursor: str, sort: str):
+    try:
+        if sort == "exam_score":
+            score, student_id = cursor.split(",", 1)
+            return int(score), int(student_id)
+        return (int(cursor),)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def search_students(db: Session, gender: Optional[str] = None, school_type: Optional[str] = None,
+                    motivation_level: Optional[str] = None, parental_involvement: Optional[str] = None,
+                    min_exam_score: Optional[int] = None, max_exam_score: Optional[int] = None,
+                    min_attendance: Optional[int] = None, sort: str = "student_id", order: str = "asc",
+                    cursor: Optional[str] = None, limit: int = 50) -> dict:
+    """
+    Filter students by demographic, environmental and score attributes
+
+    Results are keyset paged on (exam_score, student_id) or student_id, so
+    filters on school_type/motivation_level and exam_score ranges run as range
+    scans on idx_school_motivation and idx_exam_score_student.
+
+    Returns:
+        Dictionary with the matching rows and the cursor for the next page
+        (None on the last page)
+    """
+    query = (
+        db.query(*SEARCH_COLUMNS)
+        .join(AcademicRecord, AcademicRecord.student_id == Student.student_id)
+        .join(EnvironmentalFactors, EnvironmentalFactors.student_id == Student.student_id)
+    )
+
+    if gender is not None:
+        query = query.filter(Student.gender == gender)
+    if school_type is not None:
+        query = query.filter(EnvironmentalFactors.school_type == school_type)
+    if motivation_level is not None:
+        query = query.filter(EnvironmentalFactors.motivation_level == motivation_level)
+    if parental_involvement is not None:
+        query = query.filter(EnvironmentalFactors.parental_involvement == parental_involvement)
+    if min_exam_score is not None:
+        query = query.filter(AcademicRecord.exam_score >= min_exam_score)
+    if max_exam_score is not None:
+        query = query.filter(AcademicRecord.exam_score <= max_exam_score)
+    if min_attendance is not None:
+        query = query.filter(AcademicRecord.attendance >= min_attendance)
+
+    descending = order == "desc"
+    if sort == "exam_score":
+        sort_columns = [AcademicRecord.exam_score, AcademicRecord.student_id]
+        query = query.filter(AcademicRecord.exam_score.isnot(None))
+    else:
+        sort_columns = [Student.student_id]
+
+    if cursor:
+        after = _decode_search_cursor(cursor, sort)
+        compare = (lambda column, value: column < value) if descending else (lambda column, value: column > value)
+        if sort == "exam_score":
+            query = query.filter(or_(
+                compare(sort_columns[0], after[0]),
+                and_(sort_columns[0] == after[0], compare(sort_columns[1], after[1]))
+            ))
+        else:
+            query = query.filter(compare(sort_columns[0], after[0]))
+
+    query = query.order_by(*[column.desc() if descending else column.asc() for column in sort_columns])
+    # One row past the page tells whether another page exists
+    rows = query.limit(limit + 1).all()
+    items = [_row_dict(SEARCH_COLUMNS, row) for row in rows[:limit]]
+
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = (
+            f"{last['exam_score']},{last['student_id']}" if sort == "exam_score" else str(last["student_id"])
+        )
+    return {"items": items, "next_cursor": next_cursor}
+
+# Analytics operations
+# Columns students can be grouped by; the keys are the accepted `by` values
+ANALYTICS_DIMENSIONS = {
+    "gender": Student.gender,
+    "learning_disabilities": Student.learning_disabilities,
+    "distance_from_home": Student.distance_from_home,
+    "school_type": EnvironmentalFactors.school_type,
+    "parental_involvement": EnvironmentalFactors.parental_involvement,
+    "motivation_level": EnvironmentalFactors.motivation_level,
+    "family_income": EnvironmentalFactors.family_income,
+    "access_to_resources": EnvironmentalFactors.access_to_resources,
+    "teacher_quality": EnvironmentalFactors.teacher_quality,
+    "peer_influence": EnvironmentalFactors.peer_influence,
+}
+
+def _dimension(by: str):
+    if by not in ANALYTICS_DIMENSIONS:
+        raise HTTPException(status_code=400, detail=f"Cannot group by {by}")
+    return ANALYTICS_DIMENSIONS[by]
+
+def _joined_cohort_query(db: Session, *columns, dimension=None):
+    """Query over academic records, joining the table that holds `dimension` if needed"""
+    query = db.query(*columns).select_from(AcademicRecord)
+    if dimension is not None and dimension.class_ is Student:
+        query = query.join(Student, Student.student_id == AcademicRecord.student_id)
+    elif dimension is not None:
+        query = query.join(EnvironmentalFactors, EnvironmentalFactors.student_id == AcademicRecord.student_id)
+    return query
+
+def _round(value, digits: int = 2) -> Optional[float]:
+    return round(float(value), digits) if value is not None else None
+
+def exam_score_by_dimension(db: Session, by: str) -> List[dict]:
+    """Count and mean/min/max exam score per value of one dimension, grouped in SQL"""
+    dimension = _dimension(by)
+    rows = (
+        _joined_cohort_query(
+            db,
+            dimension.label("value"),
+            func.count(AcademicRecord.exam_score).label("students"),
+            func.avg(AcademicRecord.exam_score).label("mean_exam_score"),
+            func.min(AcademicRecord.exam_score).label("min_exam_score"),
+            func.max(AcademicRecord.exam_score).label("max_exam_score"),
+            dimension=dimension
+        )
+        .group_by(dimension)
+        .order_by(dimension)
+        .all()
+    )
+    return [
+        {
+            by: row.value,
+            "students": row.students,
+            "mean_exam_score": _round(row.mean_exam_score),
+            "min_exam_score": row.min_exam_score,
+            "max_exam_score": row.max_exam_score,
+        }
+        for row in rows
+    ]
+
+def exam_score_histogram(db: Session, bin_width: int = 10, by: Optional[str] = None) -> List[dict]:
+    """
+    Exam score histogram with fixed-width bins, optionally split by a dimension
+
+    Bins are computed with FLOOR(exam_score / bin_width) in SQL; empty bins
+    are omitted.
+    """
+    bin_index = func.floor(AcademicRecord.exam_score / bin_width).label("bin_index")
+    dimension = _dimension(by) if by is not None else None
+    columns = [bin_index, func.count().label("students")]
+    group = [bin_index]
+    if dimension is not None:
+        columns.insert(0, dimension.label("value"))
+        group.insert(0, dimension)
 
+    rows = (
+        _joined_cohort_query(db, *columns, dimension=dimension)
+        .filter(AcademicRecord.exam_score.isnot(None))
+        .group_by(*group)
+        .order_by(*group)
+        .all()
+    )
+    histogram = []
+    for row in rows:
+        bin_start = int(row.bin_index) * bin_width
+        entry = {"bin_start": bin_start, "bin_end": bin_start + bin_width, "students": row.students}
+        if dimension is not None:
+            entry = {by: row.value, **entry}
+        histogram.append(entry)
+    return histogram
+
+def prediction_error_by_cohort(db: Session, by: str, model_version: Optional[str] = None) -> List[dict]:
+    """
+    Prediction error per cohort over predictions that have an actual score
+
+    Returns MAE, RMSE and bias (mean predicted minus actual) per value of `by`.
+    """
+    dimension = _dimension(by)
+    error = Prediction.predicted_score - Prediction.actual_score
+    query = db.query(
+        dimension.label("value"),
+        func.count().label("predictions"),
+        func.avg(func.abs(error)).label("mae"),
+        func.sqrt(func.avg(error * error)).label("rmse"),
+        func.avg(error).label("bias"),
+    ).select_from(Prediction)
+    if dimension.class_ is Student:
+        query = query.join(Student, Student.student_id == Prediction.student_id)
+    else:
+        query = query.join(EnvironmentalFactors, EnvironmentalFactors.student_id == Prediction.student_id)
+
+    query = query.filter(Prediction.actual_score.isnot(None))
+    if model_version is not None:
+        query = query.filter(Prediction.model_version == model_version)
+
+    rows = query.group_by(dimension).order_by(dimension).all()
+    return [
+        {
+            by: row.value,
+            "predictions": row.predictions,
+            "mae": _round(row.mae, 4),
+            "rmse": _round(row.rmse, 4),
+            "bias": _round(row.bias, 4),
+        }
+        for row in rows
+    ]
+
+# Export operations
+def student_export_columns():
+    """Columns of the flat joined dataset (one row per student, model features plus exam_score)"""
+    return [
+        Student.student_id, Student.gender, Student.learning_disabilities, Student.distance_from_home,
+        AcademicRecord.hours_studied, AcademicRecord.attendance, AcademicRecord.previous_scores,
+        AcademicRecord.tutoring_sessions, AcademicRecord.exam_score,
+        EnvironmentalFactors.parental_involvement, EnvironmentalFactors.access_to_resources,
+        EnvironmentalFactors.extracurricular_activities, EnvironmentalFactors.sleep_hours,
+        EnvironmentalFactors.motivation_level, EnvironmentalFactors.internet_access,
+        EnvironmentalFactors.family_income, EnvironmentalFactors.teacher_quality,
+        EnvironmentalFactors.school_type, EnvironmentalFactors.peer_influence,
+        EnvironmentalFactors.physical_activity, EnvironmentalFactors.parental_education_level
+    ]
+
+def iter_student_export_batches(db: Session, batch_size: int = 1000):
+    """
+    Yield lists of joined student rows from a server-side cursor
+
+    stream_results keeps the driver from buffering the full result, so memory
+    is bounded by `batch_size` regardless of table size.
+    """
+    stmt = (
+        select(*student_export_columns())
+        .select_from(Student)
+        .outerjoin(AcademicRecord, AcademicRecord.student_id == Student.student_id)
+        .outerjoin(EnvironmentalFactors, EnvironmentalFactors.student_id == Student.student_id)
+        .order_by(Student.student_id)
+        .execution_options(stream_results=True, yield_per=batch_size)
+    )
+    result = db.execute(stmt)
+    try:
+        for partition in result.partitions():
+            yield partition
+    finally:
+        result.close()
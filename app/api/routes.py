@@ -1,15 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from ..database.connection import get_mysql_db
 from ..models.schemas import (
     StudentCreate, StudentUpdate, StudentResponse,
     AcademicRecordCreate, AcademicRecordUpdate, AcademicRecordResponse,
     EnvironmentalFactorsCreate, EnvironmentalFactorsUpdate, EnvironmentalFactorsResponse,
-    CompleteStudentCreate, CompleteStudentResponse
+    CompleteStudentCreate, CompleteStudentResponse,
+    CompleteStudentBatchCreate, CompleteStudentBatchResponse
 )
 from . import crud
+from .cache import analytics_cache, response_cache
+from .streaming import (
+    EXPORT_FORMATS, NDJSON_MEDIA_TYPE,
+    encode_row_batches, ndjson_lines, require_pyarrow, stream_with_session
+)
 
 router = APIRouter()
 
@@ -20,24 +27,60 @@ def create_student(student: StudentCreate, db: Session = Depends(get_mysql_db)):
     return crud.create_student(db, student)
 
 @router.get("/students/", response_model=List[StudentResponse], tags=["students"])
-def read_students(skip: int = 0, limit: int = 100, db: Session = Depends(get_mysql_db)):
+def read_students(
+    skip: int = 0,
+    limit: int = 100,
+    fields: Optional[str] = Query(None, description="Comma-separated columns to return, e.g. gender,created_at"),
+    db: Session = Depends(get_mysql_db)
+):
     """Get all students with pagination"""
-    return crud.get_students(db, skip=skip, limit=limit)
+    # Rows are already shaped like StudentResponse; returning a response
+    # directly skips FastAPI's per-item re-validation
+    return ORJSONResponse(crud.get_students(db, skip=skip, limit=limit, fields=crud.normalize_fields(fields)))
+
+# Registered before /students/{student_id} so "search" is not parsed as an id
+@router.get("/students/search", tags=["students"])
+def search_students(
+    gender: Optional[str] = Query(None, pattern="^(Male|Female)$"),
+    school_type: Optional[str] = Query(None, pattern="^(Public|Private)$"),
+    motivation_level: Optional[str] = Query(None, pattern="^(Low|Medium|High)$"),
+    parental_involvement: Optional[str] = Query(None, pattern="^(Low|Medium|High)$"),
+    min_exam_score: Optional[int] = Query(None, ge=0, le=110),
+    max_exam_score: Optional[int] = Query(None, ge=0, le=110),
+    min_attendance: Optional[int] = Query(None, ge=0, le=100),
+    sort: str = Query("student_id", pattern="^(student_id|exam_score)$"),
+    order: str = Query("asc", pattern="^(asc|desc)$"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(50, ge=1, le=crud.MAX_BATCH_SIZE),
+    db: Session = Depends(get_mysql_db)
+):
+    """Search students by attributes with keyset paging"""
+    return ORJSONResponse(crud.search_students(
+        db, gender=gender, school_type=school_type, motivation_level=motivation_level,
+        parental_involvement=parental_involvement, min_exam_score=min_exam_score,
+        max_exam_score=max_exam_score, min_attendance=min_attendance,
+        sort=sort, order=order, cursor=cursor, limit=limit
+    ))
 
 @router.get("/students/{student_id}", response_model=StudentResponse, tags=["students"])
-def read_student(student_id: int, db: Session = Depends(get_mysql_db)):
+def read_student(student_id: int, request: Request, db: Session = Depends(get_mysql_db)):
     """Get a specific student by ID"""
-    return crud.get_student(db, student_id)
+    return response_cache.respond(
+        request, student_id, "student", lambda: crud.get_student(db, student_id), StudentResponse
+    )
 
 @router.put("/students/{student_id}", response_model=StudentResponse, tags=["students"])
 def update_student(student_id: int, student: StudentUpdate, db: Session = Depends(get_mysql_db)):
     """Update a student's information"""
-    return crud.update_student(db, student_id, student)
+    updated = crud.update_student(db, student_id, student)
+    response_cache.invalidate(student_id)
+    return updated
 
 @router.delete("/students/{student_id}", tags=["students"])
 def delete_student(student_id: int, db: Session = Depends(get_mysql_db)):
     """Delete a student"""
     crud.delete_student(db, student_id)
+    response_cache.invalidate(student_id)
     return {"message": "Student deleted successfully"}
 
 # Academic Record endpoints
@@ -49,12 +92,16 @@ def create_academic_record(
 ):
     """Create an academic record for a student"""
     record.student_id = student_id
-    return crud.create_academic_record(db, record)
+    created = crud.create_academic_record(db, record)
+    response_cache.invalidate(student_id)
+    return created
 
 @router.get("/students/{student_id}/academic", response_model=AcademicRecordResponse, tags=["academic"])
-def read_academic_record(student_id: int, db: Session = Depends(get_mysql_db)):
+def read_academic_record(student_id: int, request: Request, db: Session = Depends(get_mysql_db)):
     """Get a student's academic record"""
-    return crud.get_academic_record(db, student_id)
+    return response_cache.respond(
+        request, student_id, "academic", lambda: crud.get_academic_record(db, student_id), AcademicRecordResponse
+    )
 
 @router.put("/students/{student_id}/academic", response_model=AcademicRecordResponse, tags=["academic"])
 def update_academic_record(
@@ -63,7 +110,9 @@ def update_academic_record(
     db: Session = Depends(get_mysql_db)
 ):
     """Update a student's academic record"""
-    return crud.update_academic_record(db, student_id, record)
+    updated = crud.update_academic_record(db, student_id, record)
+    response_cache.invalidate(student_id)
+    return updated
 
 # Environmental Factors endpoints
 @router.post("/students/{student_id}/environmental", response_model=EnvironmentalFactorsResponse, tags=["environmental"])
@@ -74,12 +123,17 @@ def create_environmental_factors(
 ):
     """Create environmental factors record for a student"""
     factors.student_id = student_id
-    return crud.create_environmental_factors(db, factors)
+    created = crud.create_environmental_factors(db, factors)
+    response_cache.invalidate(student_id)
+    return created
 
 @router.get("/students/{student_id}/environmental", response_model=EnvironmentalFactorsResponse, tags=["environmental"])
-def read_environmental_factors(student_id: int, db: Session = Depends(get_mysql_db)):
+def read_environmental_factors(student_id: int, request: Request, db: Session = Depends(get_mysql_db)):
     """Get a student's environmental factors"""
-    return crud.get_environmental_factors(db, student_id)
+    return response_cache.respond(
+        request, student_id, "environmental",
+        lambda: crud.get_environmental_factors(db, student_id), EnvironmentalFactorsResponse
+    )
 
 @router.put("/students/{student_id}/environmental", response_model=EnvironmentalFactorsResponse, tags=["environmental"])
 def update_environmental_factors(
@@ -88,7 +142,9 @@ def update_environmental_factors(
     db: Session = Depends(get_mysql_db)
 ):
     """Update a student's environmental factors"""
-    return crud.update_environmental_factors(db, student_id, factors)
+    updated = crud.update_environmental_factors(db, student_id, factors)
+    response_cache.invalidate(student_id)
+    return updated
 
 # Complete Student endpoints
 @router.post("/students/complete/", response_model=CompleteStudentResponse, tags=["complete"])
@@ -96,9 +152,107 @@ def create_complete_student(student: CompleteStudentCreate, db: Session = Depend
     """Create a complete student record with academic and environmental data"""
     return crud.create_complete_student(db, student)
 
+@router.post("/students/complete/batch", response_model=CompleteStudentBatchResponse, tags=["complete"])
+def create_complete_students_batch(batch: CompleteStudentBatchCreate, db: Session = Depends(get_mysql_db)):
+    """Create many complete student records in a single transaction"""
+    student_ids = crud.create_complete_students_bulk(db, batch.records)
+    return CompleteStudentBatchResponse(created=len(student_ids), student_ids=student_ids)
+
+@router.get("/students/complete/batch", response_model=List[CompleteStudentResponse], tags=["complete"])
+def read_complete_students_batch(
+    ids: Optional[List[int]] = Query(None, description="Student IDs (repeat the parameter)"),
+    start_id: Optional[int] = None,
+    end_id: Optional[int] = None,
+    format: str = Query("json", pattern="^(json|ndjson)$"),
+    db: Session = Depends(get_mysql_db)
+):
+    """Get complete records for many students (an id list or an inclusive id range) in one query"""
+    if format == "ndjson":
+        crud.validate_batch_selection(ids, start_id, end_id)
+        return StreamingResponse(
+            stream_with_session(
+                lambda stream_db: ndjson_lines(crud.iter_complete_students(stream_db, ids, start_id, end_id))
+            ),
+            media_type=NDJSON_MEDIA_TYPE
+        )
+    return ORJSONResponse(crud.get_complete_students(db, ids, start_id, end_id))
+
 @router.get("/students/{student_id}/complete/", response_model=CompleteStudentResponse, tags=["complete"])
-def read_complete_student(student_id: int, db: Session = Depends(get_mysql_db)):
+def read_complete_student(
+    student_id: int,
+    request: Request,
+    fields: Optional[str] = Query(
+        None, description="Comma-separated fields: section.field, field or section, e.g. academic_record.exam_score"
+    ),
+    db: Session = Depends(get_mysql_db)
+):
     """Get complete student information including academic and environmental data"""
-    return crud.get_complete_student(db, student_id)
+    field_names = crud.normalize_fields(fields)
+    if field_names:
+        return response_cache.respond(
+            request, student_id, "complete:" + ",".join(field_names),
+            lambda: crud.get_complete_student_fields(db, student_id, field_names)
+        )
+    return response_cache.respond(
+        request, student_id, "complete", lambda: crud.get_complete_student(db, student_id), CompleteStudentResponse
+    )
+
+# Analytics endpoints
+@router.get("/analytics/exam-scores", tags=["analytics"])
+def read_exam_scores_by_dimension(
+    request: Request,
+    by: str = Query("gender", description=f"One of: {', '.join(crud.ANALYTICS_DIMENSIONS)}"),
+    db: Session = Depends(get_mysql_db)
+):
+    """Mean, min and max exam score grouped by a student or environmental attribute"""
+    return analytics_cache.respond(
+        request, "exam-scores", by, lambda: crud.exam_score_by_dimension(db, by)
+    )
+
+@router.get("/analytics/exam-scores/histogram", tags=["analytics"])
+def read_exam_score_histogram(
+    request: Request,
+    bin_width: int = Query(10, ge=1, le=110),
+    by: Optional[str] = Query(None, description="Optional attribute to split the histogram by"),
+    db: Session = Depends(get_mysql_db)
+):
+    """Exam score distribution in fixed-width bins"""
+    return analytics_cache.respond(
+        request, "exam-score-histogram", f"{bin_width}:{by}",
+        lambda: crud.exam_score_histogram(db, bin_width, by)
+    )
+
+@router.get("/analytics/prediction-error", tags=["analytics"])
+def read_prediction_error(
+    request: Request,
+    by: str = Query("school_type", description=f"One of: {', '.join(crud.ANALYTICS_DIMENSIONS)}"),
+    model_version: Optional[str] = None,
+    db: Session = Depends(get_mysql_db)
+):
+    """MAE, RMSE and bias of stored predictions per cohort"""
+    return analytics_cache.respond(
+        request, "prediction-error", f"{by}:{model_version}",
+        lambda: crud.prediction_error_by_cohort(db, by, model_version)
+    )
+
+# Export endpoints
+@router.get("/export/students", tags=["export"])
+def export_students(
+    format: str = Query("ndjson", pattern="^(ndjson|csv|arrow)$"),
+    batch_size: int = Query(1000, ge=1, le=10000)
+):
+    """Stream the joined student dataset (features plus exam_score) as NDJSON, CSV or Arrow IPC"""
+    if format == "arrow":
+        # Fail with 501 before the response starts if pyarrow is missing
+        require_pyarrow()
 
+    columns = crud.student_export_columns()
+    media_type, extension = EXPORT_FORMATS[format]
 
+    return StreamingResponse(
+        stream_with_session(
+            lambda db: encode_row_batches(format, columns, crud.iter_student_export_batches(db, batch_size))
+        ),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="students.{extension}"'}
+    )
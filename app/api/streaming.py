@@ -0,0 +1,123 @@
+"""
+Streaming response helpers
+"""
+import csv
+import io
+from decimal import Decimal
+from typing import Callable, Iterable, Iterator, List, Sequence
+
+import orjson
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from ..database.connection import SessionLocal
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+CSV_MEDIA_TYPE = "text/csv"
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def stream_with_session(produce: Callable[[Session], Iterable[bytes]]) -> Iterator[bytes]:
+    """
+    Run `produce` with a session that lives as long as the stream
+
+    Request-scoped sessions from get_mysql_db are not guaranteed to outlive the
+    route function, so streaming bodies open their own.
+    """
+    db = SessionLocal()
+    try:
+        yield from produce(db)
+    finally:
+        db.close()
+
+
+def _json_default(value):
+    # orjson encodes datetime natively; Decimal needs a fallback
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def ndjson_lines(objects: Iterable[dict]) -> Iterator[bytes]:
+    """Encode dictionaries as newline-delimited JSON"""
+    for obj in objects:
+        yield orjson.dumps(obj, default=_json_default) + b"\n"
+
+
+def ndjson_rows(column_names: List[str], batches: Iterable[Sequence]) -> Iterator[bytes]:
+    """Encode batches of row tuples as newline-delimited JSON objects, one chunk per batch"""
+    for batch in batches:
+        yield b"".join(
+            orjson.dumps(dict(zip(column_names, row)), default=_json_default) + b"\n"
+            for row in batch
+        )
+
+
+def csv_rows(column_names: List[str], batches: Iterable[Sequence]) -> Iterator[bytes]:
+    """Encode batches of row tuples as CSV with a header row, one chunk per batch"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(column_names)
+    for batch in batches:
+        writer.writerows(batch)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate(0)
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def require_pyarrow():
+    """Import pyarrow or fail the request with 501 if it is not installed"""
+    try:
+        import pyarrow
+    except ImportError:
+        raise HTTPException(status_code=501, detail="Arrow export requires pyarrow to be installed")
+    return pyarrow
+
+
+def arrow_ipc_batches(columns, batches: Iterable[Sequence]) -> Iterator[bytes]:
+    """
+    Encode batches of row tuples as an Arrow IPC stream, one record batch per chunk
+
+    Args:
+        columns: SQLAlchemy columns describing the rows (used for the Arrow schema)
+        batches: Iterable of row tuple lists
+    """
+    pa = require_pyarrow()
+    schema = pa.schema([
+        (column.key, pa.int32() if column.type.python_type is int else pa.string())
+        for column in columns
+    ])
+
+    sink = io.BytesIO()
+    writer = pa.ipc.new_stream(sink, schema)
+    for batch in batches:
+        arrays = [
+            pa.array([row[index] for row in batch], type=field.type)
+            for index, field in enumerate(schema)
+        ]
+        writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+        yield sink.getvalue()
+        sink.seek(0)
+        sink.truncate(0)
+    writer.close()
+    yield sink.getvalue()
+
+
+# Export format -> (media type, file extension)
+EXPORT_FORMATS = {
+    "ndjson": (NDJSON_MEDIA_TYPE, "ndjson"),
+    "csv": (CSV_MEDIA_TYPE, "csv"),
+    "arrow": (ARROW_STREAM_MEDIA_TYPE, "arrows"),
+}
+
+
+def encode_row_batches(format: str, columns, batches: Iterable[Sequence]) -> Iterator[bytes]:
+    """Encode batches of row tuples in one of EXPORT_FORMATS"""
+    if format == "arrow":
+        return arrow_ipc_batches(columns, batches)
+    column_names = [column.key for column in columns]
+    if format == "csv":
+        return csv_rows(column_names, batches)
+    return ndjson_rows(column_names, batches)
@@ -3,7 +3,7 @@ Database connection management
 """
 import os
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 
@@ -16,11 +16,51 @@ MYSQL_USER = os.getenv("MYSQL_USER", "root")
 MYSQL_PASSWORD = os.getenv("MYSQL_PASSWORD", "")
 MYSQL_DATABASE = os.getenv("MYSQL_DATABASE", "student_performance_db")
 
+# Write path for complete students: "orm" (SQLAlchemy inserts) or "procedure"
+# (one CALL to the InsertCompleteStudentRecord stored procedure)
+COMPLETE_STUDENT_BACKEND = os.getenv("COMPLETE_STUDENT_BACKEND", "orm")
+
+# Storage engine: "mysql" (server) or "sqlite" (local file created by
+# DB_ENGINE=sqlite python scripts/setup_and_populate.py, no server needed)
+DB_ENGINE = os.getenv("DB_ENGINE", "mysql").lower()
+SQLITE_PATH = os.getenv("SQLITE_PATH", "student_performance.db")
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", str(64 * 1024)))
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+
 MYSQL_URL = f"mysql+pymysql://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DATABASE}"
+SQLITE_URL = f"sqlite:///{SQLITE_PATH}"
+
+def _configure_sqlite_connection(dbapi_connection, connection_record):
+    """Per-connection settings, the same as src/database/sqlite_manager.py"""
+    cursor = dbapi_connection.cursor()
+    for pragma in (
+        "journal_mode = WAL",
+        "synchronous = NORMAL",
+        "foreign_keys = ON",
+        "temp_store = MEMORY",
+        f"mmap_size = {SQLITE_MMAP_SIZE}",
+        f"cache_size = -{SQLITE_CACHE_SIZE_KB}",
+    ):
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
+    # Checked by the SQLite audit triggers in place of @audit_triggers_disabled
+    dbapi_connection.create_function("audit_triggers_enabled", 0, lambda: 1)
 
 # Create engine
-mysql_engine = create_engine(MYSQL_URL, echo=False)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=mysql_engine)
+if DB_ENGINE == "sqlite":
+    # Pooled connections are handed between FastAPI's worker threads
+    engine = create_engine(
+        SQLITE_URL,
+        echo=False,
+        connect_args={"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000}
+    )
+    event.listen(engine, "connect", _configure_sqlite_connection)
+elif DB_ENGINE == "mysql":
+    engine = create_engine(MYSQL_URL, echo=False)
+else:
+    raise ValueError(f"Unsupported DB_ENGINE: {DB_ENGINE}")
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
@@ -36,11 +76,11 @@ def initialize_databases():
     """Initialize database connections on startup"""
     print("Initializing database connections...")
     try:
-        # Test MySQL connection
-        with mysql_engine.connect() as conn:
-            print("MySQL connection successful")
+        # Test database connection
+        with engine.connect() as conn:
+            print(f"{DB_ENGINE} connection successful")
     except Exception as e:
-        print(f"MySQL connection failed: {e}")
+        print(f"{DB_ENGINE} connection failed: {e}")
 
 
 
@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .api.routes import router
 from .database.connection import initialize_databases
@@ -8,7 +9,8 @@ from .database.connection import initialize_databases
 app = FastAPI(
     title="Student Performance API",
     description="API for managing student performance data and predictions",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -4,7 +4,7 @@ SQLAlchemy Database Models
 ORM models for database tables
 """
 
-from sqlalchemy import Column, Integer, String, DECIMAL, TIMESTAMP, Enum as SQLEnum, ForeignKey, CheckConstraint
+from sqlalchemy import Column, Integer, String, DECIMAL, TIMESTAMP, Enum as SQLEnum, ForeignKey, CheckConstraint, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -26,6 +26,7 @@ class Student(Base):
     academic_records = relationship("AcademicRecord", back_populates="student", cascade="all, delete-orphan")
     environmental_factors = relationship("EnvironmentalFactors", back_populates="student", cascade="all, delete-orphan")
     predictions = relationship("Prediction", back_populates="student", cascade="all, delete-orphan")
+    prediction_summary = relationship("StudentPredictionSummary", back_populates="student", uselist=False, viewonly=True)
 
 
 class AcademicRecord(Base):
@@ -43,6 +44,11 @@ class AcademicRecord(Base):
     # Relationship
     student = relationship("Student", back_populates="academic_records")
 
+    # Score range scans for /students/search, ordered by student_id for keyset paging
+    __table_args__ = (
+        Index('idx_exam_score_student', 'exam_score', 'student_id'),
+    )
+
 
 class EnvironmentalFactors(Base):
     __tablename__ = 'environmental_factors'
@@ -62,10 +68,16 @@ class EnvironmentalFactors(Base):
     physical_activity = Column(Integer)
     parental_education_level = Column(SQLEnum('High School', 'College', 'Postgraduate', name='education_enum'), default='High School')
     created_at = Column(TIMESTAMP, default=datetime.utcnow)
+    updated_at = Column(TIMESTAMP, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationship
     student = relationship("Student", back_populates="environmental_factors")
 
+    # Cohort lookups for /students/search (school type, then motivation level)
+    __table_args__ = (
+        Index('idx_school_motivation', 'school_type', 'motivation_level', 'student_id'),
+    )
+
 
 class Prediction(Base):
     __tablename__ = 'predictions'
@@ -75,6 +87,7 @@ class Prediction(Base):
     predicted_score = Column(DECIMAL(5, 2))
     actual_score = Column(Integer, nullable=True)
     confidence_score = Column(DECIMAL(5, 4))
+    model_version = Column(String(20), nullable=False, default='v1.0')
     prediction_date = Column(TIMESTAMP, default=datetime.utcnow)
     
     # Relationship
@@ -82,3 +95,22 @@ class Prediction(Base):
 
 
 
+
+
+class StudentPredictionSummary(Base):
+    """Per-student prediction rollup maintained by the prediction triggers"""
+    __tablename__ = 'student_prediction_summary'
+    
+    student_id = Column(Integer, ForeignKey('students.student_id', ondelete='CASCADE'), primary_key=True)
+    latest_prediction_id = Column(Integer, nullable=False)
+    latest_predicted_score = Column(DECIMAL(5, 2))
+    latest_confidence_score = Column(DECIMAL(5, 4))
+    prediction_count = Column(Integer, nullable=False, default=0)
+    predicted_score_count = Column(Integer, nullable=False, default=0)
+    predicted_score_total = Column(DECIMAL(14, 2), nullable=False, default=0)
+    avg_predicted_score = Column(DECIMAL(7, 4))
+    last_prediction_date = Column(TIMESTAMP, nullable=True)
+    updated_at = Column(TIMESTAMP, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # Relationship
+    student = relationship("Student", back_populates="prediction_summary")
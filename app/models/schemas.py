@@ -1,8 +1,8 @@
 """
 Pydantic schemas for API request/response validation
 """
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from datetime import datetime
 
 # Student schemas
@@ -98,6 +98,7 @@ class PredictionBase(BaseModel):
     predicted_score: float
     actual_score: Optional[int] = None
     confidence_score: float
+    model_version: str = "v1.0"
 
 class PredictionCreate(PredictionBase):
     student_id: int
@@ -116,6 +117,13 @@ class CompleteStudentCreate(BaseModel):
     academic_record: AcademicRecordBase
     environmental_factors: EnvironmentalFactorsBase
 
+class CompleteStudentBatchCreate(BaseModel):
+    records: List[CompleteStudentCreate] = Field(..., min_length=1, max_length=1000)
+
+class CompleteStudentBatchResponse(BaseModel):
+    created: int
+    student_ids: List[int]
+
 class CompleteStudentResponse(BaseModel):
     student: StudentResponse
     academic_record: Optional[AcademicRecordResponse] = None
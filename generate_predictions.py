@@ -5,9 +5,15 @@ from datetime import datetime
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 sys.path.insert(0, 'prediction')
 
-from database.mysql_manager import MySQLDatabaseManager
+from database.storage import get_database_manager
+from database.audit_logger import (
+    AsyncAuditLogger, AUDIT_MODE_ASYNC, commit_and_log, get_audit_mode, set_audit_triggers_enabled
+)
 from prediction.model_loader import ModelLoader
 
+# Predictions committed per transaction (and handed to the async audit writer)
+COMMIT_BATCH_SIZE = int(os.getenv('PREDICTION_COMMIT_BATCH_SIZE', '500'))
+
 def generate_predictions(num_students=10):
     """Generate predictions for multiple students"""
     print(f"\nGenerating Predictions for {num_students} Students")
@@ -18,10 +24,19 @@ def generate_predictions(num_students=10):
     loader = ModelLoader()
     loader.load_model()
     
-    db = MySQLDatabaseManager()
+    db = get_database_manager()
+    model_version = os.getenv('MODEL_VERSION', 'v1.0')
     conn = db.get_connection()
     cursor = conn.cursor(dictionary=True)
     
+    # AUDIT_MODE=async: skip the per-row audit trigger; each committed batch
+    # of predictions is handed to a background writer while scoring continues
+    audit_logger = None
+    pending_audit = []
+    if get_audit_mode() == AUDIT_MODE_ASYNC:
+        set_audit_triggers_enabled(conn, False)
+        audit_logger = AsyncAuditLogger(db).start()
+    
     # Get students
     print(f"Fetching {num_students} students from database...")
     query = """
@@ -77,22 +92,45 @@ def generate_predictions(num_students=10):
         
         # Save to database
         insert_query = """
-        INSERT INTO predictions (student_id, predicted_score, actual_score, confidence_score, prediction_date)
-        VALUES (%s, %s, %s, %s, %s)
+        INSERT INTO predictions (student_id, predicted_score, actual_score, confidence_score, model_version, prediction_date)
+        VALUES (%s, %s, %s, %s, %s, %s)
         """
         
+        prediction_date = datetime.now()
         cursor.execute(insert_query, (
             student_id,
             predicted_score,
             actual_score,
             confidence,
-            datetime.now()
+            model_version,
+            prediction_date
         ))
         
+        if audit_logger:
+            pending_audit.append({
+                'table_name': 'predictions',
+                'operation': 'INSERT',
+                'record_id': cursor.lastrowid,
+                'new_values': {
+                    'student_id': student_id,
+                    'predicted_score': round(predicted_score, 2),
+                    'actual_score': actual_score,
+                    'confidence_score': round(confidence, 4),
+                    'model_version': model_version,
+                    'prediction_date': prediction_date
+                },
+                'change_timestamp': prediction_date
+            })
+        
         predictions_saved += 1
         print(f"Student {student_id}: Predicted={predicted_score:.2f}, Actual={actual_score}, Error={abs(predicted_score - actual_score):.2f}")
+        if predictions_saved % COMMIT_BATCH_SIZE == 0:
+            commit_and_log(conn, audit_logger, pending_audit)
+    
+    commit_and_log(conn, audit_logger, pending_audit)
+    if audit_logger:
+        audit_logger.close()
     
-    conn.commit()
     cursor.close()
     conn.close()
     
@@ -7,11 +7,17 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 sys.path.insert(0, 'prediction')
 
-from database.mysql_manager import MySQLDatabaseManager
+from database.storage import get_database_manager
+from database.audit_logger import (
+    AsyncAuditLogger, AUDIT_MODE_ASYNC, commit_and_log, get_audit_mode, set_audit_triggers_enabled
+)
 from prediction.model_loader import ModelLoader
 from datetime import datetime
 from tabulate import tabulate
 
+# Predictions committed per transaction (and handed to the async audit writer)
+COMMIT_BATCH_SIZE = int(os.getenv('PREDICTION_COMMIT_BATCH_SIZE', '500'))
+
 def make_real_predictions(num_students=10):
     """Make real predictions using ML model and student data"""
     print(f"\nMaking Real Predictions for {num_students} Students")
@@ -26,10 +32,19 @@ def make_real_predictions(num_students=10):
     
     # Get students from database
     print(f"Step 2: Fetching {num_students} students with complete data...")
-    db = MySQLDatabaseManager()
+    db = get_database_manager()
+    model_version = os.getenv('MODEL_VERSION', 'v1.0')
     conn = db.get_connection()
     cursor = conn.cursor(dictionary=True)
     
+    # AUDIT_MODE=async: skip the per-row audit trigger; each committed batch
+    # of predictions is handed to a background writer while scoring continues
+    audit_logger = None
+    pending_audit = []
+    if get_audit_mode() == AUDIT_MODE_ASYNC:
+        set_audit_triggers_enabled(conn, False)
+        audit_logger = AsyncAuditLogger(db).start()
+    
     query = """
     SELECT 
         s.student_id, s.gender, s.learning_disabilities, s.distance_from_home,
@@ -104,18 +119,36 @@ def make_real_predictions(num_students=10):
         
         # Save to database
         insert_query = """
-        INSERT INTO predictions (student_id, predicted_score, actual_score, confidence_score, prediction_date)
-        VALUES (%s, %s, %s, %s, %s)
+        INSERT INTO predictions (student_id, predicted_score, actual_score, confidence_score, model_version, prediction_date)
+        VALUES (%s, %s, %s, %s, %s, %s)
         """
         
+        prediction_date = datetime.now()
         cursor.execute(insert_query, (
             student_id,
             predicted_score,
             actual_score,
             confidence,
-            datetime.now()
+            model_version,
+            prediction_date
         ))
         
+        if audit_logger:
+            pending_audit.append({
+                'table_name': 'predictions',
+                'operation': 'INSERT',
+                'record_id': cursor.lastrowid,
+                'new_values': {
+                    'student_id': student_id,
+                    'predicted_score': round(predicted_score, 2),
+                    'actual_score': actual_score,
+                    'confidence_score': round(confidence, 4),
+                    'model_version': model_version,
+                    'prediction_date': prediction_date
+                },
+                'change_timestamp': prediction_date
+            })
+        
         predictions_data.append([
             student_id,
             student['hours_studied'],
@@ -126,8 +159,12 @@ def make_real_predictions(num_students=10):
             f"{error:.2f}",
             f"{confidence:.4f}"
         ])
+        if i % COMMIT_BATCH_SIZE == 0:
+            commit_and_log(conn, audit_logger, pending_audit)
     
-    conn.commit()
+    commit_and_log(conn, audit_logger, pending_audit)
+    if audit_logger:
+        audit_logger.close()
     
     # Summary table
     print("\n" + "=" * 100)
@@ -0,0 +1,73 @@
+"""
+Manage audit log partitions and retention
+
+Usage:
+    python manage_audit_log.py list
+    python manage_audit_log.py ensure --months-ahead 3
+    python manage_audit_log.py retain --keep-months 6 --archive-dir archives/audit_log
+    python manage_audit_log.py retain --keep-months 6 --dry-run
+"""
+import sys
+import os
+import argparse
+from datetime import datetime
+from tabulate import tabulate
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from database.mysql_manager import MySQLDatabaseManager
+from database.audit_partitions import AuditLogPartitionManager
+
+
+def list_partitions(manager):
+    partitions = manager.run('list_partitions')
+
+    table_data = []
+    for partition in partitions:
+        bound = partition['upper_bound']
+        table_data.append([
+            partition['name'],
+            datetime.fromtimestamp(bound).strftime('%Y-%m-%d') if bound is not None else 'MAXVALUE',
+            f"{partition['rows']:,}"
+        ])
+
+    print(f"\nAudit Log Partitions ({len(partitions)})")
+    print(tabulate(table_data, headers=['Partition', 'Rows Before', 'Approx Rows'], tablefmt='grid'))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Audit log partition maintenance")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('list', help="Show partitions and approximate row counts")
+
+    ensure = subparsers.add_parser('ensure', help="Create monthly partitions ahead of time")
+    ensure.add_argument('--months-ahead', type=int, default=3)
+
+    retain = subparsers.add_parser('retain', help="Archive and drop partitions older than the window")
+    retain.add_argument('--keep-months', type=int, default=6,
+                        help="Months to keep, including the current month (default: 6)")
+    retain.add_argument('--archive-dir', help="Export partitions as .ndjson.gz here before dropping")
+    retain.add_argument('--dry-run', action='store_true', help="Only report what would be dropped")
+
+    args = parser.parse_args(argv)
+    manager = AuditLogPartitionManager(MySQLDatabaseManager())
+
+    if args.command == 'list':
+        list_partitions(manager)
+    elif args.command == 'ensure':
+        manager.run('ensure_partitions', months_ahead=args.months_ahead)
+    elif args.command == 'retain':
+        # Keep partitions ahead of the current month available before dropping old ones
+        manager.run('ensure_partitions', dry_run=args.dry_run)
+        manager.run(
+            'apply_retention',
+            keep_months=args.keep_months,
+            archive_dir=args.archive_dir,
+            dry_run=args.dry_run
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
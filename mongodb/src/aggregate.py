@@ -1,8 +1,12 @@
 from .mongodb_client import get_collection
+from . import rollups
 
-def avg_scores_by_gender():
-    col = get_collection()
-    pipeline = [
+# Pipeline builders (shared with async_aggregate)
+def avg_scores_by_gender_pipeline():
+    # The leading $sort lets the planner walk idx_gender_scores instead of
+    # scanning the collection ($group alone never uses an index)
+    return [
+        {"$sort": {"gender": 1}},
         {"$group": {
             "_id": "$gender",
             "avg_math": {"$avg": "$math_score"},
@@ -12,27 +16,40 @@ def avg_scores_by_gender():
         }},
         {"$sort": {"_id": 1}}
     ]
-    return list(col.aggregate(pipeline))
 
-def top_n_by_math(n=5):
-    col = get_collection()
-    pipeline = [
+def top_n_by_math_pipeline(n=5):
+    return [
         {"$sort": {"math_score": -1}},
         {"$limit": n},
         {"$project": {"gender": 1, "race": 1, "math_score": 1, "_id": 0}}
     ]
-    return list(col.aggregate(pipeline))
 
-def score_distribution(bucket=10):
-    """Bucket math_score into ranges of width `bucket` (e.g., 0-9, 10-19, ...)."""
-    col = get_collection()
-    pipeline = [
+def score_distribution_pipeline(bucket=10):
+    return [
         {"$match": {"math_score": {"$type": "number"}}},
         {"$project": {"bucket": {"$multiply": [{"$floor": {"$divide": ["$math_score", bucket]}}, bucket]}}},
         {"$group": {"_id": "$bucket", "count": {"$sum": 1}}},
         {"$sort": {"_id": 1}}
     ]
-    return list(col.aggregate(pipeline))
+
+def avg_scores_by_gender():
+    if rollups.is_fresh(rollups.GENDER_SCORES):
+        return rollups.read_gender_averages()
+    col = get_collection()
+    return list(col.aggregate(avg_scores_by_gender_pipeline()))
+
+def top_n_by_math(n=5):
+    if n <= rollups.ROLLUP_TOP_N and rollups.is_fresh(rollups.TOP_MATH):
+        return rollups.read_top_math(n)
+    col = get_collection()
+    return list(col.aggregate(top_n_by_math_pipeline(n)))
+
+def score_distribution(bucket=10):
+    """Bucket math_score into ranges of width `bucket` (e.g., 0-9, 10-19, ...)."""
+    if bucket == rollups.ROLLUP_BUCKET_WIDTH and rollups.is_fresh(rollups.SCORE_BUCKETS):
+        return rollups.read_score_buckets()
+    col = get_collection()
+    return list(col.aggregate(score_distribution_pipeline(bucket)))
 
 def main():
     print("Avg scores by gender:")
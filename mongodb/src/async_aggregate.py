@@ -0,0 +1,66 @@
+import asyncio
+from .async_client import get_async_collection, close_async_client
+from .aggregate import (
+    avg_scores_by_gender_pipeline, top_n_by_math_pipeline, score_distribution_pipeline
+)
+from . import rollups
+
+async def _aggregate(pipeline):
+    col = get_async_collection()
+    return await col.aggregate(pipeline).to_list(length=None)
+
+async def _read_rollup(name, reader, *args):
+    """Rollup rows if `name` is fresh, otherwise None (sync client, run off the event loop)"""
+    def read():
+        return reader(*args) if rollups.is_fresh(name) else None
+    return await asyncio.to_thread(read)
+
+async def avg_scores_by_gender():
+    rows = await _read_rollup(rollups.GENDER_SCORES, rollups.read_gender_averages)
+    if rows is not None:
+        return rows
+    return await _aggregate(avg_scores_by_gender_pipeline())
+
+async def top_n_by_math(n=5):
+    if n <= rollups.ROLLUP_TOP_N:
+        rows = await _read_rollup(rollups.TOP_MATH, rollups.read_top_math, n)
+        if rows is not None:
+            return rows
+    return await _aggregate(top_n_by_math_pipeline(n))
+
+async def score_distribution(bucket=10):
+    """Bucket math_score into ranges of width `bucket` (e.g., 0-9, 10-19, ...)."""
+    if bucket == rollups.ROLLUP_BUCKET_WIDTH:
+        rows = await _read_rollup(rollups.SCORE_BUCKETS, rollups.read_score_buckets)
+        if rows is not None:
+            return rows
+    return await _aggregate(score_distribution_pipeline(bucket))
+
+async def dashboard(top_n=5, bucket=10):
+    """Run the dashboard aggregations concurrently over the shared connection pool"""
+    by_gender, top, distribution = await asyncio.gather(
+        avg_scores_by_gender(),
+        top_n_by_math(top_n),
+        score_distribution(bucket)
+    )
+    return {"avg_scores_by_gender": by_gender, "top_n_by_math": top, "score_distribution": distribution}
+
+async def main():
+    results = await dashboard()
+
+    print("Avg scores by gender:")
+    for row in results["avg_scores_by_gender"]:
+        print(row)
+
+    print("\nTop 5 by math score:")
+    for row in results["top_n_by_math"]:
+        print(row)
+
+    print("\nMath score distribution (bucket=10):")
+    for row in results["score_distribution"]:
+        print(row)
+
+    close_async_client()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,40 @@
+from motor.motor_asyncio import AsyncIOMotorClient
+from .config import MONGODB_URI, DB_NAME, COLLECTION_NAME
+from .mongodb_client import client_options, get_backend
+
+_client = None
+
+def get_async_client() -> AsyncIOMotorClient:
+    """
+    Process-wide Motor client with the same pool settings as get_client()
+
+    Motor binds to the running event loop on first use, so create and use it
+    from a single loop (e.g. the FastAPI/uvicorn loop).
+    """
+    global _client
+    if _client is None:
+        if get_backend() == "mongomock":
+            try:
+                from mongomock_motor import AsyncMongoMockClient
+            except ImportError:
+                raise RuntimeError("MONGO_BACKEND=mongomock requires mongomock-motor for async access")
+            _client = AsyncMongoMockClient()
+            return _client
+        if not MONGODB_URI:
+            raise RuntimeError("MONGODB_URI is not set. Check your .env.")
+        _client = AsyncIOMotorClient(MONGODB_URI, **client_options())
+    return _client
+
+def close_async_client():
+    """Close the shared Motor client (e.g. from a FastAPI shutdown handler)"""
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
+
+def get_async_db():
+    return get_async_client()[DB_NAME]
+
+def get_async_collection():
+    db = get_async_db()
+    return db[COLLECTION_NAME]
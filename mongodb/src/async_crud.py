@@ -0,0 +1,59 @@
+import asyncio
+from bson.objectid import ObjectId
+from .async_client import get_async_collection, close_async_client
+from .crud import new_student_doc
+from . import rollups
+
+# Rollup bookkeeping uses the sync client (as crud does); it runs in a worker
+# thread so the event loop is not blocked
+
+async def create_student(doc: dict):
+    col = get_async_collection()
+    doc = new_student_doc(doc)
+    res = await col.insert_one(doc)
+    await asyncio.to_thread(rollups.apply_insert, {**doc, "_id": res.inserted_id})
+    return res.inserted_id
+
+async def read_latest(limit: int = 5):
+    col = get_async_collection()
+    return await col.find({}).sort("created_at", -1).limit(limit).to_list(length=limit)
+
+async def update_one_by_id(_id: str, updates: dict):
+    col = get_async_collection()
+    res = await col.update_one({"_id": ObjectId(_id)}, {"$set": updates})
+    if res.modified_count:
+        await asyncio.to_thread(rollups.mark_stale)
+    return res.modified_count
+
+async def delete_one_by_id(_id: str):
+    col = get_async_collection()
+    res = await col.delete_one({"_id": ObjectId(_id)})
+    if res.deleted_count:
+        await asyncio.to_thread(rollups.mark_stale)
+    return res.deleted_count
+
+async def main():
+    new_id = await create_student({
+        "gender": "male",
+        "race": "group A",
+        "parent_education": "associate degree",
+        "lunch": "free/reduced",
+        "test_prep_course": "completed",
+        "math_score": 67,
+        "reading_score": 72,
+        "writing_score": 70
+    })
+    print(f"Created _id: {new_id}")
+
+    docs = await read_latest(limit=3)
+    print(f"Latest {len(docs)} docs:")
+    for d in docs:
+        print({k: d[k] for k in d if k not in ["_id"]} | {"_id": str(d["_id"])})
+
+    modified = await update_one_by_id(str(new_id), {"math_score": 75})
+    print(f"Modified: {modified}")
+
+    close_async_client()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,78 @@
+import argparse
+import random
+import statistics
+import time
+from .config import DATA_CSV_PATH
+from .mongodb_client import get_collection, set_backend
+from . import aggregate, crud, load_data
+
+def timed(fn, repeat=5):
+    """Run fn `repeat` times; return (last result, per-run milliseconds)"""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return result, timings
+
+def report(label, timings):
+    print(f"{label:<32} mean {statistics.mean(timings):9.2f} ms   "
+          f"min {min(timings):9.2f} ms   max {max(timings):9.2f} ms")
+
+def seed_scores(n, seed=42):
+    """Insert n synthetic documents in the shape aggregate.py queries (gender/race/*_score)"""
+    rng = random.Random(seed)
+    docs = [
+        crud.new_student_doc({
+            "gender": rng.choice(["male", "female"]),
+            "race": f"group {rng.choice('ABCDE')}",
+            "math_score": rng.randint(0, 100),
+            "reading_score": rng.randint(0, 100),
+            "writing_score": rng.randint(0, 100),
+        })
+        for _ in range(n)
+    ]
+    get_collection().insert_many(docs, ordered=False)
+
+def run(backend="mongomock", docs=5000, repeat=5, workers=1, batch_size=1000, csv_path=DATA_CSV_PATH):
+    set_backend(backend)
+    col = get_collection()
+    # drop() rather than delete_many() so each phase also starts without the
+    # previous phase's indexes (load_csv creates uniq_source_row)
+    col.drop()
+    print(f"Backend: {backend}  collection: {col.name}")
+
+    _, timings = timed(lambda: load_data.load_csv(csv_path, batch_size=batch_size, workers=workers), repeat=1)
+    report("load_csv (upsert)", timings)
+    _, timings = timed(lambda: load_data.load_csv(csv_path, batch_size=batch_size, workers=workers), repeat=1)
+    report("load_csv (re-run, all matched)", timings)
+
+    col.drop()
+    _, timings = timed(lambda: seed_scores(docs), repeat=1)
+    report(f"insert_many ({docs} docs)", timings)
+
+    _, timings = timed(aggregate.avg_scores_by_gender, repeat)
+    report("avg_scores_by_gender", timings)
+    _, timings = timed(lambda: aggregate.top_n_by_math(5), repeat)
+    report("top_n_by_math(5)", timings)
+    _, timings = timed(lambda: aggregate.score_distribution(10), repeat)
+    report("score_distribution(10)", timings)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Micro-benchmark the mongodb loaders and aggregates")
+    parser.add_argument("--backend", choices=["mongomock", "pymongo"], default="mongomock",
+                        help="mongomock runs in-process; pymongo uses MONGODB_URI (its collection is cleared)")
+    parser.add_argument("--csv", default=DATA_CSV_PATH, help="CSV file timed with load_csv")
+    parser.add_argument("--docs", type=int, default=5000, help="Synthetic score documents for the aggregates")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per aggregate")
+    parser.add_argument("--workers", type=int, default=1, help="load_csv writer threads")
+    parser.add_argument("--batch-size", type=int, default=1000, help="load_csv documents per write")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    run(args.backend, args.docs, args.repeat, args.workers, args.batch_size, args.csv)
+
+if __name__ == "__main__":
+    main()
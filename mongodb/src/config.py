@@ -4,10 +4,21 @@ from dotenv import load_dotenv
 load_dotenv()
 
 MONGODB_URI = os.getenv("MONGODB_URI")
+# "pymongo" (MONGODB_URI server) or "mongomock" (in-process stand-in for local runs and benchmarks)
+MONGO_BACKEND = os.getenv("MONGO_BACKEND", "pymongo")
 DB_NAME = os.getenv("DB_NAME", "student_performance_db")
 COLLECTION_NAME = os.getenv("COLLECTION_NAME", "students")
+# Denormalized MySQL students written by sync_mongo.py (one document per student_id)
+COMPLETE_COLLECTION_NAME = os.getenv("COMPLETE_COLLECTION_NAME", "complete_students")
 
-DATA_CSV_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "student_performance_data.csv")
-
-
+# Connection pool (shared by every helper in this package)
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "50"))
+MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", "0"))
+MONGO_MAX_IDLE_TIME_MS = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "300000"))
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "5000"))
+MONGO_CONNECT_TIMEOUT_MS = int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", "5000"))
+MONGO_SOCKET_TIMEOUT_MS = int(os.getenv("MONGO_SOCKET_TIMEOUT_MS", "30000"))
+# Comma-separated wire compressors, e.g. "zstd,snappy,zlib" (zstd/snappy need extra packages)
+MONGO_COMPRESSORS = os.getenv("MONGO_COMPRESSORS", "")
 
+DATA_CSV_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "student_perfomance_data.csv")
@@ -1,21 +1,167 @@
-from pymongo import ASCENDING, DESCENDING
-from .mongodb_client import get_collection
+import argparse
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import OperationFailure
+from .mongodb_client import get_collection, get_db
+from .aggregate import (
+    avg_scores_by_gender_pipeline, top_n_by_math_pipeline, score_distribution_pipeline
+)
 
-def main():
-    col = get_collection()
-    print(f"Creating indexes on '{col.name}'...")
+# Declared indexes for the students collection. Anything else found on the
+# collection is reported as unmanaged (and dropped with --drop-unlisted).
+INDEX_SPECS = [
+    {"name": "idx_race", "keys": [("race", ASCENDING)]},
+    {"name": "idx_created_at_desc", "keys": [("created_at", DESCENDING)]},
+    # Covers top_n_by_math (sort on math_score, project gender/race/math_score)
+    # and score_distribution; replaces the single-field idx_math_score_desc
+    {"name": "idx_math_gender_race", "keys": [("math_score", DESCENDING), ("gender", ASCENDING), ("race", ASCENDING)]},
+    # avg_scores_by_gender (and the gender_scores rollup) sort on gender before
+    # grouping, so they scan this index instead of the collection. Also serves
+    # gender-only lookups, which is why there is no separate idx_gender.
+    {"name": "idx_gender_scores", "keys": [
+        ("gender", ASCENDING), ("math_score", ASCENDING), ("reading_score", ASCENDING), ("writing_score", ASCENDING)
+    ]},
+    # Natural key used by load_data upserts; partial like load_data.ensure_source_row_index,
+    # so documents without source_row are not indexed
+    {"name": "uniq_source_row", "keys": [("source_row", ASCENDING)], "unique": True,
+     "partialFilterExpression": {"source_row": {"$exists": True}}},
+]
 
-    col.create_index([("gender", ASCENDING)], name="idx_gender")
-    col.create_index([("race", ASCENDING)], name="idx_race")
-    col.create_index([("math_score", DESCENDING)], name="idx_math_score_desc")
-    col.create_index([("created_at", DESCENDING)], name="idx_created_at_desc")
-    # Example compound index if you often filter by gender + course (if exists)
-    # col.create_index([("gender", ASCENDING), ("course", ASCENDING)], name="idx_gender_course")
+# Aggregate queries checked with explain(): (label, pipeline, expect covered)
+EXPLAIN_CHECKS = [
+    ("top_n_by_math", top_n_by_math_pipeline(5), True),
+    ("score_distribution", score_distribution_pipeline(10), True),
+    ("avg_scores_by_gender", avg_scores_by_gender_pipeline(), False),
+]
 
-    print("Indexes created.")
+def index_models():
+    return [
+        IndexModel(spec["keys"], name=spec["name"], **{k: v for k, v in spec.items() if k not in ("keys", "name")})
+        for spec in INDEX_SPECS
+    ]
 
-if __name__ == "__main__":
-    main()
+def build_indexes(col=None):
+    col = col if col is not None else get_collection()
+    models = index_models()
+    print(f"Creating {len(models)} indexes on '{col.name}'...")
+    names = col.create_indexes(models)
+    print(f"Indexes ready: {', '.join(names)}")
+    return names
+
+def unlisted_indexes(col=None):
+    """Indexes on the collection that are not declared in INDEX_SPECS"""
+    col = col if col is not None else get_collection()
+    declared = {spec["name"] for spec in INDEX_SPECS} | {"_id_"}
+    return [name for name in col.index_information() if name not in declared]
+
+def drop_unlisted(col=None):
+    col = col if col is not None else get_collection()
+    for name in unlisted_indexes(col):
+        col.drop_index(name)
+        print(f"Dropped unlisted index {name}")
+
+def _plan_stages(plan, stages=None, indexes=None):
+    """Collect stage names and index names from an explain plan tree"""
+    stages = [] if stages is None else stages
+    indexes = [] if indexes is None else indexes
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            stages.append(plan["stage"])
+        if "indexName" in plan:
+            indexes.append(plan["indexName"])
+        for value in plan.values():
+            _plan_stages(value, stages, indexes)
+    elif isinstance(plan, list):
+        for item in plan:
+            _plan_stages(item, stages, indexes)
+    return stages, indexes
+
+def _winning_plans(explain: dict):
+    """winningPlan sections of an aggregate explain (top level or inside $cursor stages)"""
+    plans = []
+    if "queryPlanner" in explain:
+        plans.append(explain["queryPlanner"]["winningPlan"])
+    for stage in explain.get("stages", []):
+        cursor = stage.get("$cursor", {})
+        if "queryPlanner" in cursor:
+            plans.append(cursor["queryPlanner"]["winningPlan"])
+    return plans
+
+def explain_pipeline(pipeline, col=None) -> dict:
+    """
+    Summarize the query plan MongoDB picks for an aggregation pipeline
 
+    Returns:
+        Dictionary with the plan stages, indexes used and whether the
+        query is covered (IXSCAN without FETCH or COLLSCAN)
+    """
+    col = col if col is not None else get_collection()
+    explain = get_db().command(
+        "explain", {"aggregate": col.name, "pipeline": pipeline, "cursor": {}}, verbosity="queryPlanner"
+    )
+    stages, indexes = _plan_stages(_winning_plans(explain))
+    return {
+        "stages": stages,
+        "indexes": sorted(set(indexes)),
+        "ixscan": "IXSCAN" in stages,
+        "covered": "IXSCAN" in stages and "FETCH" not in stages and "COLLSCAN" not in stages,
+    }
 
+def check_plans(col=None) -> bool:
+    """Explain each EXPLAIN_CHECKS query and report whether it uses (and is covered by) an index"""
+    ok = True
+    for label, pipeline, expect_covered in EXPLAIN_CHECKS:
+        plan = explain_pipeline(pipeline, col)
+        if expect_covered:
+            passed = plan["covered"]
+        else:
+            passed = plan["ixscan"]
+        ok = ok and passed
+        status = "OK" if passed else "CHECK"
+        print(f"[{status}] {label}: stages={plan['stages']} indexes={plan['indexes']} covered={plan['covered']}")
+    return ok
 
+def unused_indexes(col=None):
+    """Indexes with zero accesses in $indexStats (counters reset when mongod restarts)"""
+    col = col if col is not None else get_collection()
+    stats = list(col.aggregate([{"$indexStats": {}}]))
+    return [
+        {"name": s["name"], "since": s["accesses"]["since"]}
+        for s in stats
+        if s["name"] != "_id_" and s["accesses"]["ops"] == 0
+    ]
+
+def report_unused(col=None):
+    unused = unused_indexes(col)
+    if not unused:
+        print("Every index has been used since the last restart.")
+    for index in unused:
+        print(f"Unused index {index['name']} (no accesses since {index['since']})")
+    for name in unlisted_indexes(col):
+        print(f"Unlisted index {name} (not in INDEX_SPECS)")
+    return unused
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Manage indexes on the students collection")
+    parser.add_argument("action", nargs="?", default="build", choices=["build", "explain", "unused", "all"])
+    parser.add_argument("--drop-unlisted", action="store_true",
+                        help="Drop indexes that are not declared in INDEX_SPECS")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    col = get_collection()
+    try:
+        if args.action in ("build", "all"):
+            build_indexes(col)
+            if args.drop_unlisted:
+                drop_unlisted(col)
+        if args.action in ("explain", "all"):
+            check_plans(col)
+        if args.action in ("unused", "all"):
+            report_unused(col)
+    except OperationFailure as e:
+        print(f"Index operation failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,18 @@
 from datetime import datetime, timezone
 from bson.objectid import ObjectId
-from .mongodb_client import get_collection
+from .config import COMPLETE_COLLECTION_NAME
+from .mongodb_client import get_collection, get_db
+from . import rollups
+
+def new_student_doc(doc: dict) -> dict:
+    """Copy of `doc` stamped with created_at (shared with async_crud)"""
+    return {**doc, "created_at": datetime.now(timezone.utc)}
 
 def create_student(doc: dict):
     col = get_collection()
-    doc = {**doc, "created_at": datetime.now(timezone.utc)}
+    doc = new_student_doc(doc)
     res = col.insert_one(doc)
+    rollups.apply_insert({**doc, "_id": res.inserted_id})
     print(f"Created _id: {res.inserted_id}")
     return res.inserted_id
 
@@ -20,15 +27,23 @@ def read_latest(limit: int = 5):
 def update_one_by_id(_id: str, updates: dict):
     col = get_collection()
     res = col.update_one({"_id": ObjectId(_id)}, {"$set": updates})
+    if res.modified_count:
+        rollups.mark_stale()
     print(f"Matched: {res.matched_count}, modified: {res.modified_count}")
     return res.modified_count
 
 def delete_one_by_id(_id: str):
     col = get_collection()
     res = col.delete_one({"_id": ObjectId(_id)})
+    if res.deleted_count:
+        rollups.mark_stale()
     print(f"Deleted: {res.deleted_count}")
     return res.deleted_count
 
+def read_complete_student(student_id: int):
+    """Complete student synced from MySQL (student, academic, environmental, latest prediction)"""
+    return get_db()[COMPLETE_COLLECTION_NAME].find_one({"_id": student_id})
+
 def main():
     # CREATE
     new_id = create_student({
@@ -1,19 +1,174 @@
-import pandas as pd
+import argparse
+import csv
+import os
+from concurrent.futures import ThreadPoolExecutor
+from bson import ObjectId, json_util
 from .mongodb_client import get_collection
 
-def main():
+EXPORT_FORMATS = ("csv", "ndjson", "parquet")
+
+def to_export_value(value):
+    # ObjectIds are written as strings so every format can hold them
+    if isinstance(value, ObjectId):
+        return str(value)
+    return value
+
+def build_projection(fields=None) -> dict:
+    if fields:
+        return {**{f: 1 for f in fields}, "_id": 0}
+    return {"_id": 0}
+
+def iter_row_groups(col, query=None, fields=None, batch_size=2000, row_group_size=10000, limit=None):
+    """
+    Iterate a projected cursor and yield lists of at most row_group_size rows
+
+    Only one row group is held in memory at a time; the server returns
+    batch_size documents per round trip.
+    """
+    cursor = col.find(query or {}, build_projection(fields), batch_size=batch_size)
+    if limit:
+        cursor = cursor.limit(limit)
+    group = []
+    for doc in cursor:
+        group.append({k: to_export_value(v) for k, v in doc.items()})
+        if len(group) >= row_group_size:
+            yield group
+            group = []
+    if group:
+        yield group
+
+def write_csv(path, row_groups, fields=None) -> int:
+    """Header comes from `fields` or the first document; unknown keys in later rows are dropped"""
+    rows = 0
+    with open(path, "w", newline="") as f:
+        writer = None
+        for group in row_groups:
+            if writer is None:
+                writer = csv.DictWriter(f, fieldnames=fields or list(group[0].keys()), extrasaction="ignore")
+                writer.writeheader()
+            writer.writerows(group)
+            rows += len(group)
+    return rows
+
+def write_ndjson(path, row_groups, fields=None) -> int:
+    rows = 0
+    with open(path, "w") as f:
+        for group in row_groups:
+            f.write("".join(json_util.dumps(doc) + "\n" for doc in group))
+            rows += len(group)
+    return rows
+
+def write_parquet(path, row_groups, fields=None) -> int:
+    """One Parquet row group per row group; the schema is inferred from the first one"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Parquet export requires pyarrow (pip install pyarrow)")
+
+    rows = 0
+    writer = None
+    try:
+        for group in row_groups:
+            if writer is None:
+                table = pa.Table.from_pylist(group)
+                if fields:
+                    table = table.select([f for f in fields if f in table.column_names])
+                writer = pq.ParquetWriter(path, table.schema)
+            else:
+                table = pa.Table.from_pylist(group, schema=writer.schema)
+            writer.write_table(table)
+            rows += len(group)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+WRITERS = {"csv": write_csv, "ndjson": write_ndjson, "parquet": write_parquet}
+
+def export(path, fmt="csv", query=None, fields=None, batch_size=2000, row_group_size=10000, limit=None, col=None):
+    col = col if col is not None else get_collection()
+    groups = iter_row_groups(col, query, fields, batch_size, row_group_size, limit)
+    return WRITERS[fmt](path, groups, fields)
+
+def range_bounds(col, field, query, parts):
+    """Split [min, max] of a numeric field into `parts` half-open ranges (last one closed)"""
+    query = query or {}
+    first = col.find_one({**query, field: {"$type": "number"}}, {field: 1}, sort=[(field, 1)])
+    last = col.find_one({**query, field: {"$type": "number"}}, {field: 1}, sort=[(field, -1)])
+    if first is None:
+        return []
+    low, high = first[field], last[field]
+    step = (high - low) / parts
+    bounds = []
+    for i in range(parts):
+        start = low + step * i
+        if i == parts - 1:
+            bounds.append({"$gte": start, "$lte": high})
+        else:
+            bounds.append({"$gte": start, "$lt": low + step * (i + 1)})
+    return bounds
+
+def part_path(path, index):
+    root, ext = os.path.splitext(path)
+    return f"{root}.part{index}{ext}"
+
+def export_parallel(path, fmt="csv", query=None, fields=None, parts=4, range_field="source_row",
+                    batch_size=2000, row_group_size=10000):
+    """
+    Export `parts` ranges of range_field concurrently, one output file per range
+
+    range_field should be indexed (source_row is, via uniq_source_row).
+    """
     col = get_collection()
-    docs = list(col.find({}, {"_id": 0}).limit(20))
-    if not docs:
+    bounds = range_bounds(col, range_field, query, parts)
+
+    def export_part(item):
+        index, bound = item
+        part_query = {**(query or {}), range_field: bound}
+        return part_path(path, index), export(part_path(path, index), fmt, part_query, fields,
+                                             batch_size, row_group_size, col=col)
+
+    with ThreadPoolExecutor(max_workers=max(1, len(bounds))) as pool:
+        return list(pool.map(export_part, enumerate(bounds)))
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Export the students collection")
+    parser.add_argument("--out", default="sample_export.csv", help="Output file (format from extension)")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, help="Override the output format")
+    parser.add_argument("--fields", help="Comma-separated fields to export (default: all but _id)")
+    parser.add_argument("--filter", help='Extended JSON query, e.g. \'{"gender": "male"}\'')
+    parser.add_argument("--limit", type=int, help="Export at most this many documents")
+    parser.add_argument("--batch-size", type=int, default=2000, help="Documents per cursor round trip")
+    parser.add_argument("--row-group-size", type=int, default=10000, help="Rows buffered per write")
+    parser.add_argument("--parallel", type=int, default=1, help="Concurrent range exports (one file each)")
+    parser.add_argument("--range-field", default="source_row", help="Numeric field to split on with --parallel")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    fmt = args.format or os.path.splitext(args.out)[1].lstrip(".").lower()
+    if fmt not in EXPORT_FORMATS:
+        raise SystemExit(f"Unsupported export format: {fmt}")
+    fields = [f.strip() for f in args.fields.split(",")] if args.fields else None
+    query = json_util.loads(args.filter) if args.filter else None
+
+    if args.parallel > 1:
+        if args.limit:
+            raise SystemExit("--limit cannot be combined with --parallel")
+        results = export_parallel(args.out, fmt, query, fields, args.parallel, args.range_field,
+                                  args.batch_size, args.row_group_size)
+        if not results:
+            print("No documents to export. Did you run load_data.py?")
+        for path, rows in results:
+            print(f"Wrote {rows} rows to {path}")
+        return
+
+    rows = export(args.out, fmt, query, fields, args.batch_size, args.row_group_size, args.limit)
+    if not rows:
         print("No documents to export. Did you run load_data.py?")
         return
-    df = pd.DataFrame(docs)
-    out_path = "sample_export.csv"
-    df.to_csv(out_path, index=False)
-    print(f"Wrote {len(df)} rows to {out_path}")
+    print(f"Wrote {rows} rows to {args.out}")
 
 if __name__ == "__main__":
     main()
-
-
-
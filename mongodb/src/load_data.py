@@ -1,8 +1,52 @@
+import argparse
+import math
 import re
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime, timezone
+import numpy as np
 import pandas as pd
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 from .config import DATA_CSV_PATH
 from .mongodb_client import get_collection
+from . import rollups
+
+# Natural key for upserts: 1-based data row number in the source CSV
+SOURCE_ROW_FIELD = "source_row"
+SOURCE_ROW_INDEX = "uniq_source_row"
+# Partial so documents without source_row (crud.create_student, older loads)
+# are not all indexed as a duplicate null key
+SOURCE_ROW_PARTIAL_FILTER = {SOURCE_ROW_FIELD: {"$exists": True}}
+DUPLICATE_KEY_ERROR = 11000
+
+LEVELS = ["Low", "Medium", "High"]
+YES_NO = ["Yes", "No"]
+
+# Typed schema for the shipped CSV, applied by read_csv while parsing. Small
+# nullable integers become BSON int32; categories match the MySQL ENUMs and
+# values outside them (or blanks) are stored as null.
+CSV_DTYPES = {
+    "Hours_Studied": "Int8",
+    "Attendance": "Int16",
+    "Parental_Involvement": pd.CategoricalDtype(LEVELS),
+    "Access_to_Resources": pd.CategoricalDtype(LEVELS),
+    "Extracurricular_Activities": pd.CategoricalDtype(YES_NO),
+    "Sleep_Hours": "Int8",
+    "Previous_Scores": "Int16",
+    "Motivation_Level": pd.CategoricalDtype(LEVELS),
+    "Internet_Access": pd.CategoricalDtype(YES_NO),
+    "Tutoring_Sessions": "Int8",
+    "Family_Income": pd.CategoricalDtype(LEVELS),
+    "Teacher_Quality": pd.CategoricalDtype(LEVELS),
+    "School_Type": pd.CategoricalDtype(["Public", "Private"]),
+    "Peer_Influence": pd.CategoricalDtype(["Positive", "Neutral", "Negative"]),
+    "Physical_Activity": "Int8",
+    "Learning_Disabilities": pd.CategoricalDtype(YES_NO),
+    "Parental_Education_Level": pd.CategoricalDtype(["High School", "College", "Postgraduate"]),
+    "Distance_from_Home": pd.CategoricalDtype(["Near", "Moderate", "Far"]),
+    "Gender": pd.CategoricalDtype(["Male", "Female"]),
+    "Exam_Score": "Int16",
+}
 
 def to_snake(s: str) -> str:
     s = s.strip().lower()
@@ -12,38 +56,148 @@ def to_snake(s: str) -> str:
     return s
 
 def coerce_numeric(df: pd.DataFrame) -> pd.DataFrame:
-    # Try to convert any column with "score", "age", "id" to numeric if possible
+    # Fallback for CSVs not covered by CSV_DTYPES: convert text columns whose
+    # name looks numeric ("score", "age", "id", ...) when every value parses
     for c in df.columns:
-        if any(k in c for k in ["score", "age", "id", "math", "reading", "writing"]):
-            df[c] = pd.to_numeric(df[c], errors="ignore")
+        if df[c].dtype != object or not any(k in c for k in ["score", "age", "id", "math", "reading", "writing"]):
+            continue
+        converted = pd.to_numeric(df[c], errors="coerce")
+        if converted.notna().sum() == df[c].notna().sum():
+            df[c] = converted
     return df
 
-def main():
-    print(f"Loading CSV from: {DATA_CSV_PATH}")
-    df = pd.read_csv(DATA_CSV_PATH)
+def to_bson_value(value):
+    """Convert numpy/pandas scalars to types BSON can encode (NaN/NA -> None)"""
+    if value is None or value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        return None if math.isnan(value) else float(value)
+    if isinstance(value, np.bool_):
+        return bool(value)
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    return value
+
+def chunk_to_documents(chunk: pd.DataFrame, first_row: int) -> list:
+    """Rows of a CSV chunk as BSON-ready dicts tagged with their source row number"""
+    columns = list(chunk.columns)
+    documents = []
+    for offset, row in enumerate(chunk.itertuples(index=False, name=None)):
+        doc = {column: to_bson_value(value) for column, value in zip(columns, row)}
+        doc[SOURCE_ROW_FIELD] = first_row + offset
+        documents.append(doc)
+    return documents
 
-    # Standardize columns
-    df.columns = [to_snake(c) for c in df.columns]
-    df = coerce_numeric(df)
+def iter_document_batches(csv_path: str, chunk_size: int = 5000, batch_size: int = 1000, start_row: int = 1):
+    """Yield lists of at most batch_size documents while reading the CSV chunk by chunk"""
+    reader = pd.read_csv(csv_path, chunksize=chunk_size, skiprows=range(1, start_row), dtype=CSV_DTYPES)
+    next_row = start_row
+    for chunk in reader:
+        chunk.columns = [to_snake(c) for c in chunk.columns]
+        chunk = coerce_numeric(chunk)
+        documents = chunk_to_documents(chunk, next_row)
+        next_row += len(chunk)
+        for i in range(0, len(documents), batch_size):
+            yield documents[i:i + batch_size]
 
-    # Add audit fields
-    df["created_at"] = datetime.now(timezone.utc)
+def insert_batch(col, documents: list, loaded_at: datetime) -> dict:
+    """insert_many(ordered=False); rows already present (duplicate source_row) are skipped"""
+    for doc in documents:
+        doc["created_at"] = loaded_at
+    try:
+        res = col.insert_many(documents, ordered=False)
+        return {"inserted": len(res.inserted_ids), "skipped": 0}
+    except BulkWriteError as e:
+        errors = e.details.get("writeErrors", [])
+        if any(err.get("code") != DUPLICATE_KEY_ERROR for err in errors):
+            raise
+        return {"inserted": e.details.get("nInserted", 0), "skipped": len(errors)}
 
-    records = df.to_dict(orient="records")
+def upsert_batch(col, documents: list, loaded_at: datetime) -> dict:
+    """Unordered bulk upsert keyed on source_row; created_at is only set on first insert"""
+    operations = [
+        UpdateOne(
+            {SOURCE_ROW_FIELD: doc[SOURCE_ROW_FIELD]},
+            {"$set": doc, "$setOnInsert": {"created_at": loaded_at}},
+            upsert=True
+        )
+        for doc in documents
+    ]
+    res = col.bulk_write(operations, ordered=False)
+    return {"inserted": res.upserted_count, "skipped": res.matched_count}
+
+def ensure_source_row_index(col):
+    """Create the partial unique source_row index, replacing a non-partial one from earlier loads"""
+    existing = col.index_information().get(SOURCE_ROW_INDEX)
+    if existing and existing.get("partialFilterExpression") != SOURCE_ROW_PARTIAL_FILTER:
+        col.drop_index(SOURCE_ROW_INDEX)
+    col.create_index(SOURCE_ROW_FIELD, unique=True, name=SOURCE_ROW_INDEX,
+                     partialFilterExpression=SOURCE_ROW_PARTIAL_FILTER)
+
+def load_csv(csv_path: str = DATA_CSV_PATH, chunk_size: int = 5000, batch_size: int = 1000,
+             workers: int = 4, mode: str = "upsert", start_row: int = 1) -> dict:
+    """
+    Stream a CSV into MongoDB in batches written by a small thread pool
+
+    At most 2 * workers batches are held in memory at once. With mode="upsert"
+    re-runs update existing documents instead of duplicating them.
+    """
+    if mode not in ("insert", "upsert"):
+        raise ValueError(f"Unsupported load mode: {mode}")
+    write_batch = upsert_batch if mode == "upsert" else insert_batch
 
     col = get_collection()
-    # Optional: Clear existing if you want a clean import each run
-    # col.delete_many({})
+    ensure_source_row_index(col)
+    loaded_at = datetime.now(timezone.utc)
+    totals = {"inserted": 0, "skipped": 0, "batches": 0}
+
+    def collect(done):
+        for future in done:
+            result = future.result()
+            totals["inserted"] += result["inserted"]
+            totals["skipped"] += result["skipped"]
+            totals["batches"] += 1
+        print(f"  {totals['batches']} batches: {totals['inserted']} new, {totals['skipped']} existing")
 
-    if not records:
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for documents in iter_document_batches(csv_path, chunk_size, batch_size, start_row):
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            pending.add(pool.submit(write_batch, col, documents, loaded_at))
+        if pending:
+            done, _ = wait(pending)
+            collect(done)
+
+    return totals
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load the student CSV into MongoDB")
+    parser.add_argument("--csv", default=DATA_CSV_PATH, help="CSV file to load")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="CSV rows read per chunk")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Documents per write")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent write threads")
+    parser.add_argument("--mode", choices=["upsert", "insert"], default="upsert",
+                        help="upsert on source_row (idempotent) or plain unordered inserts")
+    parser.add_argument("--start-row", type=int, default=1,
+                        help="Resume from this 1-based data row")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    print(f"Loading CSV from: {args.csv}")
+    totals = load_csv(args.csv, args.chunk_size, args.batch_size, args.workers, args.mode, args.start_row)
+
+    if not totals["batches"]:
         print("No records found in CSV.")
         return
 
-    res = col.insert_many(records)
-    print(f"Inserted {len(res.inserted_ids)} documents into '{col.name}'")
+    print(f"Loaded {totals['inserted']} new documents ({totals['skipped']} already present) "
+          f"into '{get_collection().name}'")
+    rollups.refresh_all()
 
 if __name__ == "__main__":
     main()
-
-
-
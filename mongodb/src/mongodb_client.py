@@ -1,15 +1,79 @@
+import atexit
+import threading
 from pymongo import MongoClient
-from .config import MONGODB_URI, DB_NAME, COLLECTION_NAME
+from .config import (
+    MONGODB_URI, MONGO_BACKEND, DB_NAME, COLLECTION_NAME,
+    MONGO_MAX_POOL_SIZE, MONGO_MIN_POOL_SIZE, MONGO_MAX_IDLE_TIME_MS,
+    MONGO_SERVER_SELECTION_TIMEOUT_MS, MONGO_CONNECT_TIMEOUT_MS, MONGO_SOCKET_TIMEOUT_MS,
+    MONGO_COMPRESSORS
+)
 
-def get_db():
+BACKENDS = ("pymongo", "mongomock")
+
+_client = None
+_backend = MONGO_BACKEND
+_client_lock = threading.Lock()
+
+def client_options() -> dict:
+    """MongoClient keyword arguments from the pool settings in config"""
+    options = {
+        "maxPoolSize": MONGO_MAX_POOL_SIZE,
+        "minPoolSize": MONGO_MIN_POOL_SIZE,
+        "maxIdleTimeMS": MONGO_MAX_IDLE_TIME_MS,
+        "serverSelectionTimeoutMS": MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        "connectTimeoutMS": MONGO_CONNECT_TIMEOUT_MS,
+        "socketTimeoutMS": MONGO_SOCKET_TIMEOUT_MS,
+    }
+    if MONGO_COMPRESSORS:
+        options["compressors"] = MONGO_COMPRESSORS
+    return options
+
+def get_backend() -> str:
+    return _backend
+
+def set_backend(backend: str):
+    """Switch client backend (closes the current shared client)"""
+    global _backend
+    if backend not in BACKENDS:
+        raise ValueError(f"Unsupported MONGO_BACKEND: {backend}")
+    close_client()
+    _backend = backend
+
+def _create_client():
+    if _backend == "mongomock":
+        try:
+            import mongomock
+        except ImportError:
+            raise RuntimeError("MONGO_BACKEND=mongomock requires mongomock (pip install mongomock)")
+        # In-memory and per-process: no server, $merge/$indexStats/explain are unsupported
+        return mongomock.MongoClient()
+    if _backend != "pymongo":
+        raise ValueError(f"Unsupported MONGO_BACKEND: {_backend}")
     if not MONGODB_URI:
         raise RuntimeError("MONGODB_URI is not set. Check your .env.")
-    client = MongoClient(MONGODB_URI)
-    return client[DB_NAME]
+    return MongoClient(MONGODB_URI, **client_options())
 
-def get_collection():
-    db = get_db()
-    return db[COLLECTION_NAME]
+def get_client() -> MongoClient:
+    """Process-wide client for the configured backend; created on first use and reused afterwards"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = _create_client()
+                atexit.register(close_client)
+    return _client
 
+def close_client():
+    """Close the shared client and its pool (the next get_client() reconnects)"""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
 
+def get_db():
+    return get_client()[DB_NAME]
 
+def get_collection():
+    db = get_db()
+    return db[COLLECTION_NAME]
@@ -0,0 +1,159 @@
+import os
+from datetime import datetime, timezone
+from numbers import Number
+from .config import COLLECTION_NAME
+from .mongodb_client import get_collection, get_db
+
+# Rollups older than this are ignored and the live pipeline runs instead
+ROLLUP_MAX_AGE_SECONDS = int(os.getenv("ROLLUP_MAX_AGE_SECONDS", "3600"))
+# Number of top math scores kept (top_n_by_math(n) reads the rollup for n <= this)
+ROLLUP_TOP_N = int(os.getenv("ROLLUP_TOP_N", "100"))
+# Bucket width precomputed for score_distribution
+ROLLUP_BUCKET_WIDTH = int(os.getenv("ROLLUP_BUCKET_WIDTH", "10"))
+
+GENDER_SCORES = "gender_scores"
+SCORE_BUCKETS = "score_buckets"
+TOP_MATH = "top_math"
+ROLLUPS = (GENDER_SCORES, SCORE_BUCKETS, TOP_MATH)
+SCORE_FIELDS = ("math", "reading", "writing")
+
+def rollup_collection(name: str):
+    return get_db()[f"{COLLECTION_NAME}_rollup_{name}"]
+
+def meta_collection():
+    return get_db()[f"{COLLECTION_NAME}_rollup_meta"]
+
+def _is_number(value) -> bool:
+    return isinstance(value, Number) and not isinstance(value, bool) and value == value
+
+def _merge_into(name: str, refreshed_at: datetime):
+    """Final stages: stamp refreshed_at and upsert into the rollup collection by _id"""
+    return [
+        {"$set": {"refreshed_at": refreshed_at}},
+        {"$merge": {
+            "into": rollup_collection(name).name,
+            "on": "_id",
+            "whenMatched": "replace",
+            "whenNotMatched": "insert"
+        }}
+    ]
+
+def gender_scores_pipeline(refreshed_at: datetime):
+    # Sums and counts rather than averages so inserts can be applied with $inc
+    group = {"_id": "$gender", "count": {"$sum": 1}}
+    for field in SCORE_FIELDS:
+        score = f"${field}_score"
+        group[f"{field}_sum"] = {"$sum": score}
+        group[f"{field}_n"] = {"$sum": {"$cond": [{"$isNumber": score}, 1, 0]}}
+    return [{"$sort": {"gender": 1}}, {"$group": group}] + _merge_into(GENDER_SCORES, refreshed_at)
+
+def score_buckets_pipeline(refreshed_at: datetime, bucket: int = ROLLUP_BUCKET_WIDTH):
+    return [
+        {"$match": {"math_score": {"$type": "number"}}},
+        {"$group": {
+            "_id": {"$multiply": [{"$floor": {"$divide": ["$math_score", bucket]}}, bucket]},
+            "count": {"$sum": 1}
+        }}
+    ] + _merge_into(SCORE_BUCKETS, refreshed_at)
+
+def top_math_pipeline(refreshed_at: datetime, n: int = ROLLUP_TOP_N):
+    return [
+        {"$sort": {"math_score": -1}},
+        {"$limit": n},
+        {"$project": {"gender": 1, "race": 1, "math_score": 1}}
+    ] + _merge_into(TOP_MATH, refreshed_at)
+
+ROLLUP_PIPELINES = {
+    GENDER_SCORES: gender_scores_pipeline,
+    SCORE_BUCKETS: score_buckets_pipeline,
+    TOP_MATH: top_math_pipeline,
+}
+
+def refresh_rollup(name: str):
+    """Recompute one rollup with $merge, then drop groups the refresh no longer produced"""
+    refreshed_at = datetime.now(timezone.utc)
+    get_collection().aggregate(ROLLUP_PIPELINES[name](refreshed_at))
+    # $ne rather than $lt: rows upserted by apply_insert carry no refreshed_at
+    rollup_collection(name).delete_many({"refreshed_at": {"$ne": refreshed_at}})
+    meta_collection().update_one(
+        {"_id": name},
+        {"$set": {"refreshed_at": refreshed_at, "stale": False}},
+        upsert=True
+    )
+    return refreshed_at
+
+def refresh_all():
+    for name in ROLLUPS:
+        refresh_rollup(name)
+        print(f"Refreshed rollup '{name}'")
+
+def is_fresh(name: str) -> bool:
+    """True if the rollup exists, is not marked stale and is within ROLLUP_MAX_AGE_SECONDS"""
+    meta = meta_collection().find_one({"_id": name})
+    if not meta or meta.get("stale"):
+        return False
+    refreshed_at = meta["refreshed_at"]
+    if refreshed_at.tzinfo is None:
+        refreshed_at = refreshed_at.replace(tzinfo=timezone.utc)
+    return (datetime.now(timezone.utc) - refreshed_at).total_seconds() <= ROLLUP_MAX_AGE_SECONDS
+
+def mark_stale(*names: str):
+    """Force reads back to the live pipelines until the next refresh (after updates/deletes)"""
+    meta_collection().update_many({"_id": {"$in": list(names or ROLLUPS)}}, {"$set": {"stale": True}})
+
+def apply_insert(doc: dict):
+    """Fold one newly inserted student document into the fresh rollups"""
+    math_score = doc.get("math_score")
+
+    if is_fresh(GENDER_SCORES):
+        inc = {"count": 1}
+        for field in SCORE_FIELDS:
+            value = doc.get(f"{field}_score")
+            if _is_number(value):
+                inc[f"{field}_sum"] = value
+                inc[f"{field}_n"] = 1
+        rollup_collection(GENDER_SCORES).update_one({"_id": doc.get("gender")}, {"$inc": inc}, upsert=True)
+
+    if not _is_number(math_score):
+        return
+
+    if is_fresh(SCORE_BUCKETS):
+        bucket = (math_score // ROLLUP_BUCKET_WIDTH) * ROLLUP_BUCKET_WIDTH
+        rollup_collection(SCORE_BUCKETS).update_one({"_id": bucket}, {"$inc": {"count": 1}}, upsert=True)
+
+    if is_fresh(TOP_MATH) and "_id" in doc:
+        top = rollup_collection(TOP_MATH)
+        top.update_one(
+            {"_id": doc["_id"]},
+            {"$set": {"gender": doc.get("gender"), "race": doc.get("race"), "math_score": math_score}},
+            upsert=True
+        )
+        excess = top.count_documents({}) - ROLLUP_TOP_N
+        if excess > 0:
+            lowest = [d["_id"] for d in top.find({}, {"_id": 1}).sort("math_score", 1).limit(excess)]
+            top.delete_many({"_id": {"$in": lowest}})
+
+# Rollup readers (return the same shapes as the live pipelines in aggregate.py)
+def read_gender_averages():
+    rows = []
+    for d in rollup_collection(GENDER_SCORES).find({}).sort("_id", 1):
+        row = {"_id": d["_id"]}
+        for field in SCORE_FIELDS:
+            n = d.get(f"{field}_n", 0)
+            row[f"avg_{field}"] = d.get(f"{field}_sum", 0) / n if n else None
+        row["count"] = d["count"]
+        rows.append(row)
+    return rows
+
+def read_top_math(n: int):
+    projection = {"gender": 1, "race": 1, "math_score": 1, "_id": 0}
+    return list(rollup_collection(TOP_MATH).find({}, projection).sort("math_score", -1).limit(n))
+
+def read_score_buckets():
+    return list(rollup_collection(SCORE_BUCKETS).find({}, {"count": 1}).sort("_id", 1))
+
+def main():
+    refresh_all()
+
+if __name__ == "__main__":
+    main()
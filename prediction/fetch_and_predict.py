@@ -9,10 +9,12 @@ This script:
 5. Logs the prediction back to the database via API
 """
 
+import asyncio
+import httpx
 import requests
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional
 import os
 from dotenv import load_dotenv
 
@@ -21,13 +23,25 @@ load_dotenv()
 
 # API Configuration
 API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000/api")
+API_TIMEOUT = float(os.getenv("API_TIMEOUT", "10"))
+API_MAX_CONNECTIONS = int(os.getenv("API_MAX_CONNECTIONS", "20"))
+API_MAX_RETRIES = int(os.getenv("API_MAX_RETRIES", "3"))
+
+# Students per /students/complete/batch request (the API caps this at 1000)
+BATCH_SIZE = 500
+
+# Status codes worth retrying (overload / transient upstream errors)
+RETRY_STATUS_CODES = {429, 502, 503, 504}
 
 
 class StudentDataFetcher:
     """Handles fetching student data from the API"""
     
-    def __init__(self, base_url: str = API_BASE_URL):
+    def __init__(self, base_url: str = API_BASE_URL, timeout: float = API_TIMEOUT):
         self.base_url = base_url
+        self.timeout = timeout
+        # One session so repeated calls reuse the keep-alive connection
+        self.session = requests.Session()
     
     def get_latest_student(self) -> Optional[Dict[str, Any]]:
         """
@@ -38,7 +52,7 @@ class StudentDataFetcher:
         """
         try:
             # Get all students and select the latest one
-            response = requests.get(f"{self.base_url}/students/")
+            response = self.session.get(f"{self.base_url}/students/", timeout=self.timeout)
             response.raise_for_status()
             
             students = response.json()
@@ -71,7 +85,9 @@ class StudentDataFetcher:
             Complete student data dictionary
         """
         try:
-            response = requests.get(f"{self.base_url}/students/{student_id}/complete/")
+            response = self.session.get(
+                f"{self.base_url}/students/{student_id}/complete/", timeout=self.timeout
+            )
             response.raise_for_status()
             
             student_data = response.json()
@@ -95,6 +111,153 @@ class StudentDataFetcher:
         return self.get_complete_student_data(student_id)
 
 
+class AsyncStudentDataFetcher:
+    """
+    Fetches student data concurrently over a pooled httpx.AsyncClient
+
+    Usage:
+        async with AsyncStudentDataFetcher() as fetcher:
+            students = await fetcher.fetch_many([1, 2, 3])
+    """
+    
+    def __init__(
+        self,
+        base_url: str = API_BASE_URL,
+        timeout: float = API_TIMEOUT,
+        max_connections: int = API_MAX_CONNECTIONS,
+        max_retries: int = API_MAX_RETRIES,
+        backoff_factor: float = 0.5
+    ):
+        """
+        Args:
+            base_url: API base URL
+            timeout: Per-request timeout in seconds
+            max_connections: Connection pool size (also the default concurrency)
+            max_retries: Retries for connection errors and retryable status codes
+            backoff_factor: Base delay for exponential backoff between retries
+        """
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.client: Optional[httpx.AsyncClient] = None
+    
+    async def __aenter__(self):
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(self.timeout),
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections
+            )
+        )
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.client.aclose()
+        self.client = None
+    
+    async def _get(self, path: str, **kwargs) -> Optional[Any]:
+        """
+        GET a path with retries and exponential backoff
+        
+        Returns:
+            Decoded JSON body, or None for 404 / exhausted retries
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await self.client.get(path, **kwargs)
+                if response.status_code == 404:
+                    return None
+                if response.status_code not in RETRY_STATUS_CODES:
+                    response.raise_for_status()
+                    return response.json()
+                error = httpx.HTTPStatusError(
+                    f"Retryable status {response.status_code}", request=response.request, response=response
+                )
+            except httpx.TransportError as e:
+                error = e
+            except httpx.HTTPStatusError as e:
+                print(f"❌ Error fetching {path}: {e}")
+                return None
+            
+            if attempt < self.max_retries:
+                await asyncio.sleep(self.backoff_factor * (2 ** attempt))
+        
+        print(f"❌ Error fetching {path} after {self.max_retries + 1} attempts: {error}")
+        return None
+    
+    async def get_complete_student_data(self, student_id: int) -> Optional[Dict[str, Any]]:
+        """Fetch complete student data for one student"""
+        return await self._get(f"/students/{student_id}/complete/")
+    
+    async def get_complete_students_batch(self, student_ids: List[int]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch complete data for up to BATCH_SIZE students in one request
+        
+        Returns:
+            List of complete student records, or None if the batch endpoint is unavailable
+        """
+        return await self._get(
+            "/students/complete/batch",
+            params=[("ids", student_id) for student_id in student_ids]
+        )
+    
+    async def fetch_many(
+        self,
+        student_ids: Iterable[int],
+        concurrency: Optional[int] = None,
+        batch_size: int = BATCH_SIZE
+    ) -> Dict[int, Optional[Dict[str, Any]]]:
+        """
+        Fetch complete records for many students concurrently
+        
+        IDs are requested in chunks of `batch_size` through the batch endpoint,
+        falling back to one request per student if a chunk cannot be fetched.
+        
+        Args:
+            student_ids: Student IDs to fetch
+            concurrency: Maximum in-flight requests (defaults to the pool size)
+            batch_size: Students per batch request
+            
+        Returns:
+            Dictionary mapping student_id to complete data (None if unavailable)
+        """
+        student_ids = list(student_ids)
+        semaphore = asyncio.Semaphore(concurrency or self.max_connections)
+        fetched: Dict[int, Optional[Dict[str, Any]]] = {student_id: None for student_id in student_ids}
+        
+        async def fetch_one(student_id: int):
+            async with semaphore:
+                fetched[student_id] = await self.get_complete_student_data(student_id)
+        
+        async def fetch_chunk(chunk: List[int]):
+            async with semaphore:
+                records = await self.get_complete_students_batch(chunk)
+            if records is None:
+                await asyncio.gather(*(fetch_one(student_id) for student_id in chunk))
+                return
+            for record in records:
+                fetched[record['student']['student_id']] = record
+        
+        chunks = [student_ids[i:i + batch_size] for i in range(0, len(student_ids), batch_size)]
+        await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+        
+        found = sum(1 for data in fetched.values() if data is not None)
+        print(f"✓ Fetched complete data for {found}/{len(fetched)} students")
+        return fetched
+
+
+def fetch_students_concurrently(student_ids: List[int], **kwargs) -> Dict[int, Optional[Dict[str, Any]]]:
+    """Synchronous wrapper around AsyncStudentDataFetcher.fetch_many"""
+    async def run():
+        async with AsyncStudentDataFetcher(**kwargs) as fetcher:
+            return await fetcher.fetch_many(student_ids)
+    
+    return asyncio.run(run())
+
+
 class PredictionLogger:
     """Handles logging predictions back to the database"""
     
@@ -157,7 +320,7 @@ class PredictionLogger:
 def test_api_connection():
     """Test if the API is running and accessible"""
     try:
-        response = requests.get(f"{API_BASE_URL.replace('/api', '')}/")
+        response = requests.get(f"{API_BASE_URL.replace('/api', '')}/", timeout=API_TIMEOUT)
         response.raise_for_status()
         print("✓ API is running and accessible")
         return True
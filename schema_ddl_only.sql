@@ -30,7 +30,7 @@ CREATE TABLE academic_records (
     
     FOREIGN KEY (student_id) REFERENCES students(student_id) ON DELETE CASCADE,
     INDEX idx_student_academic (student_id),
-    INDEX idx_exam_score (exam_score),
+    INDEX idx_exam_score_student (exam_score, student_id),
     INDEX idx_created_at (created_at)
 );
 
@@ -51,11 +51,13 @@ CREATE TABLE environmental_factors (
     physical_activity INT CHECK (physical_activity >= 0 AND physical_activity <= 10),
     parental_education_level ENUM('High School', 'College', 'Postgraduate') DEFAULT 'High School',
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     
     FOREIGN KEY (student_id) REFERENCES students(student_id) ON DELETE CASCADE,
     INDEX idx_student_env (student_id),
     INDEX idx_parental_involvement (parental_involvement),
-    INDEX idx_school_type (school_type)
+    INDEX idx_school_motivation (school_type, motivation_level, student_id),
+    INDEX idx_env_updated_at (updated_at)
 );
 
 -- TABLE 4: PREDICTIONS (ML Results)
@@ -65,24 +67,57 @@ CREATE TABLE predictions (
     predicted_score DECIMAL(5,2) CHECK (predicted_score >= 0 AND predicted_score <= 110),
     actual_score INT NULL CHECK (actual_score >= 0 AND actual_score <= 110),
     confidence_score DECIMAL(5,4) CHECK (confidence_score >= 0 AND confidence_score <= 1),
+    model_version VARCHAR(20) NOT NULL DEFAULT 'v1.0',
     prediction_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     
     FOREIGN KEY (student_id) REFERENCES students(student_id) ON DELETE CASCADE,
     INDEX idx_student_predictions (student_id),
-    INDEX idx_prediction_date (prediction_date)
+    INDEX idx_prediction_date (prediction_date),
+    INDEX idx_model_version_date (model_version, prediction_date)
 );
 
--- TABLE 5: AUDIT_LOG (For Trigger)
+-- TABLE 5: STUDENT_PREDICTION_SUMMARY (Maintained by prediction triggers)
+CREATE TABLE student_prediction_summary (
+    student_id INT PRIMARY KEY,
+    latest_prediction_id INT NOT NULL,
+    latest_predicted_score DECIMAL(5,2),
+    latest_confidence_score DECIMAL(5,4),
+    prediction_count INT NOT NULL DEFAULT 0,
+    predicted_score_count INT NOT NULL DEFAULT 0,
+    predicted_score_total DECIMAL(14,2) NOT NULL DEFAULT 0,
+    avg_predicted_score DECIMAL(7,4),
+    last_prediction_date TIMESTAMP NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+
+    FOREIGN KEY (student_id) REFERENCES students(student_id) ON DELETE CASCADE,
+    INDEX idx_summary_last_prediction (last_prediction_date)
+);
+
+-- TABLE 6: AUDIT_LOG (For Trigger)
+-- Range partitioned by month on change_timestamp so retention is a partition
+-- drop. Monthly partitions are split off p_future by manage_audit_log.py
+-- (run automatically by scripts/setup_and_populate.py).
 CREATE TABLE audit_log (
-    log_id INT PRIMARY KEY AUTO_INCREMENT,
+    log_id INT NOT NULL AUTO_INCREMENT,
     table_name VARCHAR(50) NOT NULL,
     operation ENUM('INSERT', 'UPDATE', 'DELETE') NOT NULL,
     record_id INT NOT NULL,
     old_values JSON NULL,
     new_values JSON NULL,
     changed_by VARCHAR(100) DEFAULT 'system',
-    change_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    change_timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    
+    -- VIRTUAL: nothing is stored; exam scores are extracted from the JSON when
+    -- read, so the viewer gets typed values without decoding JSON in Python
+    old_exam_score INT GENERATED ALWAYS AS (JSON_VALUE(old_values, '$.exam_score' RETURNING SIGNED)) VIRTUAL,
+    new_exam_score INT GENERATED ALWAYS AS (JSON_VALUE(new_values, '$.exam_score' RETURNING SIGNED)) VIRTUAL,
     
+    PRIMARY KEY (log_id, change_timestamp),
     INDEX idx_table_operation (table_name, operation),
-    INDEX idx_change_timestamp (change_timestamp)
+    INDEX idx_change_timestamp (change_timestamp),
+    INDEX idx_record_history (table_name, record_id, change_timestamp)
+)
+PARTITION BY RANGE (UNIX_TIMESTAMP(change_timestamp)) (
+    PARTITION p_history VALUES LESS THAN (UNIX_TIMESTAMP('2026-01-01 00:00:00')),
+    PARTITION p_future VALUES LESS THAN MAXVALUE
 );
@@ -0,0 +1,107 @@
+-- STUDENT PERFORMANCE DATABASE SCHEMA (SQLITE DDL)
+-- Same tables, constraints and indexes as schema_ddl_only.sql for running
+-- without a MySQL server (DB_ENGINE=sqlite). ENUM columns become TEXT with a
+-- CHECK constraint; timestamps are stored as 'YYYY-MM-DD HH:MM:SS' local time.
+-- Executed by SQLiteDatabaseManager.execute_schema on a fresh database file.
+
+-- TABLE 1: STUDENTS (Main Entity)
+CREATE TABLE students (
+    student_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    gender TEXT NOT NULL CHECK (gender IN ('Male', 'Female')),
+    learning_disabilities TEXT NOT NULL DEFAULT 'No' CHECK (learning_disabilities IN ('Yes', 'No')),
+    distance_from_home TEXT DEFAULT 'Moderate' CHECK (distance_from_home IN ('Near', 'Moderate', 'Far')),
+    created_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+    updated_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+CREATE INDEX idx_gender ON students (gender);
+CREATE INDEX idx_learning_disabilities ON students (learning_disabilities);
+
+-- TABLE 2: ACADEMIC_RECORDS
+CREATE TABLE academic_records (
+    record_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    student_id INTEGER NOT NULL REFERENCES students (student_id) ON DELETE CASCADE,
+    hours_studied INTEGER CHECK (hours_studied >= 0 AND hours_studied <= 50),
+    attendance INTEGER CHECK (attendance >= 0 AND attendance <= 100),
+    previous_scores INTEGER CHECK (previous_scores >= 0 AND previous_scores <= 100),
+    tutoring_sessions INTEGER DEFAULT 0 CHECK (tutoring_sessions >= 0),
+    exam_score INTEGER CHECK (exam_score >= 0 AND exam_score <= 110),
+    created_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+CREATE INDEX idx_student_academic ON academic_records (student_id);
+CREATE INDEX idx_exam_score_student ON academic_records (exam_score, student_id);
+CREATE INDEX idx_created_at ON academic_records (created_at);
+
+-- TABLE 3: ENVIRONMENTAL_FACTORS
+CREATE TABLE environmental_factors (
+    env_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    student_id INTEGER NOT NULL REFERENCES students (student_id) ON DELETE CASCADE,
+    parental_involvement TEXT DEFAULT 'Medium' CHECK (parental_involvement IN ('Low', 'Medium', 'High')),
+    access_to_resources TEXT DEFAULT 'Medium' CHECK (access_to_resources IN ('Low', 'Medium', 'High')),
+    extracurricular_activities TEXT DEFAULT 'No' CHECK (extracurricular_activities IN ('Yes', 'No')),
+    sleep_hours INTEGER CHECK (sleep_hours >= 4 AND sleep_hours <= 12),
+    motivation_level TEXT DEFAULT 'Medium' CHECK (motivation_level IN ('Low', 'Medium', 'High')),
+    internet_access TEXT DEFAULT 'Yes' CHECK (internet_access IN ('Yes', 'No')),
+    family_income TEXT DEFAULT 'Medium' CHECK (family_income IN ('Low', 'Medium', 'High')),
+    teacher_quality TEXT DEFAULT 'Medium' CHECK (teacher_quality IN ('Low', 'Medium', 'High')),
+    school_type TEXT DEFAULT 'Public' CHECK (school_type IN ('Public', 'Private')),
+    peer_influence TEXT DEFAULT 'Neutral' CHECK (peer_influence IN ('Positive', 'Neutral', 'Negative')),
+    physical_activity INTEGER CHECK (physical_activity >= 0 AND physical_activity <= 10),
+    parental_education_level TEXT DEFAULT 'High School'
+        CHECK (parental_education_level IN ('High School', 'College', 'Postgraduate')),
+    created_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+    updated_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+CREATE INDEX idx_student_env ON environmental_factors (student_id);
+CREATE INDEX idx_parental_involvement ON environmental_factors (parental_involvement);
+CREATE INDEX idx_school_motivation ON environmental_factors (school_type, motivation_level, student_id);
+CREATE INDEX idx_env_updated_at ON environmental_factors (updated_at);
+
+-- TABLE 4: PREDICTIONS (ML Results)
+CREATE TABLE predictions (
+    prediction_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    student_id INTEGER NOT NULL REFERENCES students (student_id) ON DELETE CASCADE,
+    predicted_score DECIMAL(5,2) CHECK (predicted_score >= 0 AND predicted_score <= 110),
+    actual_score INTEGER NULL CHECK (actual_score >= 0 AND actual_score <= 110),
+    confidence_score DECIMAL(5,4) CHECK (confidence_score >= 0 AND confidence_score <= 1),
+    model_version VARCHAR(20) NOT NULL DEFAULT 'v1.0',
+    prediction_date TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+CREATE INDEX idx_student_predictions ON predictions (student_id);
+CREATE INDEX idx_prediction_date ON predictions (prediction_date);
+CREATE INDEX idx_model_version_date ON predictions (model_version, prediction_date);
+
+-- TABLE 5: STUDENT_PREDICTION_SUMMARY (Maintained by prediction triggers)
+CREATE TABLE student_prediction_summary (
+    student_id INTEGER PRIMARY KEY REFERENCES students (student_id) ON DELETE CASCADE,
+    latest_prediction_id INTEGER NOT NULL,
+    latest_predicted_score DECIMAL(5,2),
+    latest_confidence_score DECIMAL(5,4),
+    prediction_count INTEGER NOT NULL DEFAULT 0,
+    predicted_score_count INTEGER NOT NULL DEFAULT 0,
+    predicted_score_total DECIMAL(14,2) NOT NULL DEFAULT 0,
+    avg_predicted_score DECIMAL(7,4),
+    last_prediction_date TIMESTAMP NULL,
+    updated_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+CREATE INDEX idx_summary_last_prediction ON student_prediction_summary (last_prediction_date);
+
+-- TABLE 6: AUDIT_LOG (For Trigger)
+-- Not partitioned: retention on SQLite is a plain DELETE by change_timestamp.
+CREATE TABLE audit_log (
+    log_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    table_name VARCHAR(50) NOT NULL,
+    operation TEXT NOT NULL CHECK (operation IN ('INSERT', 'UPDATE', 'DELETE')),
+    record_id INTEGER NOT NULL,
+    old_values JSON NULL,
+    new_values JSON NULL,
+    changed_by VARCHAR(100) DEFAULT 'system',
+    change_timestamp TIMESTAMP NOT NULL DEFAULT (datetime('now', 'localtime')),
+
+    -- VIRTUAL: nothing is stored; exam scores are extracted from the JSON when
+    -- read, so the viewer gets typed values without decoding JSON in Python
+    old_exam_score INTEGER GENERATED ALWAYS AS (json_extract(old_values, '$.exam_score')) VIRTUAL,
+    new_exam_score INTEGER GENERATED ALWAYS AS (json_extract(new_values, '$.exam_score')) VIRTUAL
+);
+CREATE INDEX idx_table_operation ON audit_log (table_name, operation);
+CREATE INDEX idx_change_timestamp ON audit_log (change_timestamp);
+CREATE INDEX idx_record_history ON audit_log (table_name, record_id, change_timestamp);
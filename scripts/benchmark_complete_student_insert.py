@@ -0,0 +1,105 @@
+"""
+Benchmark complete-student writes: ORM inserts vs the InsertCompleteStudentRecord procedure
+
+Usage:
+    python scripts/benchmark_complete_student_insert.py [iterations]
+
+Every student created by the benchmark is deleted afterwards.
+"""
+import os
+import sys
+import time
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tabulate import tabulate
+
+from app.api import crud
+from app.database.connection import SessionLocal
+from app.models.database_models import Student
+from app.models.schemas import (
+    CompleteStudentCreate, StudentCreate, AcademicRecordBase, EnvironmentalFactorsBase
+)
+
+
+SAMPLE_STUDENT = CompleteStudentCreate(
+    student=StudentCreate(gender='Female', learning_disabilities='No', distance_from_home='Near'),
+    academic_record=AcademicRecordBase(
+        hours_studied=22, attendance=88, previous_scores=76, tutoring_sessions=2, exam_score=71
+    ),
+    environmental_factors=EnvironmentalFactorsBase(
+        parental_involvement='Medium', access_to_resources='High', extracurricular_activities='Yes',
+        sleep_hours=7, motivation_level='Medium', internet_access='Yes', family_income='Medium',
+        teacher_quality='High', school_type='Public', peer_influence='Positive',
+        physical_activity=3, parental_education_level='College'
+    )
+)
+
+
+def time_backend(name, create, iterations):
+    """Run `create(db)` `iterations` times and return latency stats plus created ids"""
+    db = SessionLocal()
+    latencies = []
+    created_ids = []
+    try:
+        for _ in range(iterations):
+            start = time.perf_counter()
+            created_ids.append(create(db))
+            latencies.append((time.perf_counter() - start) * 1000)
+    finally:
+        db.close()
+
+    latencies.sort()
+    return {
+        'backend': name,
+        'mean_ms': statistics.mean(latencies),
+        'p50_ms': latencies[len(latencies) // 2],
+        'p95_ms': latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        'created_ids': created_ids
+    }
+
+
+def cleanup(student_ids):
+    db = SessionLocal()
+    try:
+        db.query(Student).filter(Student.student_id.in_(student_ids)).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def run_benchmark(iterations=50):
+    print(f"\nComplete Student Insert Benchmark ({iterations} inserts per backend)")
+    print("=" * 70)
+
+    backends = [
+        ('orm', lambda db: crud.create_complete_student(db, SAMPLE_STUDENT, backend='orm').student.student_id),
+        ('procedure', lambda db: crud.insert_complete_student_procedure(db, SAMPLE_STUDENT)),
+        ('procedure + read back',
+         lambda db: crud.create_complete_student(db, SAMPLE_STUDENT, backend='procedure').student.student_id),
+    ]
+
+    results = []
+    try:
+        for name, create in backends:
+            results.append(time_backend(name, create, iterations))
+    finally:
+        created = [student_id for result in results for student_id in result['created_ids']]
+        if created:
+            cleanup(created)
+            print(f"✓ Cleaned up {len(created)} benchmark students")
+
+    table_data = [
+        [r['backend'], f"{r['mean_ms']:.2f}", f"{r['p50_ms']:.2f}", f"{r['p95_ms']:.2f}"]
+        for r in results
+    ]
+    print(tabulate(table_data, headers=['Backend', 'Mean (ms)', 'p50 (ms)', 'p95 (ms)'], tablefmt='grid'))
+    return results
+
+
+if __name__ == "__main__":
+    iterations = 50
+    if len(sys.argv) > 1:
+        iterations = int(sys.argv[1])
+    run_benchmark(iterations)
@@ -5,9 +5,10 @@ import sys
 
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
 
-from database.mysql_manager import MySQLDatabaseManager
+from database.storage import DB_ENGINE_SQLITE, get_database_manager, get_db_engine
 from database.data_populator import MySQLDataPopulator
 from database.data_verifier import MySQLDataVerifier
+from database.audit_partitions import AuditLogPartitionManager
 from utils.data_transformer import DataTransformer
 
 
@@ -40,6 +41,11 @@ def setup_database(db_manager):
     db_manager.execute_schema()
     db_manager.execute_procedures_and_triggers()
     
+    # SQLite has no table partitioning; audit_log is a single table there
+    if get_db_engine() != DB_ENGINE_SQLITE:
+        print("\nPartitioning audit log by month...")
+        AuditLogPartitionManager(db_manager).run('ensure_partitions', months_ahead=3)
+    
     print("\nTesting connection...")
     db_manager.test_connection()
 
@@ -77,7 +83,7 @@ def run_complete_setup():
     
     try:
         df = load_dataset()
-        db_manager = MySQLDatabaseManager()
+        db_manager = get_database_manager()
         setup_database(db_manager)
         students_df, academic_df, environmental_df = transform_data(df)
         populate_results = populate_database(db_manager, students_df, academic_df, environmental_df)
@@ -0,0 +1,270 @@
+-- ============================================================================
+-- TRIGGERS (SQLITE)
+-- Student Performance Database
+-- ============================================================================
+-- SQLite counterparts of the triggers in stored_procedures_and_triggers.sql.
+-- SQLite has no stored procedures; GetStudentPerformanceSummary,
+-- InsertCompleteStudentRecord and RebuildStudentPredictionSummary are
+-- emulated in Python by src/database/sqlite_manager.py (cursor.callproc).
+--
+-- The audit triggers call audit_triggers_enabled(), a function registered on
+-- every connection, in place of MySQL's @audit_triggers_disabled session
+-- variable (see set_audit_triggers_enabled in src/database/audit_logger.py).
+--
+-- Execute this file AFTER running schema_sqlite.sql
+-- ============================================================================
+
+
+-- ============================================================================
+-- TRIGGER 0: students_touch_updated_at
+-- ============================================================================
+-- Purpose: Emulates ON UPDATE CURRENT_TIMESTAMP for students.updated_at
+--          (and, below, environmental_factors.updated_at)
+-- ============================================================================
+
+DROP TRIGGER IF EXISTS students_touch_updated_at;
+
+CREATE TRIGGER students_touch_updated_at
+AFTER UPDATE ON students
+FOR EACH ROW
+WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE students SET updated_at = datetime('now', 'localtime') WHERE student_id = NEW.student_id;
+END;
+
+
+-- ============================================================================
+-- TRIGGER 0b: environmental_factors_touch_updated_at
+-- ============================================================================
+
+DROP TRIGGER IF EXISTS environmental_factors_touch_updated_at;
+
+CREATE TRIGGER environmental_factors_touch_updated_at
+AFTER UPDATE ON environmental_factors
+FOR EACH ROW
+WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE environmental_factors SET updated_at = datetime('now', 'localtime') WHERE env_id = NEW.env_id;
+END;
+
+
+-- ============================================================================
+-- TRIGGER 1: audit_academic_records_update
+-- ============================================================================
+
+DROP TRIGGER IF EXISTS audit_academic_records_update;
+
+CREATE TRIGGER audit_academic_records_update
+AFTER UPDATE ON academic_records
+FOR EACH ROW
+WHEN audit_triggers_enabled()
+BEGIN
+    INSERT INTO audit_log (table_name, operation, record_id, old_values, new_values, changed_by)
+    VALUES (
+        'academic_records',
+        'UPDATE',
+        NEW.record_id,
+        json_object(
+            'hours_studied', OLD.hours_studied,
+            'attendance', OLD.attendance,
+            'previous_scores', OLD.previous_scores,
+            'tutoring_sessions', OLD.tutoring_sessions,
+            'exam_score', OLD.exam_score
+        ),
+        json_object(
+            'hours_studied', NEW.hours_studied,
+            'attendance', NEW.attendance,
+            'previous_scores', NEW.previous_scores,
+            'tutoring_sessions', NEW.tutoring_sessions,
+            'exam_score', NEW.exam_score
+        ),
+        'system'
+    );
+END;
+
+
+-- ============================================================================
+-- TRIGGER 2: audit_predictions_insert
+-- ============================================================================
+
+DROP TRIGGER IF EXISTS audit_predictions_insert;
+
+CREATE TRIGGER audit_predictions_insert
+AFTER INSERT ON predictions
+FOR EACH ROW
+WHEN audit_triggers_enabled()
+BEGIN
+    INSERT INTO audit_log (table_name, operation, record_id, old_values, new_values, changed_by)
+    VALUES (
+        'predictions',
+        'INSERT',
+        NEW.prediction_id,
+        NULL,
+        json_object(
+            'student_id', NEW.student_id,
+            'predicted_score', NEW.predicted_score,
+            'actual_score', NEW.actual_score,
+            'confidence_score', NEW.confidence_score,
+            'model_version', NEW.model_version,
+            'prediction_date', NEW.prediction_date
+        ),
+        'ML_MODEL'
+    );
+END;
+
+
+-- ============================================================================
+-- TRIGGER 3: maintain_prediction_summary_insert
+-- ============================================================================
+-- Unlike MySQL, every assignment in DO UPDATE sees the row as it was before
+-- the update, so the average is computed from the incremented values
+-- (times 1.0: DECIMAL columns store whole scores as integers in SQLite).
+-- ============================================================================
+
+DROP TRIGGER IF EXISTS maintain_prediction_summary_insert;
+
+CREATE TRIGGER maintain_prediction_summary_insert
+AFTER INSERT ON predictions
+FOR EACH ROW
+BEGIN
+    INSERT INTO student_prediction_summary (
+        student_id,
+        latest_prediction_id,
+        latest_predicted_score,
+        latest_confidence_score,
+        prediction_count,
+        predicted_score_count,
+        predicted_score_total,
+        avg_predicted_score,
+        last_prediction_date
+    )
+    VALUES (
+        NEW.student_id,
+        NEW.prediction_id,
+        NEW.predicted_score,
+        NEW.confidence_score,
+        1,
+        NEW.predicted_score IS NOT NULL,
+        COALESCE(NEW.predicted_score, 0),
+        NEW.predicted_score,
+        NEW.prediction_date
+    )
+    ON CONFLICT (student_id) DO UPDATE SET
+        latest_prediction_id = CASE WHEN NEW.prediction_date >= last_prediction_date OR last_prediction_date IS NULL
+                                    THEN NEW.prediction_id ELSE latest_prediction_id END,
+        latest_predicted_score = CASE WHEN NEW.prediction_date >= last_prediction_date OR last_prediction_date IS NULL
+                                      THEN NEW.predicted_score ELSE latest_predicted_score END,
+        latest_confidence_score = CASE WHEN NEW.prediction_date >= last_prediction_date OR last_prediction_date IS NULL
+                                       THEN NEW.confidence_score ELSE latest_confidence_score END,
+        prediction_count = prediction_count + 1,
+        predicted_score_count = predicted_score_count + (NEW.predicted_score IS NOT NULL),
+        predicted_score_total = predicted_score_total + COALESCE(NEW.predicted_score, 0),
+        avg_predicted_score = (predicted_score_total + COALESCE(NEW.predicted_score, 0)) * 1.0
+                              / NULLIF(predicted_score_count + (NEW.predicted_score IS NOT NULL), 0),
+        last_prediction_date = MAX(COALESCE(last_prediction_date, NEW.prediction_date), NEW.prediction_date),
+        updated_at = datetime('now', 'localtime');
+END;
+
+
+-- ============================================================================
+-- TRIGGER 4: maintain_prediction_summary_delete
+-- ============================================================================
+
+DROP TRIGGER IF EXISTS maintain_prediction_summary_delete;
+
+CREATE TRIGGER maintain_prediction_summary_delete
+AFTER DELETE ON predictions
+FOR EACH ROW
+BEGIN
+    UPDATE student_prediction_summary
+    SET prediction_count = prediction_count - 1,
+        predicted_score_count = predicted_score_count - (OLD.predicted_score IS NOT NULL),
+        predicted_score_total = predicted_score_total - COALESCE(OLD.predicted_score, 0),
+        avg_predicted_score = (predicted_score_total - COALESCE(OLD.predicted_score, 0)) * 1.0
+                              / NULLIF(predicted_score_count - (OLD.predicted_score IS NOT NULL), 0),
+        updated_at = datetime('now', 'localtime')
+    WHERE student_id = OLD.student_id;
+
+    DELETE FROM student_prediction_summary
+    WHERE student_id = OLD.student_id AND prediction_count <= 0;
+
+    -- Only the removed row being the latest requires a (per-student) lookup
+    UPDATE student_prediction_summary
+    SET (latest_prediction_id, latest_predicted_score, latest_confidence_score, last_prediction_date) = (
+        SELECT prediction_id, predicted_score, confidence_score, prediction_date
+        FROM predictions
+        WHERE student_id = OLD.student_id
+        ORDER BY prediction_date DESC, prediction_id DESC
+        LIMIT 1
+    )
+    WHERE student_id = OLD.student_id
+      AND latest_prediction_id = OLD.prediction_id;
+END;
+
+
+-- ============================================================================
+-- TRIGGER 5: maintain_prediction_summary_update
+-- ============================================================================
+-- Reassigning a prediction to another student needs RebuildStudentPredictionSummary
+-- ============================================================================
+
+DROP TRIGGER IF EXISTS maintain_prediction_summary_update;
+
+CREATE TRIGGER maintain_prediction_summary_update
+AFTER UPDATE ON predictions
+FOR EACH ROW
+WHEN OLD.predicted_score IS NOT NEW.predicted_score
+  OR OLD.confidence_score IS NOT NEW.confidence_score
+  OR OLD.prediction_date IS NOT NEW.prediction_date
+BEGIN
+    UPDATE student_prediction_summary
+    SET predicted_score_count = predicted_score_count
+                                - (OLD.predicted_score IS NOT NULL)
+                                + (NEW.predicted_score IS NOT NULL),
+        predicted_score_total = predicted_score_total
+                                - COALESCE(OLD.predicted_score, 0)
+                                + COALESCE(NEW.predicted_score, 0),
+        avg_predicted_score = (predicted_score_total
+                               - COALESCE(OLD.predicted_score, 0)
+                               + COALESCE(NEW.predicted_score, 0)) * 1.0
+                              / NULLIF(predicted_score_count
+                                       - (OLD.predicted_score IS NOT NULL)
+                                       + (NEW.predicted_score IS NOT NULL), 0),
+        (latest_prediction_id, latest_predicted_score, latest_confidence_score, last_prediction_date) = (
+            SELECT prediction_id, predicted_score, confidence_score, prediction_date
+            FROM predictions
+            WHERE student_id = NEW.student_id
+            ORDER BY prediction_date DESC, prediction_id DESC
+            LIMIT 1
+        ),
+        updated_at = datetime('now', 'localtime')
+    WHERE student_id = NEW.student_id;
+END;
+
+
+-- ============================================================================
+-- TRIGGER 6: audit_students_delete
+-- ============================================================================
+-- Deleted students for incremental MongoDB syncs; not gated, like MySQL's
+-- ============================================================================
+
+DROP TRIGGER IF EXISTS audit_students_delete;
+
+CREATE TRIGGER audit_students_delete
+AFTER DELETE ON students
+FOR EACH ROW
+BEGIN
+    INSERT INTO audit_log (table_name, operation, record_id, old_values, new_values, changed_by)
+    VALUES (
+        'students',
+        'DELETE',
+        OLD.student_id,
+        json_object(
+            'gender', OLD.gender,
+            'learning_disabilities', OLD.learning_disabilities,
+            'distance_from_home', OLD.distance_from_home
+        ),
+        NULL,
+        'system'
+    );
+END;
@@ -1,9 +1,18 @@
 # Database package initialization
 from .mysql_manager import MySQLDatabaseManager
+from .sqlite_manager import SQLiteDatabaseManager
+from .storage import get_database_manager, get_db_engine
 from .data_populator import MySQLDataPopulator
 from .data_verifier import MySQLDataVerifier
+from .audit_partitions import AuditLogPartitionManager
+from .audit_logger import AsyncAuditLogger
+from .mongo_sync import MongoCompleteStudentSync
 
-__all__ = ['MySQLDatabaseManager', 'MySQLDataPopulator', 'MySQLDataVerifier']
+__all__ = [
+    'MySQLDatabaseManager', 'SQLiteDatabaseManager', 'get_database_manager', 'get_db_engine',
+    'MySQLDataPopulator', 'MySQLDataVerifier',
+    'AuditLogPartitionManager', 'AsyncAuditLogger', 'MongoCompleteStudentSync'
+]
 
 
 
@@ -0,0 +1,223 @@
+"""
+Async Audit Logger - Batched audit_log writes outside the data transaction
+"""
+import atexit
+import json
+import os
+import queue
+import threading
+from datetime import date, datetime
+from decimal import Decimal
+from mysql.connector import Error
+from .mysql_manager import MySQLDatabaseManager
+from .sqlite_manager import SQLiteConnection
+
+
+AUDIT_MODE_TRIGGER = 'trigger'
+AUDIT_MODE_ASYNC = 'async'
+
+_STOP = object()
+
+
+def get_audit_mode():
+    """Audit mode from AUDIT_MODE ('trigger' by default, or 'async')"""
+    mode = os.getenv('AUDIT_MODE', AUDIT_MODE_TRIGGER).lower()
+    if mode not in (AUDIT_MODE_TRIGGER, AUDIT_MODE_ASYNC):
+        raise ValueError(f"Unsupported AUDIT_MODE: {mode}")
+    return mode
+
+
+def set_audit_triggers_enabled(connection, enabled: bool):
+    """
+    Enable or disable the audit triggers for one connection's session
+
+    The audit triggers check @audit_triggers_disabled, so this only affects
+    statements run on `connection`; other sessions keep auditing normally.
+    SQLite connections carry the flag themselves (audit_triggers_enabled()).
+    """
+    if isinstance(connection, SQLiteConnection):
+        connection.audit_triggers_enabled = enabled
+        return
+    cursor = connection.cursor()
+    cursor.execute("SET @audit_triggers_disabled = %s", (0 if enabled else 1,))
+    cursor.close()
+
+
+def commit_and_log(connection, audit_logger, entries):
+    """
+    Commit the current batch of changes, then queue its audit entries
+
+    Entries are only queued once their rows are committed, so the background
+    writer records them while the caller carries on with the next batch.
+
+    Args:
+        connection: Connection holding the uncommitted changes
+        audit_logger: AsyncAuditLogger, or None when the triggers audit
+        entries: List of log() keyword dictionaries; emptied afterwards
+    """
+    connection.commit()
+    if audit_logger:
+        audit_logger.log_many(entries)
+    entries.clear()
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+class AsyncAuditLogger:
+    """Queues audit entries and writes them to audit_log in batches on a background thread"""
+
+    INSERT_QUERY = """
+    INSERT INTO audit_log (table_name, operation, record_id, old_values, new_values, changed_by, change_timestamp)
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+    """
+
+    def __init__(self, db_manager: MySQLDatabaseManager, batch_size=500, flush_interval=1.0,
+                 max_queue_size=10000, changed_by=None):
+        """
+        Initialize async audit logger
+
+        Args:
+            db_manager: MySQLDatabaseManager instance (the writer uses its own connection)
+            batch_size: Maximum rows per INSERT batch
+            flush_interval: Seconds to wait for a batch to fill before writing it
+            max_queue_size: Queued entries before log() blocks (back-pressure)
+            changed_by: Value for audit_log.changed_by (defaults to '<mysql user>@async')
+        """
+        self.db_manager = db_manager
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.changed_by = changed_by or f"{db_manager.config['user']}@async"
+        self.queue = queue.Queue(maxsize=max_queue_size)
+        self.connection = None
+        self.entries_written = 0
+        self.entries_failed = 0
+        self._thread = None
+        self._closed = False
+
+    def start(self):
+        """Start the background writer (flushes automatically at interpreter exit)"""
+        if self._thread is not None:
+            return self
+        self._thread = threading.Thread(target=self._run, name='audit-log-writer', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+        return self
+
+    def log(self, table_name, operation, record_id, old_values=None, new_values=None,
+            changed_by=None, change_timestamp=None):
+        """
+        Queue one audit entry
+
+        Call this after the audited change has been committed so the audit log
+        never references rows that were rolled back.
+        """
+        if self._closed:
+            raise RuntimeError("AsyncAuditLogger is closed")
+        if self._thread is None:
+            self.start()
+
+        self.queue.put((
+            table_name,
+            operation,
+            record_id,
+            json.dumps(old_values, default=_json_default) if old_values is not None else None,
+            json.dumps(new_values, default=_json_default) if new_values is not None else None,
+            changed_by or self.changed_by,
+            change_timestamp or datetime.now()
+        ))
+
+    def log_many(self, entries):
+        """
+        Queue several audit entries
+
+        Args:
+            entries: Iterable of dictionaries with log() keyword arguments
+        """
+        for entry in entries:
+            self.log(**entry)
+
+    def flush(self):
+        """Block until every queued entry has been written"""
+        if self._thread is not None:
+            self.queue.join()
+
+    def close(self):
+        """Flush remaining entries and stop the writer thread"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None:
+            self.queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+            print(f"✓ Async audit log flushed ({self.entries_written} written, {self.entries_failed} failed)")
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _run(self):
+        """Writer loop: collect up to batch_size entries or flush_interval seconds, then insert"""
+        stopping = False
+        while not stopping:
+            batch = []
+            item = self.queue.get()
+            if item is _STOP:
+                self.queue.task_done()
+                break
+            batch.append(item)
+
+            while len(batch) < self.batch_size:
+                try:
+                    item = self.queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    self.queue.task_done()
+                    stopping = True
+                    break
+                batch.append(item)
+
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                # Keep the writer alive; flush() would otherwise wait forever
+                self.entries_failed += len(batch)
+                print(f"✗ Failed to write {len(batch)} audit entries: {e}")
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+        if self.connection and self.connection.is_connected():
+            self.connection.close()
+
+    def _write_batch(self, batch):
+        """Insert a batch, reconnecting once if the connection was lost"""
+        for attempt in range(2):
+            try:
+                if self.connection is None or not self.connection.is_connected():
+                    self.connection = self.db_manager.get_connection()
+                cursor = self.connection.cursor()
+                cursor.executemany(self.INSERT_QUERY, batch)
+                self.connection.commit()
+                cursor.close()
+                self.entries_written += len(batch)
+                return
+            except (Error, ConnectionError) as e:
+                try:
+                    if self.connection is not None and self.connection.is_connected():
+                        self.connection.close()
+                except Error:
+                    pass
+                self.connection = None
+                if attempt == 1:
+                    self.entries_failed += len(batch)
+                    print(f"✗ Failed to write {len(batch)} audit entries: {e}")
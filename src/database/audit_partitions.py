@@ -0,0 +1,290 @@
+"""
+Audit Log Partition Manager - Monthly partitions, retention and archival
+"""
+import gzip
+import json
+import os
+import re
+from datetime import date, datetime
+from decimal import Decimal
+from mysql.connector import Error
+from .mysql_manager import MySQLDatabaseManager
+
+
+FUTURE_PARTITION = 'p_future'
+PARTITION_NAME_PATTERN = re.compile(r'^p(_history|_future|\d{6})$')
+
+
+def month_start(value: date, offset: int = 0) -> date:
+    """First day of the month `offset` months away from `value`"""
+    month_index = value.year * 12 + (value.month - 1) + offset
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def partition_name_for(month: date) -> str:
+    """Partition holding rows from `month` (e.g. p202610 for October 2026)"""
+    return f"p{month.year:04d}{month.month:02d}"
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode('utf-8')
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+class AuditLogPartitionManager:
+    """Maintains monthly RANGE partitions on audit_log.change_timestamp"""
+
+    def __init__(self, db_manager: MySQLDatabaseManager, table_name='audit_log'):
+        """
+        Initialize partition manager
+
+        Args:
+            db_manager: MySQLDatabaseManager instance
+            table_name: Partitioned audit table
+        """
+        self.db_manager = db_manager
+        self.table_name = table_name
+        self.connection = None
+
+    def connect(self):
+        """Establish database connection"""
+        self.connection = self.db_manager.get_connection()
+
+    def disconnect(self):
+        """Close database connection"""
+        if self.connection and self.connection.is_connected():
+            self.connection.close()
+
+    def list_partitions(self):
+        """
+        List partitions of the audit table in boundary order
+
+        Returns:
+            List of dictionaries with name, upper_bound (unix seconds or None
+            for MAXVALUE) and approximate row count
+        """
+        cursor = self.connection.cursor(dictionary=True)
+        cursor.execute("""
+            SELECT PARTITION_NAME, PARTITION_DESCRIPTION, TABLE_ROWS
+            FROM information_schema.PARTITIONS
+            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND PARTITION_NAME IS NOT NULL
+            ORDER BY PARTITION_ORDINAL_POSITION
+        """, (self.db_manager.db_name, self.table_name))
+        rows = cursor.fetchall()
+        cursor.close()
+
+        partitions = []
+        for row in rows:
+            description = row['PARTITION_DESCRIPTION']
+            upper_bound = None if description == 'MAXVALUE' else int(description)
+            partitions.append({
+                'name': row['PARTITION_NAME'],
+                'upper_bound': upper_bound,
+                'rows': row['TABLE_ROWS']
+            })
+        return partitions
+
+    def _unix_timestamp(self, value: date) -> int:
+        """Convert a date to a partition boundary using the server time zone"""
+        cursor = self.connection.cursor()
+        cursor.execute("SELECT UNIX_TIMESTAMP(%s)", (f"{value.isoformat()} 00:00:00",))
+        timestamp = int(cursor.fetchone()[0])
+        cursor.close()
+        return timestamp
+
+    def _partition_month(self, upper_bound: int) -> date:
+        """Month whose first day is the given boundary"""
+        cursor = self.connection.cursor()
+        cursor.execute("SELECT DATE(FROM_UNIXTIME(%s))", (upper_bound,))
+        boundary = cursor.fetchone()[0]
+        cursor.close()
+        return month_start(boundary)
+
+    def ensure_partitions(self, months_ahead=3, today=None, dry_run=False):
+        """
+        Split p_future into monthly partitions up to `months_ahead` months out
+
+        Args:
+            months_ahead: Number of future months that must already have a partition
+            today: Reference date (defaults to the current date)
+            dry_run: Only report which partitions would be created
+
+        Returns:
+            Names of partitions created (or that would be created)
+        """
+        today = today or date.today()
+        partitions = self.list_partitions()
+        bounded = [p for p in partitions if p['upper_bound'] is not None]
+
+        if not any(p['name'] == FUTURE_PARTITION for p in partitions):
+            raise ValueError(f"{self.table_name} has no {FUTURE_PARTITION} partition to split")
+
+        # Next month to create starts at the highest existing boundary
+        if bounded:
+            next_month = self._partition_month(bounded[-1]['upper_bound'])
+        else:
+            next_month = month_start(today)
+        last_month = month_start(today, months_ahead)
+
+        definitions = []
+        created = []
+        while next_month <= last_month:
+            name = partition_name_for(next_month)
+            boundary = month_start(next_month, 1).isoformat()
+            definitions.append(
+                f"PARTITION {name} VALUES LESS THAN (UNIX_TIMESTAMP('{boundary} 00:00:00'))"
+            )
+            created.append(name)
+            next_month = month_start(next_month, 1)
+
+        if not definitions:
+            print("✓ Audit log partitions already cover the requested range")
+            return []
+
+        if dry_run:
+            print(f"  Would create {len(created)} audit log partitions: {created[0]} .. {created[-1]}")
+            return created
+
+        definitions.append(f"PARTITION {FUTURE_PARTITION} VALUES LESS THAN MAXVALUE")
+        cursor = self.connection.cursor()
+        cursor.execute(
+            f"ALTER TABLE {self.table_name} REORGANIZE PARTITION {FUTURE_PARTITION} INTO ("
+            + ", ".join(definitions) + ")"
+        )
+        cursor.close()
+
+        print(f"✓ Created {len(created)} audit log partitions: {created[0]} .. {created[-1]}")
+        return created
+
+    def expired_partitions(self, keep_months=6, today=None):
+        """
+        Partitions whose rows are all older than the retention window
+
+        Args:
+            keep_months: Number of months to keep, including the current month
+            today: Reference date (defaults to the current date)
+
+        Returns:
+            List of partition dictionaries eligible for archival/drop
+        """
+        today = today or date.today()
+        cutoff = self._unix_timestamp(month_start(today, -(keep_months - 1)))
+        return [
+            p for p in self.list_partitions()
+            if p['upper_bound'] is not None and p['upper_bound'] <= cutoff
+        ]
+
+    def archive_partition(self, partition_name, archive_dir, batch_size=5000):
+        """
+        Stream one partition to a gzip-compressed NDJSON file
+
+        Args:
+            partition_name: Partition to export
+            archive_dir: Directory for the archive file
+            batch_size: Rows fetched per round trip
+
+        Returns:
+            Tuple of (archive path, rows written)
+        """
+        self._check_partition_name(partition_name)
+        os.makedirs(archive_dir, exist_ok=True)
+        path = os.path.join(archive_dir, f"{self.table_name}_{partition_name}.ndjson.gz")
+
+        cursor = self.connection.cursor(dictionary=True)
+        cursor.execute(f"""
+            SELECT log_id, table_name, operation, record_id, old_values, new_values,
+                   changed_by, change_timestamp
+            FROM {self.table_name} PARTITION ({partition_name})
+        """)
+
+        rows_written = 0
+        with gzip.open(path, 'wt', encoding='utf-8') as archive:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    for column in ('old_values', 'new_values'):
+                        value = row[column]
+                        if isinstance(value, (bytes, bytearray)):
+                            value = value.decode('utf-8')
+                        if isinstance(value, str):
+                            row[column] = json.loads(value)
+                    archive.write(json.dumps(row, default=_json_default) + '\n')
+                rows_written += len(rows)
+        cursor.close()
+
+        print(f"  ✓ Archived {rows_written:,} rows from {partition_name} to {path}")
+        return path, rows_written
+
+    def drop_partition(self, partition_name):
+        """Drop a partition (metadata operation, no row-by-row DELETE)"""
+        self._check_partition_name(partition_name)
+        if partition_name == FUTURE_PARTITION:
+            raise ValueError(f"Refusing to drop {FUTURE_PARTITION}")
+
+        cursor = self.connection.cursor()
+        cursor.execute(f"ALTER TABLE {self.table_name} DROP PARTITION {partition_name}")
+        cursor.close()
+        print(f"  ✓ Dropped partition {partition_name}")
+
+    def apply_retention(self, keep_months=6, archive_dir=None, dry_run=False, today=None):
+        """
+        Archive (optionally) and drop partitions outside the retention window
+
+        Args:
+            keep_months: Number of months to keep, including the current month
+            archive_dir: Export each partition here before dropping it
+            dry_run: Only report what would be removed
+            today: Reference date (defaults to the current date)
+
+        Returns:
+            List of partition names removed (or that would be removed)
+        """
+        if keep_months < 1:
+            raise ValueError("keep_months must be at least 1")
+
+        expired = self.expired_partitions(keep_months, today)
+        if not expired:
+            print("✓ No audit log partitions outside the retention window")
+            return []
+
+        print(f"\nAudit log retention: keeping {keep_months} month(s)")
+        for partition in expired:
+            print(f"  {partition['name']}: ~{partition['rows']:,} rows")
+            if dry_run:
+                continue
+            if archive_dir:
+                self.archive_partition(partition['name'], archive_dir)
+            self.drop_partition(partition['name'])
+
+        return [p['name'] for p in expired]
+
+    def _check_partition_name(self, partition_name):
+        """Partition names are interpolated into DDL, so only allow known ones"""
+        if not PARTITION_NAME_PATTERN.match(partition_name):
+            raise ValueError(f"Invalid partition name: {partition_name}")
+        if partition_name not in {p['name'] for p in self.list_partitions()}:
+            raise ValueError(f"Partition {partition_name} does not exist on {self.table_name}")
+
+    def run(self, action, **kwargs):
+        """
+        Run one manager action inside a managed connection
+
+        Args:
+            action: Method name ('list_partitions', 'ensure_partitions', 'apply_retention')
+            **kwargs: Arguments forwarded to the action
+        """
+        self.connect()
+        try:
+            return getattr(self, action)(**kwargs)
+        except Error as e:
+            print(f"✗ Audit log partition error: {e}")
+            raise
+        finally:
+            self.disconnect()
@@ -36,7 +36,8 @@ class MySQLDataVerifier:
         """
         cursor = self.connection.cursor()
         
-        tables = ['students', 'academic_records', 'environmental_factors', 'predictions', 'audit_log']
+        tables = ['students', 'academic_records', 'environmental_factors', 'predictions',
+                  'student_prediction_summary', 'audit_log']
         counts = {}
         
         for table in tables:
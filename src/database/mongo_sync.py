@@ -0,0 +1,245 @@
+"""
+MySQL to MongoDB Sync - Denormalized complete-student documents
+"""
+from datetime import datetime
+from decimal import Decimal
+from mysql.connector import Error
+from pymongo import DeleteMany, ReplaceOne
+from .mysql_manager import MySQLDatabaseManager
+
+
+SYNC_STATE_ID = 'mysql_complete_students'
+
+STUDENT_FIELDS = ['student_id', 'gender', 'learning_disabilities', 'distance_from_home', 'created_at', 'updated_at']
+ACADEMIC_FIELDS = [
+    'record_id', 'student_id', 'hours_studied', 'attendance', 'previous_scores',
+    'tutoring_sessions', 'exam_score', 'created_at'
+]
+ENVIRONMENTAL_FIELDS = [
+    'env_id', 'student_id', 'parental_involvement', 'access_to_resources', 'extracurricular_activities',
+    'sleep_hours', 'motivation_level', 'internet_access', 'family_income', 'teacher_quality',
+    'school_type', 'peer_influence', 'physical_activity', 'parental_education_level', 'created_at'
+]
+PREDICTION_FIELDS = [
+    'latest_prediction_id', 'latest_predicted_score', 'latest_confidence_score',
+    'prediction_count', 'avg_predicted_score', 'last_prediction_date'
+]
+
+
+def _select_list(alias, prefix, fields):
+    return ", ".join(f"{alias}.{field} AS {prefix}{field}" for field in fields)
+
+
+def _section(row, prefix, fields):
+    """Nested document for one joined table, or None if the LEFT JOIN found no row"""
+    values = {field: _to_bson(row[f"{prefix}{field}"]) for field in fields}
+    return values if values[fields[0]] is not None else None
+
+
+def _to_bson(value):
+    # BSON has no Decimal type; scores are small enough for doubles
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+class MongoCompleteStudentSync:
+    """Keeps one Mongo document per student in step with the MySQL tables"""
+
+    # Students touched since a watermark. students, environmental factors and
+    # the prediction summary carry updated_at; academic inserts are found by
+    # created_at and academic updates through the audit trigger rows. Deleted
+    # students come from audit_students_delete; sync_ids removes their
+    # documents because they no longer exist in MySQL.
+    CHANGED_IDS_QUERY = """
+        SELECT student_id FROM students WHERE updated_at >= %s
+        UNION SELECT student_id FROM academic_records WHERE created_at >= %s
+        UNION SELECT a.student_id
+              FROM audit_log l
+              JOIN academic_records a ON a.record_id = l.record_id
+              WHERE l.table_name = 'academic_records' AND l.change_timestamp >= %s
+        UNION SELECT student_id FROM environmental_factors WHERE updated_at >= %s
+        UNION SELECT student_id FROM student_prediction_summary WHERE updated_at >= %s
+        UNION SELECT record_id
+              FROM audit_log
+              WHERE table_name = 'students' AND operation = 'DELETE' AND change_timestamp >= %s
+    """
+
+    def __init__(self, db_manager: MySQLDatabaseManager, mongo_db, collection_name='complete_students',
+                 state_collection_name='sync_state', batch_size=500):
+        """
+        Initialize sync
+
+        Args:
+            db_manager: MySQLDatabaseManager instance
+            mongo_db: pymongo Database to write to
+            collection_name: Collection holding one document per student (_id = student_id)
+            state_collection_name: Collection storing the sync watermark
+            batch_size: Students fetched from MySQL and upserted per batch
+        """
+        self.db_manager = db_manager
+        self.collection = mongo_db[collection_name]
+        self.state = mongo_db[state_collection_name]
+        self.batch_size = batch_size
+        self.connection = None
+
+    def connect(self):
+        """Establish database connection"""
+        self.connection = self.db_manager.get_connection()
+
+    def disconnect(self):
+        """Close database connection"""
+        if self.connection and self.connection.is_connected():
+            self.connection.close()
+
+    def _server_now(self):
+        """MySQL server time, so watermarks compare against the server's own timestamps"""
+        cursor = self.connection.cursor()
+        cursor.execute("SELECT NOW()")
+        now = cursor.fetchone()[0]
+        cursor.close()
+        return now
+
+    def get_watermark(self):
+        state = self.state.find_one({'_id': SYNC_STATE_ID})
+        return state['watermark'] if state else None
+
+    def save_watermark(self, watermark: datetime):
+        self.state.update_one(
+            {'_id': SYNC_STATE_ID},
+            {'$set': {'watermark': watermark, 'synced_at': datetime.utcnow()}},
+            upsert=True
+        )
+
+    def changed_student_ids(self, since: datetime):
+        """Ids of students with any change at or after `since`"""
+        cursor = self.connection.cursor()
+        cursor.execute(self.CHANGED_IDS_QUERY, (since,) * self.CHANGED_IDS_QUERY.count('%s'))
+        ids = sorted(row[0] for row in cursor.fetchall())
+        cursor.close()
+        return ids
+
+    def iter_all_student_id_batches(self):
+        """All student ids in batch_size chunks, paged by primary key"""
+        last_id = 0
+        while True:
+            cursor = self.connection.cursor()
+            cursor.execute(
+                "SELECT student_id FROM students WHERE student_id > %s ORDER BY student_id LIMIT %s",
+                (last_id, self.batch_size)
+            )
+            ids = [row[0] for row in cursor.fetchall()]
+            cursor.close()
+            if not ids:
+                return
+            yield ids
+            last_id = ids[-1]
+
+    def fetch_documents(self, student_ids):
+        """
+        Build complete-student documents for the given ids in one joined query
+
+        Returns:
+            Dictionary of student_id -> document (missing ids were deleted in MySQL)
+        """
+        if not student_ids:
+            return {}
+        placeholders = ", ".join(["%s"] * len(student_ids))
+        cursor = self.connection.cursor(dictionary=True)
+        cursor.execute(f"""
+            SELECT
+                {_select_list('s', 's_', STUDENT_FIELDS)},
+                {_select_list('a', 'a_', ACADEMIC_FIELDS)},
+                {_select_list('e', 'e_', ENVIRONMENTAL_FIELDS)},
+                {_select_list('p', 'p_', PREDICTION_FIELDS)}
+            FROM students s
+            LEFT JOIN academic_records a ON a.student_id = s.student_id
+            LEFT JOIN environmental_factors e ON e.student_id = s.student_id
+            LEFT JOIN student_prediction_summary p ON p.student_id = s.student_id
+            WHERE s.student_id IN ({placeholders})
+            ORDER BY s.student_id, a.record_id, e.env_id
+        """, list(student_ids))
+        rows = cursor.fetchall()
+        cursor.close()
+
+        documents = {}
+        synced_at = datetime.utcnow()
+        for row in rows:
+            student_id = row['s_student_id']
+            # First academic/environmental row wins, matching the API
+            if student_id in documents:
+                continue
+            documents[student_id] = {
+                '_id': student_id,
+                'student': _section(row, 's_', STUDENT_FIELDS),
+                'academic_record': _section(row, 'a_', ACADEMIC_FIELDS),
+                'environmental_factors': _section(row, 'e_', ENVIRONMENTAL_FIELDS),
+                'latest_prediction': _section(row, 'p_', PREDICTION_FIELDS),
+                'synced_at': synced_at
+            }
+        return documents
+
+    def sync_ids(self, student_ids):
+        """
+        Upsert documents for `student_ids` and delete those no longer in MySQL
+
+        Returns:
+            Tuple of (upserted, deleted)
+        """
+        upserted = deleted = 0
+        for start in range(0, len(student_ids), self.batch_size):
+            batch = student_ids[start:start + self.batch_size]
+            documents = self.fetch_documents(batch)
+            operations = [ReplaceOne({'_id': sid}, doc, upsert=True) for sid, doc in documents.items()]
+            missing = [sid for sid in batch if sid not in documents]
+            if missing:
+                operations.append(DeleteMany({'_id': {'$in': missing}}))
+            if operations:
+                result = self.collection.bulk_write(operations, ordered=False)
+                upserted += result.upserted_count + result.modified_count
+                deleted += result.deleted_count
+        return upserted, deleted
+
+    def full_sync(self):
+        """Rewrite every document and remove ones whose students no longer exist"""
+        started = datetime.utcnow()
+        upserted = 0
+        for ids in self.iter_all_student_id_batches():
+            count, _ = self.sync_ids(ids)
+            upserted += count
+            print(f"  ✓ Synced students up to {ids[-1]}")
+        deleted = self.collection.delete_many({'synced_at': {'$lt': started}}).deleted_count
+        return upserted, deleted
+
+    def sync(self, full=False):
+        """
+        Incremental sync from the stored watermark (full sync on first run or when requested)
+
+        The next watermark is the server time taken before reading changes, so
+        changes committed while a run is in progress are picked up next time.
+        """
+        watermark = self._server_now()
+        since = None if full else self.get_watermark()
+
+        if since is None:
+            print("\nFull sync MySQL → MongoDB")
+            upserted, deleted = self.full_sync()
+        else:
+            student_ids = self.changed_student_ids(since)
+            print(f"\nIncremental sync: {len(student_ids)} students changed since {since}")
+            upserted, deleted = self.sync_ids(student_ids)
+
+        self.save_watermark(watermark)
+        print(f"✓ Sync complete ({upserted} upserted, {deleted} deleted)")
+        return {'upserted': upserted, 'deleted': deleted, 'watermark': watermark}
+
+    def run(self, full=False):
+        """Run one sync inside a managed connection"""
+        self.connect()
+        try:
+            return self.sync(full=full)
+        except Error as e:
+            print(f"✗ Sync error: {e}")
+            raise
+        finally:
+            self.disconnect()
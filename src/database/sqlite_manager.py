@@ -0,0 +1,395 @@
+"""
+SQLite Database Manager - Server-less storage with the MySQL manager's interface
+"""
+import os
+import sqlite3
+from datetime import date, datetime
+from decimal import Decimal
+from mysql.connector import errors
+from dotenv import load_dotenv
+
+
+# Values are stored as 'YYYY-MM-DD HH:MM:SS[.ffffff]' (the format of the
+# schema defaults) and TIMESTAMP columns come back as datetime objects, as
+# they do from mysql.connector
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(' '))
+sqlite3.register_adapter(date, lambda value: value.isoformat())
+sqlite3.register_adapter(Decimal, float)
+sqlite3.register_converter('TIMESTAMP', lambda value: datetime.fromisoformat(value.decode()))
+
+
+def _translate_error(e: sqlite3.Error) -> errors.Error:
+    """sqlite3 exception as the mysql.connector error of the same name, so callers keep one except clause"""
+    error_class = getattr(errors, type(e).__name__, errors.DatabaseError)
+    return error_class(msg=str(e))
+
+
+def _now():
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+class SQLiteCursor:
+    """mysql.connector-style cursor: %s placeholders, dictionary rows and emulated callproc"""
+
+    def __init__(self, connection, dictionary=False):
+        self.connection = connection
+        self._cursor = connection.raw.cursor()
+        if dictionary:
+            self._cursor.row_factory = lambda cursor, row: {
+                column[0]: value for column, value in zip(cursor.description, row)
+            }
+        self._stored_results = []
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    def execute(self, query, params=()):
+        try:
+            self._cursor.execute(query.replace('%s', '?'), tuple(params or ()))
+        except sqlite3.Error as e:
+            raise _translate_error(e) from e
+        return self
+
+    def executemany(self, query, seq_params):
+        try:
+            self._cursor.executemany(query.replace('%s', '?'), [tuple(params) for params in seq_params])
+        except sqlite3.Error as e:
+            raise _translate_error(e) from e
+        return self
+
+    def fetchone(self):
+        return self._cursor.fetchone()
+
+    def fetchmany(self, size=1):
+        return self._cursor.fetchmany(size)
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def callproc(self, procname, args=()):
+        """
+        Run a Python emulation of a MySQL stored procedure
+
+        Returns:
+            The arguments with OUT parameters filled in; result sets are
+            available from stored_results()
+        """
+        if procname not in SQLITE_PROCEDURES:
+            raise errors.ProgrammingError(msg=f"PROCEDURE {procname} does not exist")
+        self._stored_results, result_args = SQLITE_PROCEDURES[procname](self.connection, list(args))
+        return tuple(result_args)
+
+    def stored_results(self):
+        return iter(self._stored_results)
+
+    def close(self):
+        self._cursor.close()
+
+
+class SQLiteConnection:
+    """mysql.connector-style connection over sqlite3 with per-connection PRAGMAs and SQL functions"""
+
+    def __init__(self, path, mmap_size, cache_size_kb, busy_timeout_ms):
+        try:
+            self.raw = sqlite3.connect(path, detect_types=sqlite3.PARSE_DECLTYPES, timeout=busy_timeout_ms / 1000)
+            for pragma in (
+                "journal_mode = WAL",
+                "synchronous = NORMAL",
+                "foreign_keys = ON",
+                "temp_store = MEMORY",
+                f"mmap_size = {int(mmap_size)}",
+                f"cache_size = -{int(cache_size_kb)}",
+            ):
+                self.raw.execute(f"PRAGMA {pragma}")
+        except sqlite3.Error as e:
+            raise _translate_error(e) from e
+
+        # Replaces the @audit_triggers_disabled session variable checked by
+        # the MySQL audit triggers (see set_audit_triggers_enabled)
+        self.audit_triggers_enabled = True
+        self.raw.create_function('audit_triggers_enabled', 0, lambda: int(self.audit_triggers_enabled))
+        self.raw.create_function('NOW', 0, _now)
+
+    def cursor(self, dictionary=False, **kwargs):
+        return SQLiteCursor(self, dictionary=dictionary)
+
+    def commit(self):
+        try:
+            self.raw.commit()
+        except sqlite3.Error as e:
+            raise _translate_error(e) from e
+
+    def rollback(self):
+        self.raw.rollback()
+
+    def is_connected(self):
+        return self.raw is not None
+
+    def close(self):
+        if self.raw is not None:
+            self.raw.close()
+            self.raw = None
+
+
+# Stored procedure emulations: fn(connection, args) -> (result cursors, args)
+STUDENT_PERFORMANCE_SUMMARY_QUERY = """
+    SELECT
+        s.student_id,
+        s.gender,
+        s.learning_disabilities,
+        s.distance_from_home,
+        a.hours_studied,
+        a.attendance,
+        a.previous_scores,
+        a.exam_score,
+        a.tutoring_sessions,
+        e.school_type,
+        e.parental_involvement,
+        COALESCE(ps.prediction_count, 0) AS total_predictions,
+        ps.avg_predicted_score,
+        e.motivation_level,
+        e.access_to_resources,
+        e.family_income,
+        e.internet_access,
+        e.parental_education_level,
+        s.created_at AS student_created_at,
+        ps.latest_predicted_score,
+        ps.last_prediction_date
+    FROM students s
+    LEFT JOIN academic_records a ON s.student_id = a.student_id
+    LEFT JOIN environmental_factors e ON s.student_id = e.student_id
+    LEFT JOIN student_prediction_summary ps ON s.student_id = ps.student_id
+    WHERE s.student_id = %s
+    LIMIT 1
+"""
+
+REBUILD_PREDICTION_SUMMARY_QUERY = """
+    INSERT INTO student_prediction_summary (
+        student_id, latest_prediction_id, latest_predicted_score, latest_confidence_score,
+        prediction_count, predicted_score_count, predicted_score_total, avg_predicted_score,
+        last_prediction_date
+    )
+    SELECT
+        agg.student_id,
+        latest.prediction_id,
+        latest.predicted_score,
+        latest.confidence_score,
+        agg.prediction_count,
+        agg.predicted_score_count,
+        agg.predicted_score_total,
+        agg.predicted_score_total * 1.0 / NULLIF(agg.predicted_score_count, 0),
+        latest.prediction_date
+    FROM (
+        SELECT student_id, COUNT(*) AS prediction_count, COUNT(predicted_score) AS predicted_score_count,
+               COALESCE(SUM(predicted_score), 0) AS predicted_score_total
+        FROM predictions
+        GROUP BY student_id
+    ) agg
+    JOIN predictions latest ON latest.prediction_id = (
+        SELECT p.prediction_id
+        FROM predictions p
+        WHERE p.student_id = agg.student_id
+        ORDER BY p.prediction_date DESC, p.prediction_id DESC
+        LIMIT 1
+    )
+"""
+
+
+def _get_student_performance_summary(connection, args):
+    cursor = connection.cursor()
+    cursor.execute(STUDENT_PERFORMANCE_SUMMARY_QUERY, (args[0],))
+    return [cursor], args
+
+
+def _insert_complete_student_record(connection, args):
+    """20 IN parameters in procedure order, then the OUT new student id (-1 on error)"""
+    student, academic, environmental = args[0:3], args[3:8], args[8:20]
+    # START TRANSACTION in the procedure implicitly commits pending work
+    connection.commit()
+    cursor = connection.cursor()
+    try:
+        cursor.execute(
+            "INSERT INTO students (gender, learning_disabilities, distance_from_home) VALUES (%s, %s, %s)",
+            student
+        )
+        new_student_id = cursor.lastrowid
+        cursor.execute("""
+            INSERT INTO academic_records (
+                student_id, hours_studied, attendance, previous_scores, tutoring_sessions, exam_score
+            ) VALUES (%s, %s, %s, %s, %s, %s)
+        """, [new_student_id, *academic])
+        cursor.execute("""
+            INSERT INTO environmental_factors (
+                student_id, parental_involvement, access_to_resources,
+                extracurricular_activities, sleep_hours, motivation_level,
+                internet_access, family_income, teacher_quality, school_type,
+                peer_influence, physical_activity, parental_education_level
+            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """, [new_student_id, *environmental])
+        connection.commit()
+    except errors.Error:
+        # Matches the procedure's EXIT HANDLER: roll back, -1, no result set
+        connection.rollback()
+        cursor.close()
+        return [], args[:20] + [-1]
+
+    cursor.execute(
+        "SELECT %s AS new_student_id, 'Student record created successfully' AS message",
+        (new_student_id,)
+    )
+    return [cursor], args[:20] + [new_student_id]
+
+
+def _rebuild_student_prediction_summary(connection, args):
+    cursor = connection.cursor()
+    cursor.execute("DELETE FROM student_prediction_summary")
+    cursor.execute(REBUILD_PREDICTION_SUMMARY_QUERY)
+    cursor.execute("SELECT COUNT(*) AS students_summarized FROM student_prediction_summary")
+    return [cursor], args
+
+
+SQLITE_PROCEDURES = {
+    'GetStudentPerformanceSummary': _get_student_performance_summary,
+    'InsertCompleteStudentRecord': _insert_complete_student_record,
+    'RebuildStudentPredictionSummary': _rebuild_student_prediction_summary,
+}
+
+
+class SQLiteDatabaseManager:
+    """Database manager for a local SQLite file (DB_ENGINE=sqlite)"""
+
+    def __init__(self, config_path=".env"):
+        load_dotenv(config_path, override=True)
+
+        self.config = {
+            'database': os.getenv('SQLITE_PATH', 'student_performance.db'),
+            'user': os.getenv('SQLITE_USER', 'sqlite'),
+            'mmap_size': int(os.getenv('SQLITE_MMAP_SIZE', str(256 * 1024 * 1024))),
+            'cache_size_kb': int(os.getenv('SQLITE_CACHE_SIZE_KB', str(64 * 1024))),
+            'busy_timeout_ms': int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', '5000'))
+        }
+
+        self.db_name = self.config['database']
+        print("✓ Database configuration loaded successfully")
+        print(f"  Engine: SQLite {sqlite3.sqlite_version}")
+        print(f"  Database: {self.db_name}")
+
+    def get_connection(self, include_db=True):
+        """include_db is accepted for interface compatibility; the file is the database"""
+        try:
+            return SQLiteConnection(
+                self.db_name,
+                self.config['mmap_size'],
+                self.config['cache_size_kb'],
+                self.config['busy_timeout_ms']
+            )
+        except errors.Error as e:
+            raise ConnectionError(f"Failed to open SQLite database: {e}")
+
+    def create_database(self):
+        print("\nCREATING DATABASE")
+        directory = os.path.dirname(os.path.abspath(self.db_name))
+        os.makedirs(directory, exist_ok=True)
+        self.get_connection().close()
+        print(f"✓ Database '{self.db_name}' created or already exists")
+        return True
+
+    def drop_database(self):
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(self.db_name + suffix):
+                os.remove(self.db_name + suffix)
+        print(f" Database '{self.db_name}' dropped successfully")
+
+    def _execute_script(self, script_file):
+        with open(script_file, 'r', encoding='utf-8') as f:
+            sql_script = f.read()
+        connection = self.get_connection()
+        try:
+            connection.raw.executescript(sql_script)
+            return connection.raw.execute(
+                "SELECT type, name FROM sqlite_master WHERE sql IS NOT NULL ORDER BY rowid"
+            ).fetchall()
+        except sqlite3.Error as e:
+            raise _translate_error(e) from e
+        finally:
+            connection.close()
+
+    def execute_schema(self, schema_file='schema_sqlite.sql'):
+        """Recreate the database file from schema_file (the DROP/CREATE DATABASE of the MySQL schema)"""
+        print("\nEXECUTING DATABASE SCHEMA")
+
+        if not os.path.exists(schema_file):
+            raise FileNotFoundError(f"Schema file not found: {schema_file}")
+
+        try:
+            self.drop_database()
+            objects = self._execute_script(schema_file)
+        except errors.Error as e:
+            print(f"Error executing schema: {e}")
+            raise
+
+        tables = [name for kind, name in objects if kind == 'table' and not name.startswith('sqlite_')]
+        for table_name in tables:
+            print(f"  Created table: {table_name}")
+
+        if not tables:
+            print(f"\nWARNING: No tables were created!")
+        else:
+            print(f"\nSchema executed successfully! ({len(tables)} tables created)")
+        return len(tables) > 0
+
+    def execute_procedures_and_triggers(self, procedures_file='sqlite_triggers.sql'):
+        """Create the SQLite triggers; stored procedures are emulated in Python (SQLITE_PROCEDURES)"""
+        print("\nEXECUTING STORED PROCEDURES AND TRIGGERS")
+
+        if not os.path.exists(procedures_file):
+            print(f"⚠ Warning: {procedures_file} not found - skipping procedures/triggers")
+            return False
+
+        try:
+            objects = self._execute_script(procedures_file)
+        except errors.Error as e:
+            print(f"✗ Error executing procedures/triggers: {e}")
+            return False
+
+        triggers = [name for kind, name in objects if kind == 'trigger']
+        for trigger_name in triggers:
+            print(f"  ✓ Created trigger: {trigger_name}")
+        for procedure_name in SQLITE_PROCEDURES:
+            print(f"  ✓ Emulated procedure: {procedure_name}")
+
+        print(f"\n✓ Procedures & Triggers setup complete!")
+        print(f"  - Stored Procedures (emulated): {len(SQLITE_PROCEDURES)}")
+        print(f"  - Triggers: {len(triggers)}")
+        return True
+
+    def test_connection(self):
+        try:
+            connection = self.get_connection()
+            cursor = connection.cursor()
+
+            cursor.execute("PRAGMA journal_mode")
+            journal_mode = cursor.fetchone()[0]
+
+            print(f"✓ Connected to database: {self.db_name}")
+            print(f"  SQLite version: {sqlite3.sqlite_version} (journal_mode={journal_mode})")
+
+            cursor.close()
+            connection.close()
+            return True
+
+        except (errors.Error, ConnectionError) as e:
+            print(f"✗ Connection test failed: {e}")
+            return False
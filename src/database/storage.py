@@ -0,0 +1,42 @@
+"""
+Storage Engine Selection - MySQL server or local SQLite file
+"""
+import os
+from dotenv import load_dotenv
+from .mysql_manager import MySQLDatabaseManager
+from .sqlite_manager import SQLiteDatabaseManager
+
+
+DB_ENGINE_MYSQL = 'mysql'
+DB_ENGINE_SQLITE = 'sqlite'
+
+DATABASE_MANAGERS = {
+    DB_ENGINE_MYSQL: MySQLDatabaseManager,
+    DB_ENGINE_SQLITE: SQLiteDatabaseManager,
+}
+
+
+def get_db_engine():
+    """Storage engine from DB_ENGINE ('mysql' by default, or 'sqlite')"""
+    engine = os.getenv('DB_ENGINE', DB_ENGINE_MYSQL).lower()
+    if engine not in DATABASE_MANAGERS:
+        raise ValueError(f"Unsupported DB_ENGINE: {engine}")
+    return engine
+
+
+def get_database_manager(config_path=".env"):
+    """
+    Database manager for the configured engine
+
+    Both managers hand out connections with the mysql.connector interface
+    (%s placeholders, cursor(dictionary=True), callproc), so populators,
+    verifiers and prediction scripts work against either.
+
+    Args:
+        config_path: .env file to load before reading DB_ENGINE
+
+    Returns:
+        MySQLDatabaseManager or SQLiteDatabaseManager instance
+    """
+    load_dotenv(config_path, override=True)
+    return DATABASE_MANAGERS[get_db_engine()](config_path)
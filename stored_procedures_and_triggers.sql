@@ -16,7 +16,7 @@ USE student_performance_db;
 -- Purpose: Retrieves a comprehensive summary of student performance data
 -- Parameters: student_id (INT)
 -- Returns: Complete student information including academic, environmental,
---          and prediction data
+--          and prediction data (read from student_prediction_summary)
 -- ============================================================================
 
 DROP PROCEDURE IF EXISTS GetStudentPerformanceSummary;
@@ -25,6 +25,9 @@ DELIMITER //
 
 CREATE PROCEDURE GetStudentPerformanceSummary(IN p_student_id INT)
 BEGIN
+    -- Prediction statistics come from student_prediction_summary, which the
+    -- prediction triggers keep current, so this is a single-row lookup per
+    -- table no matter how many predictions a student has accumulated.
     SELECT 
         s.student_id,
         s.gender,
@@ -37,24 +40,22 @@ BEGIN
         a.tutoring_sessions,
         e.school_type,
         e.parental_involvement,
-        COUNT(p.prediction_id) AS total_predictions,
-        AVG(p.predicted_score) AS avg_predicted_score,
+        COALESCE(ps.prediction_count, 0) AS total_predictions,
+        ps.avg_predicted_score,
         e.motivation_level,
         e.access_to_resources,
         e.family_income,
         e.internet_access,
         e.parental_education_level,
-        s.created_at AS student_created_at
+        s.created_at AS student_created_at,
+        ps.latest_predicted_score,
+        ps.last_prediction_date
     FROM students s
     LEFT JOIN academic_records a ON s.student_id = a.student_id
     LEFT JOIN environmental_factors e ON s.student_id = e.student_id
-    LEFT JOIN predictions p ON s.student_id = p.student_id
+    LEFT JOIN student_prediction_summary ps ON s.student_id = ps.student_id
     WHERE s.student_id = p_student_id
-    GROUP BY s.student_id, s.gender, s.learning_disabilities, s.distance_from_home,
-             a.hours_studied, a.attendance, a.previous_scores, a.exam_score, 
-             a.tutoring_sessions, e.school_type, e.parental_involvement,
-             e.motivation_level, e.access_to_resources, e.family_income,
-             e.internet_access, e.parental_education_level, s.created_at;
+    LIMIT 1;
 END //
 
 DELIMITER ;
@@ -157,6 +158,67 @@ END //
 DELIMITER ;
 
 
+-- ============================================================================
+-- STORED PROCEDURE 3: RebuildStudentPredictionSummary
+-- ============================================================================
+-- Purpose: Recomputes student_prediction_summary from the predictions table
+-- Parameters: None
+-- Use Case: Backfilling an existing database or repairing the summary after
+--           predictions were loaded with triggers disabled
+-- ============================================================================
+
+DROP PROCEDURE IF EXISTS RebuildStudentPredictionSummary;
+
+DELIMITER //
+
+CREATE PROCEDURE RebuildStudentPredictionSummary()
+BEGIN
+    DELETE FROM student_prediction_summary;
+
+    INSERT INTO student_prediction_summary (
+        student_id,
+        latest_prediction_id,
+        latest_predicted_score,
+        latest_confidence_score,
+        prediction_count,
+        predicted_score_count,
+        predicted_score_total,
+        avg_predicted_score,
+        last_prediction_date
+    )
+    SELECT
+        agg.student_id,
+        latest.prediction_id,
+        latest.predicted_score,
+        latest.confidence_score,
+        agg.prediction_count,
+        agg.predicted_score_count,
+        agg.predicted_score_total,
+        agg.predicted_score_total / NULLIF(agg.predicted_score_count, 0),
+        latest.prediction_date
+    FROM (
+        SELECT
+            student_id,
+            COUNT(*) AS prediction_count,
+            COUNT(predicted_score) AS predicted_score_count,
+            COALESCE(SUM(predicted_score), 0) AS predicted_score_total
+        FROM predictions
+        GROUP BY student_id
+    ) agg
+    JOIN predictions latest ON latest.prediction_id = (
+        SELECT p.prediction_id
+        FROM predictions p
+        WHERE p.student_id = agg.student_id
+        ORDER BY p.prediction_date DESC, p.prediction_id DESC
+        LIMIT 1
+    );
+
+    SELECT COUNT(*) AS students_summarized FROM student_prediction_summary;
+END //
+
+DELIMITER ;
+
+
 -- ============================================================================
 -- TRIGGER 1: audit_academic_records_update
 -- ============================================================================
@@ -175,36 +237,40 @@ CREATE TRIGGER audit_academic_records_update
 AFTER UPDATE ON academic_records
 FOR EACH ROW
 BEGIN
-    INSERT INTO audit_log (
-        table_name,
-        operation,
-        record_id,
-        old_values,
-        new_values,
-        changed_by,
-        change_timestamp
-    )
-    VALUES (
-        'academic_records',
-        'UPDATE',
-        NEW.record_id,
-        JSON_OBJECT(
-            'hours_studied', OLD.hours_studied,
-            'attendance', OLD.attendance,
-            'previous_scores', OLD.previous_scores,
-            'tutoring_sessions', OLD.tutoring_sessions,
-            'exam_score', OLD.exam_score
-        ),
-        JSON_OBJECT(
-            'hours_studied', NEW.hours_studied,
-            'attendance', NEW.attendance,
-            'previous_scores', NEW.previous_scores,
-            'tutoring_sessions', NEW.tutoring_sessions,
-            'exam_score', NEW.exam_score
-        ),
-        COALESCE(USER(), 'system'),
-        CURRENT_TIMESTAMP
-    );
+    -- Skipped when the session has moved auditing to the application
+    -- (SET @audit_triggers_disabled = 1, see src/database/audit_logger.py)
+    IF COALESCE(@audit_triggers_disabled, 0) = 0 THEN
+        INSERT INTO audit_log (
+            table_name,
+            operation,
+            record_id,
+            old_values,
+            new_values,
+            changed_by,
+            change_timestamp
+        )
+        VALUES (
+            'academic_records',
+            'UPDATE',
+            NEW.record_id,
+            JSON_OBJECT(
+                'hours_studied', OLD.hours_studied,
+                'attendance', OLD.attendance,
+                'previous_scores', OLD.previous_scores,
+                'tutoring_sessions', OLD.tutoring_sessions,
+                'exam_score', OLD.exam_score
+            ),
+            JSON_OBJECT(
+                'hours_studied', NEW.hours_studied,
+                'attendance', NEW.attendance,
+                'previous_scores', NEW.previous_scores,
+                'tutoring_sessions', NEW.tutoring_sessions,
+                'exam_score', NEW.exam_score
+            ),
+            COALESCE(USER(), 'system'),
+            CURRENT_TIMESTAMP
+        );
+    END IF;
 END //
 
 DELIMITER ;
@@ -216,6 +282,8 @@ DELIMITER ;
 -- Purpose: Logs all new predictions to the audit_log table
 -- Fires: AFTER INSERT on predictions table
 -- Use Case: Track ML model predictions for analysis and compliance
+-- Note: Bulk jobs may disable this trigger for their session and write the
+--       same rows asynchronously (AUDIT_MODE=async)
 -- ============================================================================
 
 DROP TRIGGER IF EXISTS audit_predictions_insert;
@@ -225,6 +293,223 @@ DELIMITER //
 CREATE TRIGGER audit_predictions_insert
 AFTER INSERT ON predictions
 FOR EACH ROW
+BEGIN
+    -- Skipped when the session has moved auditing to the application
+    -- (SET @audit_triggers_disabled = 1, see src/database/audit_logger.py)
+    IF COALESCE(@audit_triggers_disabled, 0) = 0 THEN
+        INSERT INTO audit_log (
+            table_name,
+            operation,
+            record_id,
+            old_values,
+            new_values,
+            changed_by,
+            change_timestamp
+        )
+        VALUES (
+            'predictions',
+            'INSERT',
+            NEW.prediction_id,
+            NULL,
+            JSON_OBJECT(
+                'student_id', NEW.student_id,
+                'predicted_score', NEW.predicted_score,
+                'actual_score', NEW.actual_score,
+                'confidence_score', NEW.confidence_score,
+                'model_version', NEW.model_version,
+                'prediction_date', NEW.prediction_date
+            ),
+            COALESCE(USER(), 'ML_MODEL'),
+            CURRENT_TIMESTAMP
+        );
+    END IF;
+END //
+
+DELIMITER ;
+
+
+-- ============================================================================
+-- TRIGGER 3: maintain_prediction_summary_insert
+-- ============================================================================
+-- Purpose: Incrementally updates student_prediction_summary for every new
+--          prediction (count, running mean, latest score and date)
+-- Fires: AFTER INSERT on predictions table
+-- Use Case: O(1) per-student prediction summaries for procedures and viewers
+-- ============================================================================
+
+DROP TRIGGER IF EXISTS maintain_prediction_summary_insert;
+
+DELIMITER //
+
+CREATE TRIGGER maintain_prediction_summary_insert
+AFTER INSERT ON predictions
+FOR EACH ROW
+BEGIN
+    -- Assignments are evaluated left to right, so the "latest" columns are
+    -- compared against last_prediction_date before it is advanced.
+    INSERT INTO student_prediction_summary (
+        student_id,
+        latest_prediction_id,
+        latest_predicted_score,
+        latest_confidence_score,
+        prediction_count,
+        predicted_score_count,
+        predicted_score_total,
+        avg_predicted_score,
+        last_prediction_date
+    )
+    VALUES (
+        NEW.student_id,
+        NEW.prediction_id,
+        NEW.predicted_score,
+        NEW.confidence_score,
+        1,
+        NEW.predicted_score IS NOT NULL,
+        COALESCE(NEW.predicted_score, 0),
+        NEW.predicted_score,
+        NEW.prediction_date
+    )
+    ON DUPLICATE KEY UPDATE
+        latest_prediction_id = IF(NEW.prediction_date >= last_prediction_date OR last_prediction_date IS NULL,
+                                  NEW.prediction_id, latest_prediction_id),
+        latest_predicted_score = IF(NEW.prediction_date >= last_prediction_date OR last_prediction_date IS NULL,
+                                    NEW.predicted_score, latest_predicted_score),
+        latest_confidence_score = IF(NEW.prediction_date >= last_prediction_date OR last_prediction_date IS NULL,
+                                     NEW.confidence_score, latest_confidence_score),
+        prediction_count = prediction_count + 1,
+        predicted_score_count = predicted_score_count + (NEW.predicted_score IS NOT NULL),
+        predicted_score_total = predicted_score_total + COALESCE(NEW.predicted_score, 0),
+        avg_predicted_score = predicted_score_total / NULLIF(predicted_score_count, 0),
+        last_prediction_date = GREATEST(COALESCE(last_prediction_date, NEW.prediction_date), NEW.prediction_date);
+END //
+
+DELIMITER ;
+
+
+-- ============================================================================
+-- TRIGGER 4: maintain_prediction_summary_delete
+-- ============================================================================
+-- Purpose: Keeps student_prediction_summary consistent when a prediction row
+--          is deleted directly (cascaded deletes from students are handled by
+--          the summary table's own foreign key)
+-- Fires: AFTER DELETE on predictions table
+-- ============================================================================
+
+DROP TRIGGER IF EXISTS maintain_prediction_summary_delete;
+
+DELIMITER //
+
+CREATE TRIGGER maintain_prediction_summary_delete
+AFTER DELETE ON predictions
+FOR EACH ROW
+BEGIN
+    DECLARE v_remaining INT DEFAULT 0;
+
+    UPDATE student_prediction_summary
+    SET prediction_count = prediction_count - 1,
+        predicted_score_count = predicted_score_count - (OLD.predicted_score IS NOT NULL),
+        predicted_score_total = predicted_score_total - COALESCE(OLD.predicted_score, 0),
+        avg_predicted_score = predicted_score_total / NULLIF(predicted_score_count, 0)
+    WHERE student_id = OLD.student_id;
+
+    SELECT prediction_count INTO v_remaining
+    FROM student_prediction_summary
+    WHERE student_id = OLD.student_id;
+
+    IF v_remaining <= 0 THEN
+        DELETE FROM student_prediction_summary WHERE student_id = OLD.student_id;
+    ELSE
+        -- Only the removed row being the latest requires a (per-student) lookup
+        UPDATE student_prediction_summary ps
+        JOIN (
+            SELECT prediction_id, predicted_score, confidence_score, prediction_date
+            FROM predictions
+            WHERE student_id = OLD.student_id
+            ORDER BY prediction_date DESC, prediction_id DESC
+            LIMIT 1
+        ) latest
+        SET ps.latest_prediction_id = latest.prediction_id,
+            ps.latest_predicted_score = latest.predicted_score,
+            ps.latest_confidence_score = latest.confidence_score,
+            ps.last_prediction_date = latest.prediction_date
+        WHERE ps.student_id = OLD.student_id
+          AND ps.latest_prediction_id = OLD.prediction_id;
+    END IF;
+END //
+
+DELIMITER ;
+
+
+-- ============================================================================
+-- TRIGGER 5: maintain_prediction_summary_update
+-- ============================================================================
+-- Purpose: Keeps student_prediction_summary consistent when a prediction's
+--          score, confidence or date is corrected in place
+-- Fires: AFTER UPDATE on predictions table
+-- Note: Moving a prediction to another student is not tracked; run
+--       RebuildStudentPredictionSummary after reassigning predictions
+-- ============================================================================
+
+DROP TRIGGER IF EXISTS maintain_prediction_summary_update;
+
+DELIMITER //
+
+CREATE TRIGGER maintain_prediction_summary_update
+AFTER UPDATE ON predictions
+FOR EACH ROW
+BEGIN
+    -- actual_score backfills leave the summary untouched
+    IF NOT (OLD.predicted_score <=> NEW.predicted_score)
+       OR NOT (OLD.confidence_score <=> NEW.confidence_score)
+       OR NOT (OLD.prediction_date <=> NEW.prediction_date) THEN
+
+        UPDATE student_prediction_summary
+        SET predicted_score_count = predicted_score_count
+                                    - (OLD.predicted_score IS NOT NULL)
+                                    + (NEW.predicted_score IS NOT NULL),
+            predicted_score_total = predicted_score_total
+                                    - COALESCE(OLD.predicted_score, 0)
+                                    + COALESCE(NEW.predicted_score, 0),
+            avg_predicted_score = predicted_score_total / NULLIF(predicted_score_count, 0)
+        WHERE student_id = NEW.student_id;
+
+        -- The edited row may have become, or stopped being, the latest one
+        UPDATE student_prediction_summary ps
+        JOIN (
+            SELECT prediction_id, predicted_score, confidence_score, prediction_date
+            FROM predictions
+            WHERE student_id = NEW.student_id
+            ORDER BY prediction_date DESC, prediction_id DESC
+            LIMIT 1
+        ) latest
+        SET ps.latest_prediction_id = latest.prediction_id,
+            ps.latest_predicted_score = latest.predicted_score,
+            ps.latest_confidence_score = latest.confidence_score,
+            ps.last_prediction_date = latest.prediction_date
+        WHERE ps.student_id = NEW.student_id;
+    END IF;
+END //
+
+DELIMITER ;
+
+
+-- ============================================================================
+-- TRIGGER 6: audit_students_delete
+-- ============================================================================
+-- Purpose: Records deleted students in audit_log. Their rows cascade out of
+--          every other table, so this is the only trace incremental
+--          MySQL -> MongoDB syncs (src/database/mongo_sync.py) can follow.
+-- Fires: AFTER DELETE on students
+-- Note: Not gated on @audit_triggers_disabled; the sync depends on it
+-- ============================================================================
+
+DROP TRIGGER IF EXISTS audit_students_delete;
+
+DELIMITER //
+
+CREATE TRIGGER audit_students_delete
+AFTER DELETE ON students
+FOR EACH ROW
 BEGIN
     INSERT INTO audit_log (
         table_name,
@@ -236,18 +521,16 @@ BEGIN
         change_timestamp
     )
     VALUES (
-        'predictions',
-        'INSERT',
-        NEW.prediction_id,
-        NULL,
+        'students',
+        'DELETE',
+        OLD.student_id,
         JSON_OBJECT(
-            'student_id', NEW.student_id,
-            'predicted_score', NEW.predicted_score,
-            'actual_score', NEW.actual_score,
-            'confidence_score', NEW.confidence_score,
-            'prediction_date', NEW.prediction_date
+            'gender', OLD.gender,
+            'learning_disabilities', OLD.learning_disabilities,
+            'distance_from_home', OLD.distance_from_home
         ),
-        COALESCE(USER(), 'ML_MODEL'),
+        NULL,
+        COALESCE(USER(), 'system'),
         CURRENT_TIMESTAMP
     );
 END //
@@ -288,6 +571,9 @@ WHERE TRIGGER_SCHEMA = 'student_performance_db';
 -- Example 1: Call GetStudentPerformanceSummary
 -- CALL GetStudentPerformanceSummary(1);
 
+-- Example 1b: Backfill the prediction summary on an existing database
+-- CALL RebuildStudentPredictionSummary();
+
 -- Example 2: Insert a complete student record
 -- CALL InsertCompleteStudentRecord(
 --     'Male', 'No', 'Near',                           -- Student info
@@ -0,0 +1,49 @@
+"""
+Sync complete student records from MySQL into MongoDB
+
+Usage:
+    python sync_mongo.py            # incremental from the last watermark (full on first run)
+    python sync_mongo.py --full     # rewrite every document and prune deleted students
+    python sync_mongo.py --watch 60 # incremental sync every 60 seconds
+"""
+import sys
+import os
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'mongodb'))
+
+from database.mysql_manager import MySQLDatabaseManager
+from database.mongo_sync import MongoCompleteStudentSync
+from src.config import COMPLETE_COLLECTION_NAME
+from src.mongodb_client import get_db, close_client
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Denormalize MySQL students into MongoDB documents")
+    parser.add_argument('--full', action='store_true', help="Ignore the watermark and resync everything")
+    parser.add_argument('--batch-size', type=int, default=500, help="Students per MySQL query / bulk write")
+    parser.add_argument('--watch', type=int, metavar='SECONDS', help="Keep syncing at this interval")
+    args = parser.parse_args(argv)
+
+    db_manager = MySQLDatabaseManager()
+    try:
+        sync = MongoCompleteStudentSync(
+            db_manager,
+            get_db(),
+            collection_name=COMPLETE_COLLECTION_NAME,
+            batch_size=args.batch_size
+        )
+        sync.run(full=args.full)
+        while args.watch:
+            time.sleep(args.watch)
+            sync.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        close_client()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+# mongodb/src is imported as the `src` package, as with `python -m src.x` from mongodb/
+sys.path.insert(0, os.path.join(ROOT, 'mongodb'))
+
+# app.database.connection builds its engine at import time; tests use their
+# own in-memory SQLite sessions and never need a MySQL server
+os.environ['DB_ENGINE'] = 'sqlite'
+os.environ['SQLITE_PATH'] = ':memory:'
+
+# mongodb/ package tests run against an in-process mongomock client
+os.environ['MONGO_BACKEND'] = 'mongomock'
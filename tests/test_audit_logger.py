@@ -0,0 +1,72 @@
+import os
+import threading
+
+import pytest
+
+from database.audit_logger import AsyncAuditLogger, commit_and_log
+from database.sqlite_manager import SQLiteDatabaseManager
+
+from conftest import ROOT
+
+
+class FlakyDatabaseManager(SQLiteDatabaseManager):
+    """Fails the next `failures` connections with a non-mysql error"""
+
+    failures = 0
+
+    def get_connection(self, include_db=True):
+        if self.failures:
+            self.failures -= 1
+            raise TypeError("unexpected driver failure")
+        return super().get_connection(include_db)
+
+
+@pytest.fixture
+def db_manager(tmp_path, monkeypatch):
+    monkeypatch.setenv('SQLITE_PATH', str(tmp_path / 'audit.db'))
+    manager = FlakyDatabaseManager(config_path=str(tmp_path / 'missing.env'))
+    manager.execute_schema(os.path.join(ROOT, 'schema_sqlite.sql'))
+    manager.failures = 1
+    return manager
+
+
+def _flush(logger, timeout=5):
+    flusher = threading.Thread(target=logger.flush, daemon=True)
+    flusher.start()
+    flusher.join(timeout)
+    return not flusher.is_alive()
+
+
+def test_writer_survives_unexpected_errors(db_manager):
+    logger = AsyncAuditLogger(db_manager, flush_interval=0.01)
+    try:
+        logger.log('predictions', 'INSERT', 1, new_values={'predicted_score': 70})
+        assert _flush(logger), "flush() hung after the writer hit an error"
+        assert logger.entries_failed == 1
+
+        logger.log('predictions', 'INSERT', 2, new_values={'predicted_score': 71})
+        assert _flush(logger)
+        assert logger.entries_written == 1
+    finally:
+        logger.close()
+
+
+class RecordingConnection:
+    def __init__(self, events):
+        self.events = events
+
+    def commit(self):
+        self.events.append('commit')
+
+
+def test_commit_and_log_queues_entries_after_the_commit(db_manager):
+    db_manager.failures = 0
+    events = []
+    entries = [{'table_name': 'predictions', 'operation': 'INSERT', 'record_id': 1}]
+    logger = AsyncAuditLogger(db_manager, flush_interval=0.01)
+    logger.log_many = lambda queued: events.append(('log', list(queued)))
+
+    commit_and_log(RecordingConnection(events), logger, entries)
+
+    assert events == ['commit', ('log', [{'table_name': 'predictions', 'operation': 'INSERT', 'record_id': 1}])]
+    assert entries == []
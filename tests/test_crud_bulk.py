@@ -0,0 +1,57 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.api import crud
+from app.models.database_models import Base, Student, AcademicRecord, EnvironmentalFactors
+from app.models.schemas import (
+    AcademicRecordBase, CompleteStudentCreate, EnvironmentalFactorsBase, StudentCreate
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def _record(gender, exam_score):
+    return CompleteStudentCreate(
+        student=StudentCreate(gender=gender, learning_disabilities='No', distance_from_home='Near'),
+        academic_record=AcademicRecordBase(
+            hours_studied=20, attendance=90, previous_scores=75, tutoring_sessions=1, exam_score=exam_score
+        ),
+        environmental_factors=EnvironmentalFactorsBase(
+            parental_involvement='High', access_to_resources='Medium', extracurricular_activities='Yes',
+            sleep_hours=7, motivation_level='High', internet_access='Yes', family_income='Medium',
+            teacher_quality='High', school_type='Public', peer_influence='Positive',
+            physical_activity=3, parental_education_level='College'
+        )
+    )
+
+
+def test_bulk_create_sends_one_insert_per_table(engine):
+    statements = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+    db = sessionmaker(bind=engine)()
+    db.add(Student(gender='Male', learning_disabilities='No', distance_from_home='Far'))
+    db.commit()
+    statements.clear()
+
+    records = [_record('Female' if i % 2 else 'Male', 60 + i) for i in range(5)]
+    student_ids = crud.create_complete_students_bulk(db, records)
+
+    inserts = [s.split('(')[0].split()[-1] for s in statements if s.lstrip().upper().startswith('INSERT')]
+    assert inserts == ['students', 'academic_records', 'environmental_factors']
+    assert student_ids == [2, 3, 4, 5, 6]
+    rows = db.query(Student.student_id, Student.gender, AcademicRecord.exam_score).join(
+        AcademicRecord, AcademicRecord.student_id == Student.student_id
+    ).order_by(Student.student_id).all()
+    assert [tuple(row) for row in rows] == [
+        (2, 'Male', 60), (3, 'Female', 61), (4, 'Male', 62), (5, 'Female', 63), (6, 'Male', 64)
+    ]
+    assert db.query(EnvironmentalFactors).count() == 5
+    db.close()
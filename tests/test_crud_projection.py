@@ -0,0 +1,41 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.api import crud
+from app.models.database_models import Base, Student, AcademicRecord, EnvironmentalFactors
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    student = Student(gender='Female', learning_disabilities='No', distance_from_home='Near')
+    student.academic_records.append(AcademicRecord(
+        hours_studied=20, attendance=90, previous_scores=75, tutoring_sessions=1, exam_score=70
+    ))
+    student.environmental_factors.append(EnvironmentalFactors(sleep_hours=7, physical_activity=3))
+    session.add(student)
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def test_get_students_projection_keeps_student_id(db):
+    rows = crud.get_students(db, fields=['gender'])
+    assert rows == [{'student_id': 1, 'gender': 'Female'}]
+
+
+def test_complete_student_projection_keeps_keys(db):
+    result = crud.get_complete_student_fields(db, 1, ['exam_score'])
+    assert result['student'] == {'student_id': 1}
+    assert result['academic_record'] == {'record_id': 1, 'exam_score': 70}
+    assert 'environmental_factors' not in result
+
+
+def test_projection_rejects_unknown_fields(db):
+    with pytest.raises(crud.HTTPException) as excinfo:
+        crud.get_students(db, fields=['shoe_size'])
+    assert excinfo.value.status_code == 400
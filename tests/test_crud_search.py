@@ -0,0 +1,37 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.api import crud
+from app.models.database_models import Base, Student, AcademicRecord, EnvironmentalFactors
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    for exam_score in (70, 80):
+        student = Student(gender='Female', learning_disabilities='No', distance_from_home='Near')
+        student.academic_records.append(AcademicRecord(attendance=90, exam_score=exam_score))
+        student.environmental_factors.append(EnvironmentalFactors(sleep_hours=7))
+        session.add(student)
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.mark.parametrize("sort", ["student_id", "exam_score"])
+def test_exactly_full_last_page_has_no_next_cursor(db, sort):
+    first = crud.search_students(db, sort=sort, limit=1)
+    assert len(first["items"]) == 1
+    assert first["next_cursor"] is not None
+
+    last = crud.search_students(db, sort=sort, cursor=first["next_cursor"], limit=1)
+    assert [row["student_id"] for row in last["items"]] == [2]
+    assert last["next_cursor"] is None
+
+
+def test_single_full_page_has_no_next_cursor(db):
+    assert crud.search_students(db, limit=2)["next_cursor"] is None
@@ -0,0 +1,58 @@
+from datetime import date
+
+import pytest
+
+pytest.importorskip('tabulate')
+
+import manage_audit_log
+from database.audit_partitions import AuditLogPartitionManager
+
+
+class RecordingPartitionManager:
+    """Stands in for AuditLogPartitionManager and records the actions run"""
+
+    def __init__(self, db_manager):
+        self.calls = []
+        RecordingPartitionManager.last = self
+
+    def run(self, action, **kwargs):
+        self.calls.append((action, kwargs))
+        return []
+
+
+class NoDDLConnection:
+    def cursor(self, *args, **kwargs):
+        raise AssertionError("dry run must not issue statements")
+
+
+@pytest.fixture
+def recording_manager(monkeypatch):
+    monkeypatch.setattr(manage_audit_log, 'MySQLDatabaseManager', lambda: None)
+    monkeypatch.setattr(manage_audit_log, 'AuditLogPartitionManager', RecordingPartitionManager)
+
+
+def test_retain_dry_run_passes_dry_run_to_every_action(recording_manager):
+    manage_audit_log.main(['retain', '--keep-months', '3', '--dry-run'])
+
+    assert RecordingPartitionManager.last.calls == [
+        ('ensure_partitions', {'dry_run': True}),
+        ('apply_retention', {'keep_months': 3, 'archive_dir': None, 'dry_run': True}),
+    ]
+
+
+def test_retain_without_dry_run_creates_partitions(recording_manager):
+    manage_audit_log.main(['retain'])
+
+    assert RecordingPartitionManager.last.calls[0] == ('ensure_partitions', {'dry_run': False})
+
+
+def test_ensure_partitions_dry_run_reports_without_altering(monkeypatch):
+    manager = AuditLogPartitionManager(db_manager=None)
+    manager.connection = NoDDLConnection()
+    monkeypatch.setattr(manager, 'list_partitions', lambda: [
+        {'name': 'p_future', 'upper_bound': None, 'rows': 0}
+    ])
+
+    created = manager.ensure_partitions(months_ahead=1, today=date(2026, 10, 19), dry_run=True)
+
+    assert created == ['p202610', 'p202611']
@@ -0,0 +1,60 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+pytest.importorskip("mongomock_motor")
+
+from src import async_aggregate, async_client, async_crud, rollups
+from src.mongodb_client import set_backend
+
+
+@pytest.fixture(autouse=True)
+def fresh_clients():
+    set_backend('mongomock')
+    async_client.close_async_client()
+    yield
+    async_client.close_async_client()
+
+
+def _mark_fresh():
+    rollups.meta_collection().insert_many([
+        {"_id": name, "refreshed_at": datetime.now(timezone.utc), "stale": False}
+        for name in rollups.ROLLUPS
+    ])
+
+
+def test_async_create_applies_insert_to_rollups():
+    _mark_fresh()
+    asyncio.run(async_crud.create_student({"gender": "male", "math_score": 67}))
+    gender = rollups.rollup_collection(rollups.GENDER_SCORES).find_one({"_id": "male"})
+    assert gender["count"] == 1
+    assert gender["math_sum"] == 67
+
+
+def test_async_update_and_delete_mark_rollups_stale():
+    async def scenario():
+        new_id = await async_crud.create_student({"gender": "female", "math_score": 80})
+        _mark_fresh()
+        await async_crud.update_one_by_id(str(new_id), {"math_score": 85})
+        stale_after_update = not rollups.is_fresh(rollups.GENDER_SCORES)
+        rollups.meta_collection().update_many({}, {"$set": {"stale": False}})
+        await async_crud.delete_one_by_id(str(new_id))
+        return stale_after_update, not rollups.is_fresh(rollups.GENDER_SCORES)
+
+    assert asyncio.run(scenario()) == (True, True)
+
+
+def test_async_readers_use_fresh_rollups():
+    async def scenario():
+        await async_crud.create_student({"gender": "male", "math_score": 40})
+        live = await async_aggregate.avg_scores_by_gender()
+        _mark_fresh()
+        rollups.rollup_collection(rollups.GENDER_SCORES).insert_one(
+            {"_id": "male", "count": 2, "math_sum": 150, "math_n": 2}
+        )
+        return live, await async_aggregate.avg_scores_by_gender()
+
+    live, from_rollup = asyncio.run(scenario())
+    assert live[0]["avg_math"] == 40
+    assert from_rollup[0]["avg_math"] == 75
@@ -0,0 +1,11 @@
+from src import benchmark
+from src.mongodb_client import get_collection
+
+
+def test_benchmark_runs_on_mongomock(tmp_path):
+    csv_path = tmp_path / "students.csv"
+    csv_path.write_text("Hours_Studied,Gender,Exam_Score\n23,Male,67\n19,Female,61\n")
+
+    benchmark.run("mongomock", docs=50, repeat=1, csv_path=str(csv_path))
+
+    assert get_collection().count_documents({}) == 50
@@ -0,0 +1,24 @@
+from src import create_indexes, load_data
+from src.aggregate import avg_scores_by_gender_pipeline
+
+
+def _spec(name):
+    return next(spec for spec in create_indexes.INDEX_SPECS if spec["name"] == name)
+
+
+def test_source_row_spec_matches_loader():
+    spec = _spec(load_data.SOURCE_ROW_INDEX)
+    assert spec["unique"]
+    assert spec["partialFilterExpression"] == load_data.SOURCE_ROW_PARTIAL_FILTER
+
+
+def test_avg_scores_by_gender_sorts_on_index_prefix():
+    keys = _spec("idx_gender_scores")["keys"]
+    assert avg_scores_by_gender_pipeline()[0] == {"$sort": {keys[0][0]: 1}}
+
+
+def test_source_row_index_model_is_partial():
+    # Checked on the IndexModel document: mongomock drops partialFilterExpression
+    # when creating indexes from IndexModels
+    model = next(m.document for m in create_indexes.index_models() if m.document["name"] == load_data.SOURCE_ROW_INDEX)
+    assert model["partialFilterExpression"] == load_data.SOURCE_ROW_PARTIAL_FILTER
@@ -0,0 +1,52 @@
+import pytest
+
+from src import crud, load_data
+from src.mongodb_client import get_collection, set_backend
+
+
+CSV = """Hours_Studied,Attendance,Gender,Exam_Score
+23,84,Male,67
+19,64,Female,61
+24,98,Male,74
+"""
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "students.csv"
+    path.write_text(CSV)
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def fresh_client():
+    # A new mongomock client per test, so every test starts with an empty database
+    set_backend('mongomock')
+    yield
+
+
+def test_inserts_without_source_row_after_load(csv_path):
+    totals = load_data.load_csv(csv_path, workers=1)
+    assert totals['inserted'] == 3
+
+    crud.create_student({'gender': 'male', 'math_score': 70})
+    crud.create_student({'gender': 'female', 'math_score': 80})
+    assert get_collection().count_documents({}) == 5
+
+
+def test_reload_upserts_on_source_row(csv_path):
+    load_data.load_csv(csv_path, workers=1)
+    totals = load_data.load_csv(csv_path, workers=1)
+    assert totals == {'inserted': 0, 'skipped': 3, 'batches': 1}
+
+
+def test_replaces_non_partial_source_row_index(csv_path):
+    col = get_collection()
+    col.create_index('source_row', unique=True, name=load_data.SOURCE_ROW_INDEX)
+    col.insert_one({'gender': 'male'})
+
+    load_data.load_csv(csv_path, workers=1)
+    col.insert_one({'gender': 'female'})
+
+    index = col.index_information()[load_data.SOURCE_ROW_INDEX]
+    assert index['partialFilterExpression'] == load_data.SOURCE_ROW_PARTIAL_FILTER
@@ -0,0 +1,42 @@
+import mongomock
+import pytest
+
+from src import rollups
+from src.mongodb_client import get_collection, set_backend
+
+
+@pytest.fixture(autouse=True)
+def fresh_client(monkeypatch):
+    set_backend('mongomock')
+
+    # mongomock has no $merge: run the rest of the pipeline, then upsert by _id
+    aggregate = mongomock.collection.Collection.aggregate
+
+    def aggregate_with_merge(self, pipeline, *args, **kwargs):
+        if pipeline and "$merge" in pipeline[-1]:
+            target = self.database[pipeline[-1]["$merge"]["into"]]
+            for doc in aggregate(self, pipeline[:-1], *args, **kwargs):
+                target.replace_one({"_id": doc["_id"]}, doc, upsert=True)
+            return iter([])
+        return aggregate(self, pipeline, *args, **kwargs)
+
+    monkeypatch.setattr(mongomock.collection.Collection, "aggregate", aggregate_with_merge)
+    yield
+
+
+def test_refresh_drops_rows_upserted_by_apply_insert():
+    get_collection().insert_one({"_id": 1, "gender": "male", "race": "group A", "math_score": 60})
+    rollups.refresh_all()
+
+    doc = {"_id": 2, "gender": "female", "race": "group B", "math_score": 95}
+    get_collection().insert_one(doc)
+    rollups.apply_insert(doc)
+    assert rollups.rollup_collection(rollups.GENDER_SCORES).find_one({"_id": "female"})
+
+    get_collection().delete_one({"_id": 2})
+    rollups.mark_stale()
+    rollups.refresh_all()
+
+    assert [d["_id"] for d in rollups.rollup_collection(rollups.GENDER_SCORES).find()] == ["male"]
+    assert [d["_id"] for d in rollups.rollup_collection(rollups.SCORE_BUCKETS).find()] == [60]
+    assert [d["_id"] for d in rollups.rollup_collection(rollups.TOP_MATH).find()] == [1]
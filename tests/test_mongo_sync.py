@@ -0,0 +1,67 @@
+import os
+
+import pytest
+
+from database.mongo_sync import MongoCompleteStudentSync
+from database.sqlite_manager import SQLiteDatabaseManager
+from src.mongodb_client import get_db, set_backend
+
+from conftest import ROOT
+
+
+@pytest.fixture
+def db_manager(tmp_path, monkeypatch):
+    monkeypatch.setenv('SQLITE_PATH', str(tmp_path / 'students.db'))
+    manager = SQLiteDatabaseManager(config_path=str(tmp_path / 'missing.env'))
+    manager.execute_schema(os.path.join(ROOT, 'schema_sqlite.sql'))
+    assert manager.execute_procedures_and_triggers(os.path.join(ROOT, 'sqlite_triggers.sql'))
+
+    connection = manager.get_connection()
+    cursor = connection.cursor()
+    for gender, sleep_hours in (('Male', 7), ('Female', 8)):
+        cursor.execute("INSERT INTO students (gender) VALUES (%s)", (gender,))
+        cursor.execute(
+            "INSERT INTO environmental_factors (student_id, sleep_hours) VALUES (%s, %s)",
+            (cursor.lastrowid, sleep_hours)
+        )
+    # Seed rows predate the first sync, so only later changes reach the watermark
+    for table in ('students', 'environmental_factors'):
+        cursor.execute(f"UPDATE {table} SET created_at = %s, updated_at = %s", ('2000-01-01 00:00:00',) * 2)
+    connection.commit()
+    connection.close()
+    return manager
+
+
+@pytest.fixture
+def sync(db_manager):
+    set_backend('mongomock')
+    return MongoCompleteStudentSync(db_manager, get_db(), collection_name='complete_students')
+
+
+def _execute(db_manager, query, params):
+    connection = db_manager.get_connection()
+    cursor = connection.cursor()
+    cursor.execute(query, params)
+    connection.commit()
+    connection.close()
+
+
+def test_incremental_sync_picks_up_environmental_updates(db_manager, sync):
+    sync.run()
+    _execute(db_manager, "UPDATE environmental_factors SET sleep_hours = %s WHERE student_id = %s", (10, 1))
+
+    result = sync.run()
+
+    assert result['upserted'] == 1
+    assert sync.collection.find_one({'_id': 1})['environmental_factors']['sleep_hours'] == 10
+
+
+def test_incremental_sync_removes_deleted_students(db_manager, sync):
+    sync.run()
+    _execute(db_manager, "DELETE FROM students WHERE student_id = %s", (2,))
+
+    result = sync.run()
+
+    assert result['deleted'] == 1
+    assert sync.collection.find_one({'_id': 2}) is None
+    assert sync.collection.find_one({'_id': 1}) is not None
@@ -0,0 +1,90 @@
+import os
+from datetime import datetime
+
+import pytest
+
+from database.sqlite_manager import SQLiteDatabaseManager
+
+from conftest import ROOT
+
+SUMMARY_QUERY = """
+    SELECT student_id, latest_prediction_id, latest_predicted_score, latest_confidence_score,
+           prediction_count, predicted_score_total, avg_predicted_score, last_prediction_date,
+           predicted_score_count
+    FROM student_prediction_summary
+    ORDER BY student_id
+"""
+
+
+@pytest.fixture
+def connection(tmp_path, monkeypatch):
+    monkeypatch.setenv('SQLITE_PATH', str(tmp_path / 'summary.db'))
+    manager = SQLiteDatabaseManager(config_path=str(tmp_path / 'missing.env'))
+    manager.execute_schema(os.path.join(ROOT, 'schema_sqlite.sql'))
+    assert manager.execute_procedures_and_triggers(os.path.join(ROOT, 'sqlite_triggers.sql'))
+
+    connection = manager.get_connection()
+    cursor = connection.cursor()
+    cursor.execute("INSERT INTO students (gender) VALUES (%s)", ('Female',))
+    for day, score in ((1, 60), (2, 70), (3, 80)):
+        cursor.execute(
+            "INSERT INTO predictions (student_id, predicted_score, confidence_score, prediction_date) "
+            "VALUES (%s, %s, %s, %s)",
+            (1, score, 0.9, f"2026-10-0{day} 09:00:00")
+        )
+    connection.commit()
+    yield connection
+    connection.close()
+
+
+def _summary_matches_rebuild(connection):
+    cursor = connection.cursor()
+    cursor.execute(SUMMARY_QUERY)
+    maintained = cursor.fetchall()
+    cursor.callproc('RebuildStudentPredictionSummary')
+    cursor.execute(SUMMARY_QUERY)
+    rebuilt = cursor.fetchall()
+    cursor.close()
+    assert maintained == rebuilt
+    return maintained[0]
+
+
+def test_score_update_refreshes_totals_and_latest(connection):
+    cursor = connection.cursor()
+    cursor.execute("UPDATE predictions SET predicted_score = %s WHERE prediction_id = %s", (90, 3))
+
+    summary = _summary_matches_rebuild(connection)
+    assert summary[2] == 90
+    assert summary[5] == 220
+
+
+def test_date_update_moves_the_latest_prediction(connection):
+    cursor = connection.cursor()
+    cursor.execute("UPDATE predictions SET prediction_date = %s WHERE prediction_id = %s",
+                   ('2026-10-05 09:00:00', 1))
+
+    summary = _summary_matches_rebuild(connection)
+    assert summary[1] == 1
+    assert summary[7] == datetime(2026, 10, 5, 9, 0)
+
+
+def test_null_scores_are_left_out_of_the_mean(connection):
+    cursor = connection.cursor()
+    cursor.execute(
+        "INSERT INTO predictions (student_id, predicted_score, confidence_score, prediction_date) "
+        "VALUES (%s, %s, %s, %s)",
+        (1, None, None, '2026-10-04 09:00:00')
+    )
+    cursor.execute("UPDATE predictions SET predicted_score = NULL WHERE prediction_id = %s", (1,))
+
+    summary = _summary_matches_rebuild(connection)
+    assert summary[4] == 4
+    assert summary[6] == 75
+
+    cursor.execute("SELECT AVG(predicted_score) FROM predictions WHERE student_id = %s", (1,))
+    assert cursor.fetchone()[0] == summary[6]
+
+    cursor.execute("DELETE FROM predictions WHERE prediction_id IN (%s, %s)", (2, 3))
+    summary = _summary_matches_rebuild(connection)
+    assert summary[4] == 2
+    assert summary[6] is None
@@ -0,0 +1,30 @@
+import pytest
+
+pytest.importorskip('tabulate')
+
+from view_audit_log import fetch_audit_page
+
+
+class RowsCursor:
+    """Returns up to the query's LIMIT (its last parameter) from a fixed result set"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def execute(self, query, params):
+        self.limit = params[-1]
+
+    def fetchall(self):
+        return self.rows[:self.limit]
+
+
+def test_exactly_full_last_page_has_no_next_page():
+    logs, has_more = fetch_audit_page(RowsCursor([{'log_id': 2}, {'log_id': 1}]), [], [], 2)
+    assert [log['log_id'] for log in logs] == [2, 1]
+    assert not has_more
+
+
+def test_page_with_rows_after_it_has_next_page():
+    logs, has_more = fetch_audit_page(RowsCursor([{'log_id': 3}, {'log_id': 2}, {'log_id': 1}]), [], [], 2)
+    assert [log['log_id'] for log in logs] == [3, 2]
+    assert has_more
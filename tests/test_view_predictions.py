@@ -0,0 +1,56 @@
+import os
+
+import pytest
+
+pytest.importorskip('tabulate')
+
+from database.sqlite_manager import SQLiteDatabaseManager
+from view_predictions import format_number, iter_prediction_pages
+
+from conftest import ROOT
+
+
+@pytest.fixture
+def connection(tmp_path, monkeypatch):
+    monkeypatch.setenv('SQLITE_PATH', str(tmp_path / 'predictions.db'))
+    manager = SQLiteDatabaseManager(config_path=str(tmp_path / 'missing.env'))
+    manager.execute_schema(os.path.join(ROOT, 'schema_sqlite.sql'))
+
+    connection = manager.get_connection()
+    cursor = connection.cursor()
+    cursor.execute("INSERT INTO students (gender) VALUES (%s)", ('Male',))
+    for day in (1, 2, 3):
+        cursor.execute(
+            "INSERT INTO predictions (student_id, predicted_score, confidence_score, prediction_date) "
+            "VALUES (%s, %s, %s, %s)",
+            (1, 70 + day, 0.9, f"2026-10-0{day} 09:00:00")
+        )
+    connection.commit()
+    yield connection
+    connection.close()
+
+
+def _pages(connection, page_size, after=None, all_pages=False):
+    return [
+        ([row['prediction_id'] for row in page], has_more)
+        for page, has_more in iter_prediction_pages(connection, [], [], page_size, after, all_pages)
+    ]
+
+
+def test_last_page_resumed_from_cursor_has_no_next_page(connection):
+    assert _pages(connection, 2) == [([3, 2], True)]
+    assert _pages(connection, 2, after=('2026-10-02 09:00:00', 2)) == [([1], False)]
+
+
+def test_exactly_full_last_page_has_no_next_page(connection):
+    assert _pages(connection, 3) == [([3, 2, 1], False)]
+    assert _pages(connection, 1, after=('2026-10-02 09:00:00', 2)) == [([1], False)]
+
+
+def test_all_pages_stops_after_the_last_full_page(connection):
+    assert _pages(connection, 1, all_pages=True) == [([3], True), ([2], True), ([1], False)]
+
+
+def test_null_scores_format_as_na():
+    assert format_number(None, '.4f') == 'N/A'
+    assert format_number(0.91234, '.4f') == '0.9123'
@@ -1,91 +1,211 @@
 """
 View audit log entries
+
+Usage:
+    python view_audit_log.py [limit]
+    python view_audit_log.py --table academic_records --record-id 42
+    python view_audit_log.py --operation INSERT --since 2026-10-01 --until 2026-11-01
+    python view_audit_log.py --changed-field exam_score --cursor "2026-10-19T09:30:00,1234"
 """
 import sys
 import os
+import argparse
+from datetime import datetime
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from database.mysql_manager import MySQLDatabaseManager
 from tabulate import tabulate
-import json
 
-def view_audit_log(limit=20):
+# Fields written by the audit triggers; only these may be used as JSON paths
+AUDITED_FIELDS = {
+    'hours_studied', 'attendance', 'previous_scores', 'tutoring_sessions', 'exam_score',
+    'student_id', 'predicted_score', 'actual_score', 'confidence_score',
+    'model_version', 'prediction_date'
+}
+
+PREVIEW_LENGTH = 30
+
+
+def build_filters(table=None, operation=None, record_id=None, since=None, until=None, changed_field=None):
+    """
+    Build SQL filter conditions for the audit log
+
+    Returns:
+        Tuple of (clauses, params)
+    """
+    clauses = []
+    params = []
+
+    if table is not None:
+        clauses.append("table_name = %s")
+        params.append(table)
+    if operation is not None:
+        clauses.append("operation = %s")
+        params.append(operation)
+    if record_id is not None:
+        clauses.append("record_id = %s")
+        params.append(record_id)
+    if since is not None:
+        clauses.append("change_timestamp >= %s")
+        params.append(since)
+    if until is not None:
+        clauses.append("change_timestamp < %s")
+        params.append(until)
+    if changed_field is not None:
+        if changed_field not in AUDITED_FIELDS:
+            raise ValueError(f"Unknown audited field: {changed_field}")
+        if changed_field == 'exam_score':
+            # Typed generated columns; compared per row, like the JSON paths below
+            clauses.append("NOT (old_exam_score <=> new_exam_score)")
+        else:
+            clauses.append("NOT (JSON_EXTRACT(old_values, %s) <=> JSON_EXTRACT(new_values, %s))")
+            params.extend([f"$.{changed_field}", f"$.{changed_field}"])
+
+    return clauses, params
+
+
+def where_clause(clauses):
+    """Join filter conditions into a WHERE clause"""
+    return f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+
+def encode_cursor(log):
+    """Encode the (change_timestamp, log_id) keyset position of an entry"""
+    return f"{log['change_timestamp'].isoformat()},{log['log_id']}"
+
+
+def decode_cursor(token):
+    """Decode a cursor produced by encode_cursor"""
+    timestamp_part, id_part = token.rsplit(',', 1)
+    return datetime.fromisoformat(timestamp_part), int(id_part)
+
+
+def fetch_audit_page(cursor, clauses, params, limit, after=None):
+    """
+    Fetch one page of audit entries, newest first, seeking past `after`
+
+    Exam scores come from the generated columns and other values are
+    truncated server-side, so rows need no JSON decoding in Python. One row
+    past `limit` is fetched to tell whether another page follows.
+
+    Returns:
+        Tuple of (entries, has_more)
+    """
+    page_clauses = list(clauses)
+    page_params = list(params)
+
+    if after is not None:
+        page_clauses.append(
+            "(change_timestamp < %s OR (change_timestamp = %s AND log_id < %s))"
+        )
+        page_params.extend([after[0], after[0], after[1]])
+
+    cursor.execute(f"""
+        SELECT
+            log_id,
+            table_name,
+            operation,
+            record_id,
+            old_exam_score,
+            new_exam_score,
+            LEFT(CAST(old_values AS CHAR), {PREVIEW_LENGTH}) AS old_preview,
+            LEFT(CAST(new_values AS CHAR), {PREVIEW_LENGTH}) AS new_preview,
+            changed_by,
+            change_timestamp
+        FROM audit_log
+        {where_clause(page_clauses)}
+        ORDER BY change_timestamp DESC, log_id DESC
+        LIMIT %s
+    """, page_params + [limit + 1])
+
+    logs = cursor.fetchall()
+    return logs[:limit], len(logs) > limit
+
+
+def format_value(score, preview):
+    if score is not None:
+        return f"Score: {score}"
+    return preview or ''
+
+
+def view_audit_log(limit=20, table=None, operation=None, record_id=None, since=None,
+                   until=None, changed_field=None, cursor_token=None):
     """View audit log entries in a table"""
     db = MySQLDatabaseManager()
     conn = db.get_connection()
     cursor = conn.cursor(dictionary=True)
-    
-    cursor.execute("""
-        SELECT * FROM audit_log 
-        ORDER BY change_timestamp DESC 
-        LIMIT %s
-    """, (limit,))
-    
-    logs = cursor.fetchall()
-    
-    print(f"\nAudit Log Entries (showing last {len(logs)})")
+
+    clauses, params = build_filters(table, operation, record_id, since, until, changed_field)
+    after = decode_cursor(cursor_token) if cursor_token else None
+    logs, has_more = fetch_audit_page(cursor, clauses, params, limit, after)
+
+    print(f"\nAudit Log Entries (showing {len(logs)})")
     print("=" * 120)
-    
+
     # Summary table
     table_data = []
     for log in logs:
-        old_val = ''
-        new_val = ''
-        
-        if log['old_values']:
-            old_data = json.loads(log['old_values'])
-            if 'exam_score' in old_data:
-                old_val = f"Score: {old_data['exam_score']}"
-            else:
-                old_val = str(old_data)[:30]
-        
-        if log['new_values']:
-            new_data = json.loads(log['new_values'])
-            if 'exam_score' in new_data:
-                new_val = f"Score: {new_data['exam_score']}"
-            else:
-                new_val = str(new_data)[:30]
-        
         table_data.append([
             log['log_id'],
             log['table_name'],
             log['operation'],
             log['record_id'],
-            old_val,
-            new_val,
+            format_value(log['old_exam_score'], log['old_preview']),
+            format_value(log['new_exam_score'], log['new_preview']),
             log['changed_by'],
             log['change_timestamp'].strftime('%Y-%m-%d %H:%M')
         ])
-    
+
     headers = ['Log ID', 'Table', 'Operation', 'Record', 'Old Value', 'New Value', 'Changed By', 'Timestamp']
     print(tabulate(table_data, headers=headers, tablefmt='grid'))
-    
+
+    if has_more:
+        print(f"Next page: --cursor \"{encode_cursor(logs[-1])}\"")
+
     # Statistics
-    cursor.execute("""
-        SELECT 
+    cursor.execute(f"""
+        SELECT
             table_name,
             operation,
             COUNT(*) as count
         FROM audit_log
+        {where_clause(clauses)}
         GROUP BY table_name, operation
-    """)
-    
+    """, params)
+
     stats = cursor.fetchall()
-    
+
     print("\n\nAudit Log Statistics:")
     print("-" * 60)
-    
+
     stats_data = [[s['table_name'], s['operation'], s['count']] for s in stats]
     print(tabulate(stats_data, headers=['Table', 'Operation', 'Count'], tablefmt='grid'))
-    
+
     cursor.close()
     conn.close()
 
-if __name__ == "__main__":
-    limit = 20
-    if len(sys.argv) > 1:
-        limit = int(sys.argv[1])
-    view_audit_log(limit)
-
-
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="View audit log entries")
+    parser.add_argument('limit', nargs='?', type=int, default=20, help="Entries per page (default: 20)")
+    parser.add_argument('--table', help="Only entries for this table")
+    parser.add_argument('--operation', choices=['INSERT', 'UPDATE', 'DELETE'])
+    parser.add_argument('--record-id', type=int, help="History of one record (requires --table for an index seek)")
+    parser.add_argument('--since', type=datetime.fromisoformat, help="Entries on or after this time")
+    parser.add_argument('--until', type=datetime.fromisoformat, help="Entries before this time")
+    parser.add_argument('--changed-field', choices=sorted(AUDITED_FIELDS),
+                        help="Only entries where this field changed")
+    parser.add_argument('--cursor', help="Resume after the position printed by a previous page")
+    return parser.parse_args(argv)
 
+if __name__ == "__main__":
+    args = parse_args()
+    view_audit_log(
+        limit=args.limit,
+        table=args.table,
+        operation=args.operation,
+        record_id=args.record_id,
+        since=args.since,
+        until=args.until,
+        changed_field=args.changed_field,
+        cursor_token=args.cursor
+    )
@@ -1,21 +1,129 @@
+"""
+View predictions with filters, keyset paging and server-side accuracy stats
+
+Usage:
+    python view_predictions.py
+    python view_predictions.py --student-min 100 --student-max 200 --since 2026-01-01
+    python view_predictions.py --model-version v1.0 --page-size 50 --all
+    python view_predictions.py --cursor "2026-10-19T09:30:00,1234"
+"""
 import sys
 import os
+import math
+import argparse
+from datetime import datetime
 from tabulate import tabulate
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from database.mysql_manager import MySQLDatabaseManager
 
-def view_predictions():
-    
-    db = MySQLDatabaseManager()
-    
-    try:
-        conn = db.get_connection()
+HEADERS = [
+    'Pred ID', 'Student', 'Gender', 'Hours', 'Attend',
+    'Prev Score', 'Predicted', 'Actual', 'Confidence', 'Model', 'Date'
+]
+
+
+def build_filters(student_min=None, student_max=None, since=None, until=None, model_version=None):
+    """
+    Build the filter conditions shared by the listing and the aggregate query
+
+    Returns:
+        Tuple of (clauses, params)
+    """
+    clauses = []
+    params = []
+
+    if student_min is not None:
+        clauses.append("p.student_id >= %s")
+        params.append(student_min)
+    if student_max is not None:
+        clauses.append("p.student_id <= %s")
+        params.append(student_max)
+    if since is not None:
+        clauses.append("p.prediction_date >= %s")
+        params.append(since)
+    if until is not None:
+        clauses.append("p.prediction_date < %s")
+        params.append(until)
+    if model_version is not None:
+        clauses.append("p.model_version = %s")
+        params.append(model_version)
+
+    return clauses, params
+
+
+def where_clause(clauses):
+    """Join filter conditions into a WHERE clause"""
+    return f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+
+def encode_cursor(row):
+    """Encode the (prediction_date, prediction_id) keyset position of a row"""
+    return f"{row['prediction_date'].isoformat()},{row['prediction_id']}"
+
+
+def decode_cursor(token):
+    """Decode a cursor produced by encode_cursor"""
+    date_part, id_part = token.rsplit(',', 1)
+    return datetime.fromisoformat(date_part), int(id_part)
+
+
+def fetch_aggregates(conn, clauses, params):
+    """
+    Compute count, MAE and RMSE over the whole filtered set in SQL
+
+    Returns:
+        Dictionary with total, scored, mae and rmse
+    """
+    cursor = conn.cursor(dictionary=True)
+    cursor.execute(f"""
+    SELECT
+        COUNT(*) AS total,
+        COUNT(p.actual_score) AS scored,
+        AVG(ABS(p.predicted_score - p.actual_score)) AS mae,
+        AVG((p.predicted_score - p.actual_score) * (p.predicted_score - p.actual_score)) AS mse
+    FROM predictions p
+    {where_clause(clauses)}
+    """, params)
+    stats = cursor.fetchone()
+    cursor.close()
+
+    mse = stats['mse']
+    stats['rmse'] = math.sqrt(float(mse)) if mse is not None else None
+    return stats
+
+
+def iter_prediction_pages(conn, clauses, params, page_size=20, after=None, all_pages=False):
+    """
+    Yield (page, has_more) for predictions ordered newest first using a keyset cursor
+
+    Each page is a bounded query seeking past the last (prediction_date,
+    prediction_id) seen, so memory stays flat and later pages are as cheap as
+    the first one. One row past page_size is fetched to tell whether another
+    page follows.
+
+    Args:
+        conn: Open database connection
+        clauses: Filter conditions from build_filters()
+        params: Filter parameters from build_filters()
+        page_size: Rows per page
+        after: Optional (prediction_date, prediction_id) to resume after
+        all_pages: Keep paging until the filtered set is exhausted
+    """
+    while True:
+        page_clauses = list(clauses)
+        page_params = list(params)
+
+        if after is not None:
+            page_clauses.append(
+                "(p.prediction_date < %s OR (p.prediction_date = %s AND p.prediction_id < %s))"
+            )
+            page_params.extend([after[0], after[0], after[1]])
+
         cursor = conn.cursor(dictionary=True)
-        
-        query = """
-        SELECT 
+        cursor.execute(f"""
+        SELECT
             p.prediction_id,
             p.student_id,
             s.gender,
@@ -25,59 +133,175 @@ def view_predictions():
             p.predicted_score,
             p.actual_score,
             p.confidence_score,
+            p.model_version,
             p.prediction_date
         FROM predictions p
         JOIN students s ON p.student_id = s.student_id
         LEFT JOIN academic_records a ON p.student_id = a.student_id
-        ORDER BY p.prediction_date DESC
-        LIMIT 20
-        """
-        
-        cursor.execute(query)
+        {where_clause(page_clauses)}
+        ORDER BY p.prediction_date DESC, p.prediction_id DESC
+        LIMIT %s
+        """, page_params + [page_size + 1])
+
+        page = cursor.fetchall()
+        cursor.close()
+
+        if not page:
+            return
+
+        has_more = len(page) > page_size
+        page = page[:page_size]
+        yield page, has_more
+
+        if not all_pages or not has_more:
+            return
+        after = (page[-1]['prediction_date'], page[-1]['prediction_id'])
+
+
+def format_number(value, spec):
+    """Format a nullable numeric column, showing NULL as N/A"""
+    return format(value, spec) if value is not None else 'N/A'
+
+
+def format_row(row):
+    """Format a prediction row for display"""
+    return [
+        row['prediction_id'],
+        row['student_id'],
+        row['gender'],
+        row['hours_studied'],
+        f"{row['attendance']}%",
+        row['previous_scores'],
+        format_number(row['predicted_score'], '.2f'),
+        row['actual_score'] if row['actual_score'] is not None else 'N/A',
+        format_number(row['confidence_score'], '.4f'),
+        row['model_version'],
+        row['prediction_date'].strftime('%Y-%m-%d %H:%M')
+    ]
+
+
+def view_predictions(student_min=None, student_max=None, since=None, until=None,
+                     model_version=None, page_size=20, cursor_token=None, all_pages=False):
+
+    db = MySQLDatabaseManager()
+
+    try:
+        conn = db.get_connection()
+        clauses, params = build_filters(student_min, student_max, since, until, model_version)
+
+        stats = fetch_aggregates(conn, clauses, params)
+
+        if not stats['total']:
+            print("\nNo predictions found in database")
+            conn.close()
+            return
+
+        print(f"\nTotal Predictions: {stats['total']:,}")
+        print("=" * 120)
+
+        after = decode_cursor(cursor_token) if cursor_token else None
+        shown = 0
+        last_row = None
+        has_more = False
+
+        for page, has_more in iter_prediction_pages(conn, clauses, params, page_size, after, all_pages):
+            print(tabulate([format_row(row) for row in page], headers=HEADERS, tablefmt='grid'))
+            shown += len(page)
+            last_row = page[-1]
+
+        print(f"\nShowing {shown:,} of {stats['total']:,} predictions")
+        if has_more:
+            print(f"Next page: --cursor \"{encode_cursor(last_row)}\"")
+
+        # Accuracy over the whole filtered set, not just the rows displayed
+        if stats['scored']:
+            print(f"\nPredictions with actual scores: {stats['scored']:,}")
+            print(f"Mean Absolute Error (MAE): {stats['mae']:.2f} points")
+            print(f"Root Mean Squared Error (RMSE): {stats['rmse']:.2f} points")
+
+        conn.close()
+
+    except Exception as e:
+        print(f"Error viewing predictions: {e}")
+
+def view_prediction_summary(limit=20):
+    """Show the latest prediction per student from student_prediction_summary"""
+    db = MySQLDatabaseManager()
+
+    try:
+        conn = db.get_connection()
+        cursor = conn.cursor(dictionary=True)
+
+        # Summary rows are maintained by triggers, so this reads one row per
+        # student instead of aggregating the full predictions history
+        cursor.execute("""
+        SELECT
+            student_id,
+            latest_predicted_score,
+            latest_confidence_score,
+            prediction_count,
+            avg_predicted_score,
+            last_prediction_date
+        FROM student_prediction_summary
+        ORDER BY last_prediction_date DESC
+        LIMIT %s
+        """, (limit,))
         results = cursor.fetchall()
-        
+
         if not results:
-            print("\nNo predictions found in database")
+            print("\nNo prediction summaries found in database")
             return
-        
-        print(f"\nTotal Predictions: {len(results)}")
+
+        print(f"\nLatest Prediction per Student (showing {len(results)})")
         print("=" * 120)
-        
-        # Format for display
+
         table_data = []
         for row in results:
             table_data.append([
-                row['prediction_id'],
                 row['student_id'],
-                row['gender'],
-                row['hours_studied'],
-                f"{row['attendance']}%",
-                row['previous_scores'],
-                f"{row['predicted_score']:.2f}",
-                row['actual_score'] if row['actual_score'] else 'N/A',
-                f"{row['confidence_score']:.4f}",
-                row['prediction_date'].strftime('%Y-%m-%d %H:%M')
+                format_number(row['latest_predicted_score'], '.2f'),
+                format_number(row['latest_confidence_score'], '.4f'),
+                row['prediction_count'],
+                format_number(row['avg_predicted_score'], '.2f'),
+                row['last_prediction_date'].strftime('%Y-%m-%d %H:%M')
             ])
-        
-        headers = [
-            'Pred ID', 'Student', 'Gender', 'Hours', 'Attend', 
-            'Prev Score', 'Predicted', 'Actual', 'Confidence', 'Date'
-        ]
-        
+
+        headers = ['Student', 'Latest', 'Confidence', 'Predictions', 'Mean Predicted', 'Last Date']
         print(tabulate(table_data, headers=headers, tablefmt='grid'))
-        
-        # Calculate accuracy if actual scores exist
-        accurate_predictions = [r for r in results if r['actual_score'] is not None]
-        if accurate_predictions:
-            errors = [abs(r['predicted_score'] - r['actual_score']) for r in accurate_predictions]
-            avg_error = sum(errors) / len(errors)
-            print(f"\nAverage Prediction Error: {avg_error:.2f} points")
-        
+
         cursor.close()
         conn.close()
-        
+
     except Exception as e:
-        print(f"Error viewing predictions: {e}")
+        print(f"Error viewing prediction summary: {e}")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="View stored predictions")
+    parser.add_argument('--student-min', type=int, help="Lowest student_id to include")
+    parser.add_argument('--student-max', type=int, help="Highest student_id to include")
+    parser.add_argument('--since', type=datetime.fromisoformat,
+                        help="Only predictions on or after this date (YYYY-MM-DD[THH:MM])")
+    parser.add_argument('--until', type=datetime.fromisoformat,
+                        help="Only predictions before this date (YYYY-MM-DD[THH:MM])")
+    parser.add_argument('--model-version', help="Only predictions from this model version")
+    parser.add_argument('--page-size', type=int, default=20, help="Rows per page (default: 20)")
+    parser.add_argument('--cursor', help="Resume after the position printed by a previous page")
+    parser.add_argument('--all', action='store_true', help="Stream every matching page")
+    parser.add_argument('--summary', type=int, default=20,
+                        help="Students to show in the latest-prediction summary (0 to skip)")
+    return parser.parse_args(argv)
 
 if __name__ == "__main__":
-    view_predictions()
+    args = parse_args()
+    view_predictions(
+        student_min=args.student_min,
+        student_max=args.student_max,
+        since=args.since,
+        until=args.until,
+        model_version=args.model_version,
+        page_size=args.page_size,
+        cursor_token=args.cursor,
+        all_pages=args.all
+    )
+    if args.summary:
+        view_prediction_summary(args.summary)